@@ -0,0 +1,343 @@
+"""쿠팡 리뷰 크롤러 오프라인 리플레이 서버 및 처리량 벤치마크
+
+실제 쿠팡 서버 대신 로컬 리플레이 서버에 크롤러를 붙여 페이지/초, 리뷰/초, 페이지당 CPU 시간을 측정한다.
+리플레이 서버는 별도 프로세스에서 실행되므로 측정되는 CPU 시간은 크롤러 프로세스 것만 포함된다.
+
+응답 녹화:
+    Coupang 인스턴스의 record_dir 을 지정하고 평소처럼 크롤링하면
+    record_dir/{상품코드}/page_0001.html 형태로 리뷰 페이지 응답이 저장된다.
+    별점 스트림(rating_shards) 페이지는 record_dir/{상품코드}/page_0001_r5.html 처럼 별점이 붙는다.
+
+리플레이:
+    --record-dir 의 녹화 응답을 그대로 돌려주고, 녹화가 없으면 합성 상품(--products, --reviews)을 만들어 응답한다.
+    별점을 지정한 요청에는 그 별점으로 녹화한 페이지를 돌려준다. 녹화된 마지막 페이지 이후는 빈 리뷰 목록을 돌려준다.
+    별점 스트림 녹화가 없는 상품이 있으면 sharded 모드는 건너뛴다.
+    --latency, --block-rate, --empty-rate 로 응답 지연과 403/보안 확인 페이지(소프트 차단) 비율을 흉내 낼 수 있다.
+
+사용 예:
+    python benchmark_crawler.py --modes sequential pipelined concurrent httpx --latency 0.2
+    python benchmark_crawler.py --record-dir data/recorded --modes pipelined
+    python benchmark_crawler.py --serve --port 8800 --latency 0.3
+"""
+import argparse
+import contextlib
+import glob
+import json
+import multiprocessing
+import os
+import random
+import re
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from benchmark_review_parser import build_sample_review_page
+from crawler_coupang_review import HTTPX_AVAILABLE, AdaptivePacer, Coupang, CrawlCheckpoint, URLManager
+
+EMPTY_REVIEW_PAGE = ('<!DOCTYPE html><html lang="ko"><body>'
+                     '<div class="sdp-review__article__no-review">등록된 상품평이 없습니다.</div></body></html>')
+BLOCK_PAGE = "<html><body><h1>Access Denied</h1></body></html>"
+# 200 응답이지만 리뷰 목록 구조가 없는 보안 확인 페이지 (빈 리뷰 목록 = 리뷰 끝과 구분됨)
+SOFT_BLOCK_PAGE = ('<!DOCTYPE html><html lang="ko"><head><title>보안 확인</title></head>'
+                   '<body><div class="captcha-challenge">보안 확인 중입니다.</div></body></html>')
+
+
+# 모드 이름 -> (크롤러 설정, 동시 작업자 수)
+BENCHMARK_MODES = {
+    "sequential": ({"prefetch_window": 1}, 1),
+    "pipelined": ({"prefetch_window": 4}, 1),
+    "concurrent": ({"prefetch_window": 1}, 4),
+    "httpx": ({"fetch_backend": "httpx"}, 1),
+    "queue": ({"prefetch_window": 1, "work_queue_pages_per_task": 5}, 4),
+    "sharded": ({"prefetch_window": 1, "rating_shards": True}, 1),
+}
+
+
+class ReplayStore:
+    """녹화된 리뷰 페이지 또는 합성 리뷰 페이지 제공"""
+
+    def __init__(self, record_dir: str = None, synthetic_products: int = 5, synthetic_reviews: int = 200,
+                 page_size: int = 10):
+        self.page_size = page_size
+        self.recorded = {}  # 상품코드 -> {(별점, 페이지): 파일 경로} (전체 스트림은 별점 "")
+        self.synthetic = {}  # 상품코드 -> 리뷰 수
+
+        if record_dir and os.path.isdir(record_dir):
+            for product_dir in sorted(glob.glob(os.path.join(record_dir, "*"))):
+                pages = {}
+                for path in glob.glob(os.path.join(product_dir, "page_*.html")):
+                    match = re.search(r"page_(\d+)(?:_r([1-5]))?\.html$", path)
+                    if match:
+                        pages[(match.group(2) or "", int(match.group(1)))] = path
+                if pages:
+                    self.recorded[os.path.basename(product_dir)] = pages
+
+        if not self.recorded:
+            for idx in range(synthetic_products):
+                self.synthetic[str(9000000000 + idx)] = synthetic_reviews
+
+    def product_codes(self) -> list:
+        return list(self.recorded) + list(self.synthetic)
+
+    def expected_pages(self, prod_code: str) -> int:
+        """리뷰가 들어 있는 페이지 수 (녹화 응답은 전체 스트림 페이지, 없으면 별점 스트림 페이지 합계)"""
+        if prod_code in self.recorded:
+            pages = self.recorded[prod_code]
+            unsharded = sum(1 for rating, _ in pages if not rating)
+            return unsharded or len(pages)
+        return -(-self.synthetic.get(prod_code, 0) // self.page_size)
+
+    def has_rating_pages(self, prod_code: str) -> bool:
+        """별점 스트림으로 응답할 수 있는지 (합성 상품이거나 별점 스트림 녹화가 있음)"""
+        if prod_code in self.recorded:
+            return any(rating for rating, _ in self.recorded[prod_code])
+        return True
+
+    def get_page(self, prod_code: str, page: int, rating: str = "") -> str:
+        """리뷰 페이지 HTML (rating을 지정하면 합성 상품은 그 별점 리뷰만, 녹화 응답은 그 별점으로 녹화한 페이지)"""
+        if prod_code in self.recorded:
+            path = self.recorded[prod_code].get((rating, page))
+            if not path:
+                return EMPTY_REVIEW_PAGE
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+
+        # 합성 리뷰의 별점은 review_id % 5 + 1 이므로 별점 스트림은 review_id를 5씩 건너뛰며 만든다
+        total_reviews = self.synthetic.get(prod_code, 0)
+        offset, step = (int(rating) - 1, 5) if rating else (0, 1)
+        review_ids = range(offset, total_reviews, step)
+        first_idx = (page - 1) * self.page_size
+        article_count = min(self.page_size, len(review_ids) - first_idx)
+        if article_count <= 0:
+            return EMPTY_REVIEW_PAGE
+        return build_sample_review_page(article_count, page, first_review_id=review_ids[first_idx],
+                                        product_name=f"리플레이 상품 {prod_code}, 1개", review_step=step)
+
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """리뷰 API(/vp/product/reviews)와 세션 예열용 페이지를 흉내 내는 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더와 본문을 따로 쓰므로 Nagle + delayed ACK로 응답이 ~40ms 밀리는 것 방지
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+
+        if server.latency > 0:
+            jitter = server.latency * server.jitter
+            time.sleep(max(0.0, random.uniform(server.latency - jitter, server.latency + jitter)))
+
+        if url.path != "/vp/product/reviews":
+            self.send_html(200, "<html><body>ok</body></html>", set_cookie=True)
+            return
+
+        if random.random() < server.block_rate:
+            self.send_html(403, BLOCK_PAGE)
+            return
+        if random.random() < server.empty_rate:
+            self.send_html(200, SOFT_BLOCK_PAGE)
+            return
+
+        query = parse_qs(url.query)
+        prod_code = query.get("productId", [""])[0]
+        try:
+            page = int(query.get("page", ["1"])[0])
+        except ValueError:
+            page = 1
+        rating = query.get("ratings", [""])[0]
+        if rating not in ("1", "2", "3", "4", "5"):
+            rating = ""
+        self.send_html(200, server.store.get_page(prod_code, page, rating))
+
+    def send_html(self, status: int, html: str, set_cookie: bool = False) -> None:
+        body = html.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if set_cookie:
+            self.send_header("Set-Cookie", "PCID=replay; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_replay_server(store: ReplayStore, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                         jitter: float = 0.3, block_rate: float = 0.0, empty_rate: float = 0.0) -> ThreadingHTTPServer:
+    """리플레이 서버 생성 (port=0 이면 빈 포트 자동 선택)"""
+    server = ThreadingHTTPServer((host, port), ReplayRequestHandler)
+    server.daemon_threads = True
+    server.store = store
+    server.latency = latency
+    server.jitter = jitter
+    server.block_rate = block_rate
+    server.empty_rate = empty_rate
+    return server
+
+
+def run_replay_server(server_kwargs: dict, store_kwargs: dict, ready_queue) -> None:
+    """별도 프로세스에서 리플레이 서버 실행 (준비되면 포트를 큐로 전달)"""
+    server = create_replay_server(ReplayStore(**store_kwargs), **server_kwargs)
+    ready_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def write_catalogue(path: str, store: ReplayStore) -> None:
+    """URLManager가 읽을 상품 목록 JSON 작성"""
+    products = [
+        {"product_url": f"https://www.coupang.com/vp/products/{code}", "product_name": f"리플레이 상품 {code}",
+         "review_count": f"{store.synthetic[code]:,}" if code in store.synthetic else ""}
+        for code in store.product_codes()
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(products, f, ensure_ascii=False)
+
+
+def run_benchmark_mode(mode: str, server_url: str, store: ReplayStore, work_dir: str, args) -> dict:
+    """모드 하나를 새 작업 디렉토리에서 실행하고 처리량 측정"""
+    settings, num_workers = BENCHMARK_MODES[mode]
+    mode_dir = os.path.join(work_dir, mode)
+    os.makedirs(mode_dir, exist_ok=True)
+    os.chdir(mode_dir)
+
+    catalogue_path = os.path.join(mode_dir, "products.json")
+    write_catalogue(catalogue_path, store)
+
+    crawler = Coupang(
+        url_manager=URLManager(catalogue_path),
+        checkpoint=CrawlCheckpoint(os.path.join(mode_dir, "checkpoint.sqlite3")),
+        use_browser=False,
+        use_html_archive=True,
+        use_review_dedup=True,
+    )
+    crawler.base_url = server_url
+    crawler.base_review_url = f"{server_url}/vp/product/reviews"
+    crawler.set_parser_backend(args.parser)
+    crawler.sink_format = "csv"
+    crawler.sink_export_xlsx = False
+    crawler.use_priority_schedule = True
+    crawler.async_max_requests_per_sec = 0
+    crawler.crawl_request_budget = args.request_budget
+    for name, value in settings.items():
+        setattr(crawler, name, value)
+
+    if not args.keep_delays:
+        for name in ("delay_min", "delay_max", "warm_up_delay_min", "warm_up_delay_max", "long_wait_min",
+                     "long_wait_max"):
+            setattr(crawler, name, 0)
+        crawler.pacer = AdaptivePacer(min_interval=0, initial_interval=0)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull):
+            if mode == "queue":
+                crawler.start_queue(num_workers=num_workers, max_requests_per_sec=0)
+            elif num_workers > 1:
+                crawler.start_concurrent(num_workers=num_workers, max_requests_per_sec=0)
+            else:
+                crawler.start()
+    wall_elapsed = time.perf_counter() - wall_start
+    cpu_elapsed = time.process_time() - cpu_start
+
+    crawler.checkpoint.close()
+    if crawler.html_archive:
+        crawler.html_archive.close()
+    pages = crawler.crawl_stats["pages"]
+    return {
+        "mode": mode,
+        "pages": pages,
+        "reviews": crawler.crawl_stats["reviews"],
+        "requests": crawler.crawl_stats["requests"],
+        "elapsed": wall_elapsed,
+        "cpu_per_page": cpu_elapsed / pages if pages else 0.0,
+    }
+
+
+def print_results(results: list, expected_pages: int) -> None:
+    print("=" * 86)
+    print(f"{'모드':<12} {'페이지':>8} {'리뷰':>8} {'요청':>8} {'시간(s)':>9} {'페이지/초':>10} "
+          f"{'리뷰/초':>10} {'CPU/페이지(ms)':>14}")
+    print("-" * 86)
+    for result in results:
+        elapsed = max(result["elapsed"], 1e-9)
+        print(f"{result['mode']:<12} {result['pages']:>8} {result['reviews']:>8} {result['requests']:>8} "
+              f"{result['elapsed']:>9.2f} {result['pages'] / elapsed:>10.2f} {result['reviews'] / elapsed:>10.2f} "
+              f"{result['cpu_per_page'] * 1000:>14.2f}")
+    print("-" * 86)
+    print(f"리뷰가 있는 페이지 수(기대값): {expected_pages}")
+    print("=" * 86)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="쿠팡 리뷰 크롤러 오프라인 처리량 벤치마크")
+    arg_parser.add_argument("--record-dir", default=None, help="녹화된 응답 디렉토리 (record_dir/{상품코드}/page_NNNN.html)")
+    arg_parser.add_argument("--products", type=int, default=5, help="녹화가 없을 때 만들 합성 상품 수")
+    arg_parser.add_argument("--reviews", type=int, default=200, help="합성 상품당 리뷰 수")
+    arg_parser.add_argument("--modes", nargs="+", default=["sequential", "pipelined", "concurrent", "httpx"],
+                            choices=list(BENCHMARK_MODES), help="측정할 실행 모드")
+    arg_parser.add_argument("--parser", default="auto", help="리뷰 파서 백엔드 (auto/selectolax/lxml/bs4)")
+    arg_parser.add_argument("--latency", type=float, default=0.05, help="리플레이 서버 응답 지연(초)")
+    arg_parser.add_argument("--jitter", type=float, default=0.3, help="응답 지연 변동 비율")
+    arg_parser.add_argument("--block-rate", type=float, default=0.0, help="403 응답 비율")
+    arg_parser.add_argument("--empty-rate", type=float, default=0.0, help="리뷰 목록 없는 보안 확인 페이지(소프트 차단) 응답 비율")
+    arg_parser.add_argument("--request-budget", type=int, default=None, help="모드별 리뷰 페이지 요청 예산 (우선순위 스케줄 확인용)")
+    arg_parser.add_argument("--keep-delays", action="store_true", help="크롤러의 대기 시간/적응형 요청 간격 설정을 그대로 사용")
+    arg_parser.add_argument("--verbose", action="store_true", help="크롤러 로그 출력")
+    arg_parser.add_argument("--serve", action="store_true", help="벤치마크 없이 리플레이 서버만 실행")
+    arg_parser.add_argument("--port", type=int, default=0, help="--serve 모드 포트")
+    args = arg_parser.parse_args()
+
+    store_kwargs = {"record_dir": os.path.abspath(args.record_dir) if args.record_dir else None, "synthetic_products": args.products,
+                    "synthetic_reviews": args.reviews}
+    server_kwargs = {"latency": args.latency, "jitter": args.jitter, "block_rate": args.block_rate,
+                     "empty_rate": args.empty_rate}
+
+    if args.serve:
+        server = create_replay_server(ReplayStore(**store_kwargs), port=args.port, **server_kwargs)
+        print(f"[INFO] 리플레이 서버 실행 중: http://127.0.0.1:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
+        return
+
+    if "httpx" in args.modes and not HTTPX_AVAILABLE:
+        print("[WARNING] httpx가 설치되어 있지 않아 httpx 모드를 건너뜁니다.")
+        args.modes = [mode for mode in args.modes if mode != "httpx"]
+
+    store = ReplayStore(**store_kwargs)
+    if "sharded" in args.modes and not all(store.has_rating_pages(code) for code in store.product_codes()):
+        print("[WARNING] 별점 스트림으로 녹화하지 않은 상품이 있어 sharded 모드를 건너뜁니다. "
+              "(rating_shards를 켜고 녹화한 응답이 필요합니다)")
+        args.modes = [mode for mode in args.modes if mode != "sharded"]
+
+    ready_queue = multiprocessing.Queue()
+    server_process = multiprocessing.Process(
+        target=run_replay_server, args=(server_kwargs, store_kwargs, ready_queue), daemon=True
+    )
+    server_process.start()
+    server_url = f"http://127.0.0.1:{ready_queue.get(timeout=30)}"
+    print(f"[INFO] 리플레이 서버: {server_url} | 상품 {len(store.product_codes())}개")
+
+    original_dir = os.getcwd()
+    results = []
+    try:
+        with tempfile.TemporaryDirectory(prefix="coupang_bench_") as work_dir:
+            for mode in args.modes:
+                print(f"[INFO] {mode} 모드 측정 중...")
+                results.append(run_benchmark_mode(mode, server_url, store, work_dir, args))
+                os.chdir(original_dir)
+    finally:
+        os.chdir(original_dir)
+        server_process.terminate()
+        server_process.join()
+
+    print_results(results, sum(store.expected_pages(code) for code in store.product_codes()))
+
+
+if __name__ == "__main__":
+    main()
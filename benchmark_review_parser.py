@@ -0,0 +1,120 @@
+"""리뷰 HTML 파서 백엔드 마이크로 벤치마크
+
+저장된 리뷰 페이지 HTML(fixture)을 각 파서 백엔드(bs4/lxml/selectolax)로 반복 파싱하여
+페이지당 파싱 시간과 BeautifulSoup 대비 속도 향상을 출력한다.
+fixture 디렉토리가 없거나 비어 있으면 실제 리뷰 페이지 구조를 흉내 낸 샘플 HTML을 생성해 사용한다.
+
+사용 예:
+    python benchmark_review_parser.py --fixtures data/html_fixtures --repeat 50
+"""
+import argparse
+import glob
+import os
+import time
+
+from crawler_coupang_review import REVIEW_PARSERS, LXML_AVAILABLE, SELECTOLAX_AVAILABLE, get_review_parser
+
+
+def build_sample_review_page(article_count: int = 10, page: int = 1, first_review_id: int = None,
+                             product_name: str = "홈플래닛 샘플 상품, 1개", review_step: int = 1) -> str:
+    """리뷰 API 응답과 같은 구조의 샘플 HTML 생성 (리뷰 ID는 first_review_id부터 review_step 간격)"""
+    if first_review_id is None:
+        first_review_id = (page - 1) * article_count
+
+    articles = []
+    for idx in range(article_count):
+        review_id = first_review_id + idx * review_step
+        images = "".join(f'<img src="https://image.example/{review_id}_{n}.jpg"/>' for n in range(review_id % 4))
+        articles.append(f"""
+<article class="sdp-review__article__list js_reviewArticleReviewList">
+  <div class="sdp-review__article__list__info">
+    <div class="sdp-review__article__list__info__profile"><img src="https://image.example/profile.png"/></div>
+    <span class="sdp-review__article__list__info__user__name js_reviewUserProfileImage">사용자{review_id}</span>
+    <div class="sdp-review__article__list__info__product-info">
+      <div class="sdp-review__article__list__info__product-info__star-gray">
+        <div class="sdp-review__article__list__info__product-info__star-orange js_reviewArticleRatingValue"
+             data-rating="{review_id % 5 + 1}"></div>
+      </div>
+      <div class="sdp-review__article__list__info__product-info__reg-date">2025.05.{review_id % 28 + 1:02d}</div>
+    </div>
+    <div class="sdp-review__article__list__info__product-info__name">{product_name}</div>
+  </div>
+  <div class="sdp-review__article__list__attachment">
+    <div class="sdp-review__article__list__attachment__list">{images}</div>
+  </div>
+  <div class="sdp-review__article__list__headline">리뷰 제목 {review_id}</div>
+  <div class="sdp-review__article__list__review js_reviewArticleContentContainer">
+    <div class="sdp-review__article__list__review__content js_reviewArticleContent">
+      배송이 빠르고 품질도 좋습니다.\n\t재구매 의사 있습니다. {'가격 대비 만족합니다. ' * (review_id % 6)}
+    </div>
+  </div>
+  <div class="sdp-review__article__list__help js_reviewArticleHelpfulContainer">
+    <span class="js_reviewArticleHelpfulCount">{review_id % 7}</span>
+  </div>
+</article>""")
+
+    return f"""<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>쿠팡 리뷰</title></head>
+<body><div class="sdp-review__article">{''.join(articles)}</div></body></html>"""
+
+
+def load_fixtures(fixture_dir: str, sample_pages: int, articles_per_page: int) -> list:
+    """fixture 디렉토리의 *.html 로드 (없으면 샘플 생성)"""
+    paths = sorted(glob.glob(os.path.join(fixture_dir, "*.html"))) if fixture_dir else []
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                pages.append(f.read())
+        print(f"[INFO] fixture {len(pages)}개 로드: {fixture_dir}")
+        return pages
+
+    print(f"[INFO] fixture가 없어 샘플 페이지 {sample_pages}개(페이지당 리뷰 {articles_per_page}개)를 생성합니다.")
+    return [build_sample_review_page(articles_per_page, page) for page in range(1, sample_pages + 1)]
+
+
+def benchmark_parser(parser, pages: list, repeat: int) -> tuple:
+    """(페이지당 평균 시간(초), 마지막 파싱 결과) 반환"""
+    results = [parser.parse(html) for html in pages]  # 워밍업 + 결과 확인용
+
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            parser.parse(html)
+    elapsed = time.perf_counter() - start_time
+    return elapsed / (repeat * len(pages)), results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="리뷰 HTML 파서 백엔드 벤치마크")
+    arg_parser.add_argument("--fixtures", default="data/html_fixtures", help="저장된 리뷰 페이지 HTML 디렉토리")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="fixture 전체 반복 파싱 횟수")
+    arg_parser.add_argument("--sample-pages", type=int, default=20, help="fixture가 없을 때 생성할 샘플 페이지 수")
+    arg_parser.add_argument("--articles", type=int, default=10, help="샘플 페이지당 리뷰 수")
+    args = arg_parser.parse_args()
+
+    pages = load_fixtures(args.fixtures, args.sample_pages, args.articles)
+    available = {"bs4": True, "lxml": LXML_AVAILABLE, "selectolax": SELECTOLAX_AVAILABLE}
+
+    print("=" * 70)
+    print(f"{'백엔드':<12} {'페이지당(ms)':>12} {'속도 향상':>10} {'결과 일치':>10}")
+    print("-" * 70)
+
+    baseline_time, baseline_results = None, None
+    for name in REVIEW_PARSERS:
+        if not available[name]:
+            print(f"{name:<12} {'미설치':>12}")
+            continue
+
+        per_page, results = benchmark_parser(get_review_parser(name), pages, args.repeat)
+        if baseline_time is None:
+            baseline_time, baseline_results = per_page, results
+
+        speedup = baseline_time / per_page if per_page > 0 else float("inf")
+        matches = "O" if results == baseline_results else "X"
+        print(f"{name:<12} {per_page * 1000:>12.3f} {speedup:>9.1f}x {matches:>10}")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,114 @@
 from bs4 import BeautifulSoup as bs
 from openpyxl import Workbook
-from fake_useragent import UserAgent
 from requests.exceptions import RequestException, Timeout, ConnectTimeout, ReadTimeout
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 import time
 import os
 import re
 import requests as rq
+from requests.adapters import HTTPAdapter
 import random
 import json
+import csv
+import threading
+import sqlite3
+import hashlib
+import asyncio
+import bisect
+import contextlib
+import gzip
+import io
+import math
+import socket
+import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    webdriver = Options = None
+    SELENIUM_AVAILABLE = False
+
+try:
+    from fake_useragent import UserAgent
+
+    FAKE_USERAGENT_AVAILABLE = True
+except ImportError:
+    UserAgent = None
+    FAKE_USERAGENT_AVAILABLE = False
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml_etree = lxml_html = None
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
 
 
 class NonWindowsUserAgent:
-    """Windows를 제외한 User-Agent 생성기 (fake_useragent 기반)"""
-
-    def __init__(self):
-        self.ua = UserAgent()
-        self.max_attempts = 20  # 최대 시도 횟수
+    """Windows를 제외한 User-Agent 생성기 (fake_useragent 기반)
+
+    v1.8: 매 호출마다 fake_useragent에서 Windows UA가 아닐 때까지 다시 뽑는 대신,
+    Windows UA를 걸러낸 UA 풀을 한 번 만들어 디스크(cache_file)에 캐시하고 풀에서 바로 고른다.
+    캐시가 cache_ttl보다 오래되면 다시 만들고, fake_useragent를 쓸 수 없으면 오래된 캐시나
+    내장 기본 UA 목록을 사용하므로 오프라인에서도 동작한다.
+    """
+
+    CACHE_FILE = "data/user_agent_pool.json"
+    CACHE_TTL = 7 * 24 * 3600  # 캐시 갱신 주기(초)
+    POOL_TYPES = ("random", "chrome", "firefox", "safari", "mobile", "desktop")
+
+    # fake_useragent도 캐시도 없을 때 사용하는 기본 UA
+    FALLBACK_POOL = {
+        "chrome": [
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+        ],
+        "firefox": [
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:125.0) Gecko/20100101 Firefox/125.0",
+            "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
+        ],
+        "safari": [
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+        ],
+    }
+
+    # 같은 캐시 파일을 쓰는 인스턴스들(작업자, ChromeDriver)이 풀을 공유
+    _shared_pools = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_file=None, cache_ttl=None):
+        self.cache_file = cache_file or self.CACHE_FILE
+        self.cache_ttl = self.CACHE_TTL if cache_ttl is None else cache_ttl
 
         # Windows 관련 키워드들
         self.windows_keywords = [
@@ -25,6 +116,8 @@ class NonWindowsUserAgent:
             'Windows 7', 'Windows 8', 'Microsoft Windows', 'win32', 'win64'
         ]
 
+        self.pool = self._load_pool()
+
     def _is_windows_ua(self, user_agent):
         """User-Agent가 Windows인지 확인"""
         if not user_agent:
@@ -33,32 +126,110 @@ class NonWindowsUserAgent:
         user_agent_lower = user_agent.lower()
         return any(keyword.lower() in user_agent_lower for keyword in self.windows_keywords)
 
-    def _get_non_windows_ua(self, ua_type='random'):
-        """Windows가 아닌 User-Agent를 가져오기"""
-        for attempt in range(self.max_attempts):
-            try:
-                if ua_type == 'chrome':
-                    user_agent = self.ua.chrome
-                elif ua_type == 'firefox':
-                    user_agent = self.ua.firefox
-                elif ua_type == 'safari':
-                    user_agent = self.ua.safari
-                else:
-                    user_agent = self.ua.random
+    @staticmethod
+    def _classify(user_agent):
+        """UA 문자열로 풀 분류 (random 외에 속하는 풀 이름 목록)"""
+        types = []
+        if "Firefox/" in user_agent or "FxiOS" in user_agent:
+            types.append("firefox")
+        elif ("Chrome/" in user_agent or "CriOS" in user_agent) and not any(
+                keyword in user_agent for keyword in ("Edg", "OPR/", "SamsungBrowser", "YaBrowser")):
+            types.append("chrome")
+        elif "Safari/" in user_agent and "Version/" in user_agent and "Chrome/" not in user_agent:
+            types.append("safari")
+
+        if any(keyword in user_agent for keyword in ("Mobile", "Android", "iPhone", "iPad")):
+            types.append("mobile")
+        elif "Macintosh" in user_agent:
+            types.append("desktop")
+        return types
+
+    def _build_pool_from(self, user_agents):
+        """UA 목록에서 Windows UA를 거르고 종류별 풀 생성"""
+        pool = {ua_type: [] for ua_type in self.POOL_TYPES}
+        for user_agent in dict.fromkeys(user_agents):
+            if self._is_windows_ua(user_agent):
+                continue
+            pool["random"].append(user_agent)
+            for ua_type in self._classify(user_agent):
+                pool[ua_type].append(user_agent)
+        return pool
+
+    def _fetch_user_agents(self):
+        """fake_useragent 데이터에서 UA 목록 수집"""
+        if not FAKE_USERAGENT_AVAILABLE:
+            raise ImportError("fake_useragent가 설치되지 않았습니다.")
+
+        ua = UserAgent()
+        entries = getattr(ua, "data_browsers", None)
+        if entries:
+            return [entry["useragent"] for entry in entries if entry.get("useragent")]
+        # 데이터 목록을 노출하지 않는 버전이면 여러 번 뽑아서 수집
+        return [ua.random for _ in range(500)]
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("user_agents", {}).get("random"):
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
 
-                if not self._is_windows_ua(user_agent):
-                    print(f"[DEBUG] User-Agent 선택 성공 (시도 {attempt + 1}회): {user_agent[:50]}...")
-                    return user_agent
-                else:
-                    print(f"[DEBUG] Windows UA 감지, 재시도 중... (시도 {attempt + 1}/{self.max_attempts})")
+    def _write_cache(self, pool):
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            if cache_dir and not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"created_at": time.time(), "user_agents": pool}, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"[WARNING] User-Agent 풀 캐시 저장 실패: {e}")
+
+    def _load_pool(self):
+        """캐시(유효기간 내) -> fake_useragent로 새로 생성 -> 오래된 캐시 -> 기본 UA 순으로 풀 준비"""
+        with self._shared_lock:
+            pool = self._shared_pools.get(self.cache_file)
+            if pool:
+                return pool
+
+            cached = self._read_cache()
+            if cached and time.time() - cached.get("created_at", 0) < self.cache_ttl:
+                pool = cached["user_agents"]
+            else:
+                try:
+                    pool = self._build_pool_from(self._fetch_user_agents())
+                    if not pool["random"]:
+                        raise ValueError("Windows가 아닌 User-Agent가 없습니다.")
+                    self._write_cache(pool)
+                    print(f"[INFO] User-Agent 풀 생성: {len(pool['random'])}개 (캐시: {self.cache_file})")
+                except Exception as e:
+                    if cached:
+                        print(f"[WARNING] User-Agent 풀 갱신 실패, 기존 캐시 사용: {e}")
+                        pool = cached["user_agents"]
+                    else:
+                        print(f"[WARNING] User-Agent 풀 생성 실패, 기본 UA 사용: {e}")
+                        pool = self._build_pool_from(
+                            user_agent for user_agents in self.FALLBACK_POOL.values() for user_agent in user_agents
+                        )
 
-            except Exception as e:
-                print(f"[WARNING] User-Agent 생성 오류 (시도 {attempt + 1}): {e}")
-                continue
+            # 비어 있는 종류는 기본 UA로 채움
+            fallback = self._build_pool_from(
+                user_agent for user_agents in self.FALLBACK_POOL.values() for user_agent in user_agents
+            )
+            for ua_type in self.POOL_TYPES:
+                if not pool.get(ua_type):
+                    pool[ua_type] = fallback[ua_type]
+
+            self._shared_pools[self.cache_file] = pool
+            return pool
 
-        # 모든 시도가 실패한 경우 안전한 Mac UA 반환
-        print(f"[WARNING] {self.max_attempts}회 시도 후에도 적절한 UA를 찾지 못했습니다. 기본 Mac UA 사용")
-        return "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    def _get_non_windows_ua(self, ua_type='random'):
+        """Windows가 아닌 User-Agent를 풀에서 선택"""
+        return random.choice(self.pool.get(ua_type) or self.pool["random"])
 
     @property
     def random(self):
@@ -82,127 +253,336 @@ class NonWindowsUserAgent:
 
     def get_mobile_ua(self):
         """모바일 전용 User-Agent 반환"""
-        for attempt in range(self.max_attempts):
-            try:
-                # 모바일 브라우저 위주로 시도
-                browser_types = ['chrome', 'safari', 'random']
-                ua_type = random.choice(browser_types)
-
-                user_agent = self._get_non_windows_ua(ua_type)
-
-                # 모바일 키워드가 있는지 확인
-                mobile_keywords = ['Mobile', 'Android', 'iPhone', 'iPad']
-                if any(keyword in user_agent for keyword in mobile_keywords):
-                    return user_agent
-
-            except Exception as e:
-                print(f"[WARNING] 모바일 UA 생성 오류: {e}")
-                continue
-
-        # 실패 시 안전한 Android UA 반환
-        return "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+        return self._get_non_windows_ua('mobile')
 
     def get_desktop_ua(self):
         """데스크톱 전용 User-Agent 반환 (Mac 위주)"""
-        for attempt in range(self.max_attempts):
-            try:
-                user_agent = self._get_non_windows_ua('random')
-
-                # 데스크톱이면서 모바일이 아닌 것
-                if 'Macintosh' in user_agent and 'Mobile' not in user_agent:
-                    return user_agent
-
-            except Exception as e:
-                print(f"[WARNING] 데스크톱 UA 생성 오류: {e}")
-                continue
-
-        # 실패 시 안전한 Mac UA 반환
-        return "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
+        return self._get_non_windows_ua('desktop')
 
 
 class ProxyRotator:
-    def __init__(self, proxy_list=None):
+    def __init__(self, proxy_list=None, pool_size=10, session_idle_timeout=300):
         """
         프록시 로테이터 초기화
         proxy_list: ['ip:port:username:password', ...] 형태의 프록시 리스트
+        pool_size: 프록시별 세션이 유지할 최대 keep-alive 연결 수
+        session_idle_timeout: 이 시간(초) 동안 쓰이지 않은 프록시 세션은 닫음
         """
         self.proxy_list = proxy_list if proxy_list else []
-        # itertools.cycle 제거 - 랜덤 선택으로 변경
+        # itertools.cycle 제거 - 랜덤 선택으로 변경 (v1.8: 지연시간/성공률 가중 선택)
         self.current_proxy = None
-        self.failed_proxies = set()
-        self.proxy_failure_count = {}  # 프록시별 실패 횟수 추적
-        self.max_failures_per_proxy = 3  # 프록시당 최대 실패 허용 횟수
+        self.failed_proxies = set()  # 회로가 열린(쿨다운 중인) 프록시
+        self.proxy_failure_count = {}  # 프록시별 연속 실패 횟수 추적
+        self.max_failures_per_proxy = 3  # 이 횟수만큼 연속 실패하면 회로 열림
+        self.lock = threading.RLock()
+
+        # v1.8: 프록시별 EWMA 통계와 서킷 브레이커 (closed -> open -> half_open -> closed)
+        # open: 쿨다운 동안 선택하지 않음 / half_open: 쿨다운이 끝나면 시험 요청 1개만 허용
+        # 시험 요청이 성공하면 closed, 실패하면 2배 긴 쿨다운으로 다시 open
+        self.ewma_alpha = 0.3  # EWMA 가중치 (클수록 최근 결과 반영이 빠름)
+        self.base_cooldown = 30.0  # 첫 쿨다운 시간(초), 반복 차단 시 2배씩 증가
+        self.max_cooldown = 1800.0  # 최대 쿨다운 시간(초)
+        self.probe_timeout = 60.0  # half_open 시험 요청 결과가 이 시간(초) 안에 없으면 다른 시험 요청 허용
+        self.proxy_stats = {proxy: self._new_stats() for proxy in self.proxy_list}
+
+        # v1.8: 프록시별 연결 풀 세션 (페이지마다 TCP/TLS 연결을 새로 맺지 않도록 재사용)
+        self.pool_size = pool_size
+        self.session_idle_timeout = session_idle_timeout
+        self.sessions = {}  # proxy(None이면 직접 연결) -> requests.Session
+        self.session_last_used = {}
+        self.session_lock = threading.Lock()
+
+    @staticmethod
+    def _new_stats():
+        return {
+            "latency": None,  # 응답 시간 EWMA (초)
+            "success_rate": 1.0,  # 성공률 EWMA
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "cooldowns": 0,  # 연속으로 쿨다운에 들어간 횟수 (성공 시 초기화)
+            "cooldown_until": 0.0,
+            "state": "closed",  # 서킷 브레이커 상태 (closed/open/half_open)
+            "probe_started": 0.0,  # half_open 시험 요청 시작 시각 (0이면 진행 중인 시험 요청 없음)
+        }
+
+    def _get_stats(self, proxy):
+        if proxy not in self.proxy_stats:
+            self.proxy_stats[proxy] = self._new_stats()
+        return self.proxy_stats[proxy]
+
+    def _release_expired_cooldowns(self):
+        """쿨다운이 끝난 프록시의 회로를 half_open으로 전환 (시험 요청 1개 허용)"""
+        now = time.time()
+        for proxy in list(self.failed_proxies):
+            stats = self._get_stats(proxy)
+            if stats["cooldown_until"] <= now:
+                self.failed_proxies.discard(proxy)
+                self.proxy_failure_count[proxy] = 0
+                stats["state"] = "half_open"
+                stats["probe_started"] = 0.0
+                print(f"[PROXY] 쿨다운 종료, 시험 요청 대기(half-open): {proxy.split(':')[0]}")
+
+    def _is_selectable(self, proxy, now):
+        """closed이거나, half_open이면서 진행 중인 시험 요청이 없는 프록시"""
+        stats = self._get_stats(proxy)
+        if stats["state"] == "closed":
+            return True
+        if stats["state"] == "half_open":
+            return not stats["probe_started"] or now - stats["probe_started"] > self.probe_timeout
+        return False
 
-    def get_next_proxy(self):
-        """랜덤하게 프록시를 선택하여 반환"""
+    def _open_breaker(self, proxy, reason):
+        """회로 열기 (반복될수록 쿨다운 2배)"""
+        stats = self._get_stats(proxy)
+        cooldown = min(self.max_cooldown, self.base_cooldown * (2 ** stats["cooldowns"]))
+        stats["cooldowns"] += 1
+        stats["cooldown_until"] = time.time() + cooldown
+        stats["state"] = "open"
+        stats["probe_started"] = 0.0
+        self.failed_proxies.add(proxy)
+        print(f"[WARNING] 프록시 회로 열림: {proxy.split(':')[0]} ({reason}, {cooldown:.0f}초 쿨다운)")
+
+    def get_best_latency(self) -> float:
+        """측정된 프록시 지연시간 중 최솟값 (측정된 프록시가 없으면 1초)"""
+        known_latencies = [s["latency"] for s in self.proxy_stats.values() if s["latency"] is not None]
+        return min(known_latencies) if known_latencies else 1.0
+
+    def get_proxy_score(self, proxy, default_latency: float = None):
+        """선택 가중치 (성공률^2 / 지연시간). 지연시간을 모르는 새 프록시는 현재 최고 수준으로 가정해 탐색
+
+        default_latency: 여러 프록시를 한 번에 평가할 때 미리 구한 get_best_latency() 값 (프록시마다 다시 구하지 않도록)
+        """
+        stats = self._get_stats(proxy)
+        if stats["latency"] is not None:
+            latency = stats["latency"]
+        else:
+            latency = default_latency if default_latency is not None else self.get_best_latency()
+        return (stats["success_rate"] ** 2) / max(latency, 0.05)
+
+    def _choose_weighted(self, candidates):
+        # 최소 지연시간은 선택 1회에 한 번만 계산 (후보마다 계산하면 O(n^2))
+        best_latency = self.get_best_latency()
+        weights = [self.get_proxy_score(proxy, best_latency) for proxy in candidates]
+        if sum(weights) <= 0:
+            return random.choice(candidates)
+        return random.choices(candidates, weights=weights, k=1)[0]
+
+    def get_next_proxy(self, exclude=()):
+        """지연시간/성공률 가중치로 프록시를 선택하여 반환 (exclude: 가급적 피할 프록시들)"""
         if not self.proxy_list:
             return None
 
-        # 사용 가능한 프록시 목록 생성
-        available_proxies = [proxy for proxy in self.proxy_list if proxy not in self.failed_proxies]
+        with self.lock:
+            self._release_expired_cooldowns()
 
-        if not available_proxies:
-            # 모든 프록시가 완전히 실패했다면 실패 목록을 초기화
-            print("[WARNING] 모든 프록시가 실패했습니다. 실패 목록과 카운터를 초기화합니다.")
-            self.failed_proxies.clear()
-            self.proxy_failure_count.clear()
-            available_proxies = self.proxy_list.copy()
+            # 사용 가능한 프록시 목록 생성 (시험 요청이 진행 중인 half_open 프록시 제외)
+            now = time.time()
+            available_proxies = [proxy for proxy in self.proxy_list if self._is_selectable(proxy, now)]
 
-        # 사용 가능한 프록시 중에서 랜덤하게 선택
-        proxy = random.choice(available_proxies)
-        self.current_proxy = proxy
+            # 다른 요청이 사용 중인 프록시 제외 (남는 프록시가 없으면 그대로 사용)
+            if exclude:
+                not_excluded = [proxy for proxy in available_proxies if proxy not in exclude]
+                if not_excluded:
+                    available_proxies = not_excluded
 
-        proxy_ip = proxy.split(':')[0]
-        failure_count = self.proxy_failure_count.get(proxy, 0)
-        print(f"[PROXY] 랜덤 선택된 프록시: {proxy_ip} (실패 횟수: {failure_count})")
-        return proxy
+            if not available_proxies:
+                # 모든 프록시가 쿨다운 중이면 가장 먼저 쿨다운이 끝나는 프록시 사용
+                proxy = min(self.proxy_list, key=lambda p: self._get_stats(p)["cooldown_until"])
+                wait_seconds = max(0.0, self._get_stats(proxy)["cooldown_until"] - time.time())
+                print(f"[WARNING] 모든 프록시가 쿨다운 중입니다. 가장 먼저 복귀할 프록시 사용 ({wait_seconds:.0f}초 남음)")
+            else:
+                proxy = self._choose_weighted(available_proxies)
 
-    def get_random_proxy_from_working_set(self):
-        """성능이 좋은 프록시들 중에서 랜덤 선택"""
-        if not self.proxy_list:
-            return None
+            stats = self._get_stats(proxy)
+            if stats["state"] == "half_open":
+                stats["probe_started"] = now
+            self.current_proxy = proxy
 
-        # 실패 횟수가 적은 프록시들을 우선적으로 선택
-        working_proxies = []
-        for proxy in self.proxy_list:
-            if proxy not in self.failed_proxies:
-                failure_count = self.proxy_failure_count.get(proxy, 0)
-                # 실패 횟수가 1회 이하인 프록시들을 우선 선택
-                if failure_count <= 1:
-                    working_proxies.append(proxy)
-
-        # 성능 좋은 프록시가 없으면 일반 선택 방식 사용
-        if not working_proxies:
-            return self.get_next_proxy()
-
-        proxy = random.choice(working_proxies)
-        self.current_proxy = proxy
         proxy_ip = proxy.split(':')[0]
         failure_count = self.proxy_failure_count.get(proxy, 0)
-        print(f"[PROXY] 성능 우선 랜덤 선택: {proxy_ip} (실패 횟수: {failure_count})")
+        print(f"[PROXY] 성능 가중 선택: {proxy_ip} (실패 횟수: {failure_count})")
         return proxy
 
-    def mark_proxy_failed(self, proxy):
-        """프록시를 실패로 표시 (누적 실패 관리)"""
-        if proxy not in self.proxy_failure_count:
-            self.proxy_failure_count[proxy] = 0
+    def get_random_proxy_from_working_set(self, exclude=()):
+        """쿨다운 중이 아닌 프록시 중 빠르고 성공률 높은 프록시 우선 선택 (exclude: 가급적 피할 프록시들)
 
-        self.proxy_failure_count[proxy] += 1
-        proxy_ip = proxy.split(':')[0]
+        성공률^2 / 지연시간 가중 랜덤 선택이므로 느리거나 자주 실패하는 프록시도 가끔은 선택되어
+        상태가 회복되었는지 다시 측정된다.
+        """
+        return self.get_next_proxy(exclude=exclude)
 
-        # 최대 실패 횟수에 도달하면 완전히 제거
-        if self.proxy_failure_count[proxy] >= self.max_failures_per_proxy:
-            self.failed_proxies.add(proxy)
-            print(f"[WARNING] 프록시 완전 실패로 제거: {proxy_ip} ({self.proxy_failure_count[proxy]}회 실패)")
-        else:
-            print(
-                f"[WARNING] 프록시 일시 실패: {proxy_ip} ({self.proxy_failure_count[proxy]}/{self.max_failures_per_proxy} 실패)")
+    def record_success(self, proxy, latency):
+        """성공한 요청의 응답 시간을 반영"""
+        if not proxy:
+            return
+
+        with self.lock:
+            stats = self._get_stats(proxy)
+            alpha = self.ewma_alpha
+            stats["requests"] += 1
+            stats["successes"] += 1
+            stats["latency"] = latency if stats["latency"] is None else (1 - alpha) * stats["latency"] + alpha * latency
+            stats["success_rate"] = (1 - alpha) * stats["success_rate"] + alpha
+            stats["cooldowns"] = 0
+            self.proxy_failure_count[proxy] = 0
+            if stats["state"] != "closed":
+                print(f"[PROXY] 시험 요청 성공, 회로 닫힘: {proxy.split(':')[0]}")
+            stats["state"] = "closed"
+            stats["probe_started"] = 0.0
+            self.failed_proxies.discard(proxy)
+
+    def mark_proxy_failed(self, proxy):
+        """프록시를 실패로 표시 (연속 실패 시 회로가 열리고, half_open 시험 요청 실패 시 바로 다시 열림)"""
+        with self.lock:
+            if proxy not in self.proxy_failure_count:
+                self.proxy_failure_count[proxy] = 0
+
+            self.proxy_failure_count[proxy] += 1
+            stats = self._get_stats(proxy)
+            stats["requests"] += 1
+            stats["failures"] += 1
+            stats["success_rate"] = (1 - self.ewma_alpha) * stats["success_rate"]
+            proxy_ip = proxy.split(':')[0]
+
+            if stats["state"] == "half_open":
+                self._open_breaker(proxy, "시험 요청 실패")
+            elif self.proxy_failure_count[proxy] >= self.max_failures_per_proxy and stats["state"] == "closed":
+                # 연속 실패 횟수에 도달하면 회로 열림 (반복될수록 쿨다운 2배)
+                self._open_breaker(proxy, f"{self.proxy_failure_count[proxy]}회 연속 실패")
+            else:
+                print(
+                    f"[WARNING] 프록시 일시 실패: {proxy_ip} ({self.proxy_failure_count[proxy]}/{self.max_failures_per_proxy} 실패)")
+
+        if proxy in self.failed_proxies:
+            self.close_session(proxy)
+
+    def mark_proxy_blocked(self, proxy):
+        """차단 응답(403/429/차단 페이지)을 받은 프록시는 연속 실패 횟수와 관계없이 바로 회로를 열어 쿨다운 동안 선택하지 않음"""
+        with self.lock:
+            self.proxy_failure_count[proxy] = self.proxy_failure_count.get(proxy, 0) + 1
+            stats = self._get_stats(proxy)
+            stats["requests"] += 1
+            stats["failures"] += 1
+            stats["success_rate"] = (1 - self.ewma_alpha) * stats["success_rate"]
+            # 동시에 요청 중이던 다른 페이지가 같은 프록시의 차단을 다시 보고해도 쿨다운을 한 번만 늘림
+            if stats["state"] != "open":
+                self._open_breaker(proxy, "차단 응답")
+
+        self.close_session(proxy)
 
     def get_available_proxy_count(self):
-        """사용 가능한 프록시 개수 반환"""
+        """사용 가능한(회로가 열리지 않은) 프록시 개수 반환"""
         if not self.proxy_list:
             return 0
-        return len(self.proxy_list) - len(self.failed_proxies)
+        with self.lock:
+            self._release_expired_cooldowns()
+            return len(self.proxy_list) - len(self.failed_proxies)
+
+    def get_open_breaker_ratio(self):
+        """회로가 열린 프록시 비율 (프록시가 없으면 0)"""
+        if not self.proxy_list:
+            return 0.0
+        with self.lock:
+            self._release_expired_cooldowns()
+            return len(self.failed_proxies) / len(self.proxy_list)
+
+    def seconds_until_next_half_open(self):
+        """가장 먼저 쿨다운이 끝나는 프록시까지 남은 시간(초)"""
+        with self.lock:
+            if not self.failed_proxies:
+                return 0.0
+            earliest = min(self._get_stats(proxy)["cooldown_until"] for proxy in self.failed_proxies)
+        return max(0.0, earliest - time.time())
+
+    def get_proxy_stats(self):
+        """프록시별 통계를 선택 가중치 높은 순으로 반환"""
+        with self.lock:
+            now = time.time()
+            best_latency = self.get_best_latency()
+            rows = []
+            for proxy in self.proxy_list:
+                stats = self._get_stats(proxy)
+                rows.append({
+                    "proxy": proxy.split(':')[0] + ':' + proxy.split(':')[1],
+                    "latency": stats["latency"],
+                    "success_rate": stats["success_rate"],
+                    "requests": stats["requests"],
+                    "failures": stats["failures"],
+                    "cooldown_remaining": max(0.0, stats["cooldown_until"] - now),
+                    "state": stats["state"],
+                    "score": self.get_proxy_score(proxy, best_latency),
+                })
+        rows.sort(key=lambda row: row["score"], reverse=True)
+        return rows
+
+    def print_proxy_stats(self, limit=20):
+        """프록시별 통계 출력 (처리량을 떨어뜨리는 느린/차단 프록시 확인용)"""
+        rows = self.get_proxy_stats()
+        if not rows:
+            return
+
+        print(f"\n[PROXY STATS] 상위/하위 프록시 (총 {len(rows)}개)")
+        print(f"{'프록시':<22} {'지연(초)':>8} {'성공률':>7} {'요청':>6} {'실패':>6} {'쿨다운(초)':>10} {'회로':>10}")
+        shown = rows if len(rows) <= limit else rows[:limit // 2] + rows[-(limit - limit // 2):]
+        for row in shown:
+            latency = f"{row['latency']:.2f}" if row["latency"] is not None else "-"
+            print(f"{row['proxy']:<22} {latency:>8} {row['success_rate']:>7.2f} {row['requests']:>6} "
+                  f"{row['failures']:>6} {row['cooldown_remaining']:>10.0f} {row['state']:>10}")
+
+    def get_session(self, proxy):
+        """프록시별로 유지되는 연결 풀 세션 반환 (없으면 생성)"""
+        with self.session_lock:
+            self.evict_idle_sessions()
+
+            session = self.sessions.get(proxy)
+            if session is None:
+                session = rq.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+
+                proxy_dict = self.get_proxy_dict(proxy)
+                if proxy_dict:
+                    session.proxies.update(proxy_dict)
+
+                self.sessions[proxy] = session
+
+            self.session_last_used[proxy] = time.monotonic()
+            return session
+
+    def evict_idle_sessions(self):
+        """session_idle_timeout 동안 사용되지 않은 세션 정리 (session_lock 안에서 호출)"""
+        if not self.session_idle_timeout:
+            return
+
+        now = time.monotonic()
+        idle_proxies = [
+            proxy for proxy, last_used in self.session_last_used.items()
+            if now - last_used > self.session_idle_timeout
+        ]
+        for proxy in idle_proxies:
+            session = self.sessions.pop(proxy, None)
+            self.session_last_used.pop(proxy, None)
+            if session:
+                session.close()
+
+    def close_session(self, proxy):
+        """특정 프록시의 세션 닫기 (차단된 프록시의 연결은 재사용하지 않음)"""
+        with self.session_lock:
+            session = self.sessions.pop(proxy, None)
+            self.session_last_used.pop(proxy, None)
+        if session:
+            session.close()
+
+    def close_all_sessions(self):
+        """모든 프록시 세션 닫기"""
+        with self.session_lock:
+            sessions = list(self.sessions.values())
+            self.sessions.clear()
+            self.session_last_used.clear()
+        for session in sessions:
+            session.close()
 
     def get_proxy_dict(self, proxy_string):
         """프록시 문자열을 requests용 딕셔너리로 변환"""
@@ -225,8 +605,225 @@ class ProxyRotator:
         return None
 
 
+class RateLimiter:
+    """v1.8: 여러 작업자가 공유하는 전역 요청 속도 제한기 (토큰 버킷)"""
+
+    def __init__(self, max_requests_per_sec: float, burst: int = 1):
+        """
+        max_requests_per_sec: 전체 작업자 합산 초당 최대 요청 수 (0 이하이면 제한 없음)
+        burst: 순간적으로 허용할 최대 연속 요청 수
+        """
+        self.rate = max_requests_per_sec
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """요청 1회분의 토큰을 얻을 때까지 대기"""
+        if not self.rate or self.rate <= 0:
+            return
+
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time <= 0:
+                return
+            time.sleep(wait_time)
+
+    def try_acquire(self) -> float:
+        """토큰을 얻으면 0, 아니면 기다려야 할 시간(초)을 반환"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    async def acquire_async(self) -> None:
+        """acquire()의 asyncio 버전 (이벤트 루프를 막지 않고 대기)"""
+        if not self.rate or self.rate <= 0:
+            return
+
+        while True:
+            wait_time = self.try_acquire()
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+
+class AdaptivePacer:
+    """v1.8: AIMD(가산 증가/승산 감소) 방식의 적응형 요청 간격 조절기
+
+    전역 요청 속도와 연결(프록시, 직접 연결이면 None)별 요청 속도를 따로 관리한다.
+    - 성공: 속도(초당 요청 수)를 increase_step만큼 더함 (느린 응답이면 더하지 않고 slow_factor를 곱함)
+    - 403/차단/리뷰 목록 없는 응답(소프트 차단)/타임아웃: 프록시 속도에 decrease_factor, 전역 속도에 global_decrease_factor를 곱함
+    연결별 요청 간격은 항상 [min_interval, max_interval] 범위 안에 있다. min_interval은 연결 하나의 하한이므로
+    전역 간격의 하한은 min_interval / (지금까지 사용한 연결 수)이다 (프록시가 많을수록 전체 속도도 빨라질 수 있음).
+    요청 전에 wait()로 전역 간격과 해당 연결의 간격을 모두 지킬 때까지 대기한다.
+    전체 초당 요청 수 상한은 RateLimiter(토큰 버킷)가 따로 정하며, 두 제한은 모두 지켜지므로 더 느린 쪽이 적용된다.
+    """
+
+    def __init__(self, min_interval: float = 0.2, max_interval: float = 30.0, initial_interval: float = 1.0,
+                 increase_step: float = 0.05, decrease_factor: float = 0.5, global_decrease_factor: float = 0.75,
+                 slow_latency: float = 5.0, slow_factor: float = 0.9, jitter: float = 0.2):
+        """
+        min_interval/max_interval: 요청 간격의 하한/상한(초)
+        initial_interval: 시작 요청 간격(초)
+        increase_step: 성공 1회마다 더할 초당 요청 수
+        slow_latency: 이보다 오래 걸린 응답은 성공이어도 혼잡 신호로 보고 속도를 조금 줄임
+        jitter: 간격에 섞을 무작위 변동 비율 (요청 시각이 일정한 패턴이 되지 않도록)
+        """
+        self.min_interval = max(0.0, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.initial_interval = min(max(initial_interval, self.min_interval), self.max_interval)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.global_decrease_factor = global_decrease_factor
+        self.slow_latency = slow_latency
+        self.slow_factor = slow_factor
+        self.jitter = jitter
+
+        self.lock = threading.Lock()
+        self.global_rate = self._to_rate(self.initial_interval)
+        self.global_next_time = 0.0
+        self.proxy_rates = {}  # proxy -> 초당 요청 수
+        self.proxy_next_time = {}  # proxy -> 다음 요청 가능 시각
+
+    @staticmethod
+    def _to_rate(interval: float) -> float:
+        return 1.0 / interval if interval > 0 else float("inf")
+
+    def _clamp(self, rate: float) -> float:
+        """연결 하나의 속도를 [1/max_interval, 1/min_interval] 범위로 제한"""
+        return min(max(rate, self._to_rate(self.max_interval)), self._to_rate(self.min_interval))
+
+    def _clamp_global(self, rate: float) -> float:
+        """전역 속도를 [1/max_interval, 사용한 연결 수/min_interval] 범위로 제한"""
+        connections = max(1, len(self.proxy_rates))
+        return min(max(rate, self._to_rate(self.max_interval)), self._to_rate(self.min_interval) * connections)
+
+    def get_interval(self, proxy=None) -> float:
+        """현재 요청 간격(초) (proxy를 주면 해당 프록시 간격)"""
+        with self.lock:
+            rate = self.proxy_rates.get(proxy, self._to_rate(self.initial_interval)) if proxy else self.global_rate
+        return 1.0 / rate
+
+    def reserve(self, proxy=None) -> float:
+        """다음 요청 시각을 예약하고 그때까지 기다려야 할 시간(초) 반환"""
+        with self.lock:
+            now = time.monotonic()
+            start_time = max(now, self.global_next_time, self.proxy_next_time.get(proxy, 0.0))
+
+            if proxy not in self.proxy_rates:
+                # 새 연결이 늘면 전역 속도도 그 연결의 시작 속도만큼 늘림 (첫 연결은 전역 시작 속도와 같음)
+                self.proxy_rates[proxy] = self._to_rate(self.initial_interval)
+                if len(self.proxy_rates) > 1:
+                    self.global_rate = self._clamp_global(self.global_rate + self.proxy_rates[proxy])
+
+            jitter = random.uniform(1 - self.jitter, 1 + self.jitter) if self.jitter else 1.0
+            self.global_next_time = start_time + jitter / self.global_rate
+            self.proxy_next_time[proxy] = start_time + jitter / self.proxy_rates[proxy]
+            return start_time - now
+
+    def wait(self, proxy=None) -> float:
+        """전역/프록시 간격을 지킬 때까지 대기 (대기한 시간 반환)"""
+        wait_time = self.reserve(proxy)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def wait_async(self, proxy=None) -> float:
+        """wait()의 asyncio 버전"""
+        wait_time = self.reserve(proxy)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def record_success(self, proxy=None, latency: float = None) -> None:
+        """성공 응답: 가산 증가 (느린 응답이면 소폭 감소)"""
+        slow = latency is not None and self.slow_latency and latency > self.slow_latency
+        with self.lock:
+            rate = self.proxy_rates.get(proxy, self._to_rate(self.initial_interval))
+            rate = rate * self.slow_factor if slow else rate + self.increase_step
+            self.proxy_rates[proxy] = self._clamp(rate)
+
+            if slow:
+                self.global_rate = self._clamp_global(self.global_rate * self.slow_factor)
+            else:
+                self.global_rate = self._clamp_global(self.global_rate + self.increase_step)
+
+    def record_failure(self, proxy=None) -> None:
+        """403/차단/소프트 차단/타임아웃 등: 승산 감소"""
+        with self.lock:
+            rate = self.proxy_rates.get(proxy, self._to_rate(self.initial_interval))
+            self.proxy_rates[proxy] = self._clamp(rate * self.decrease_factor)
+            self.global_rate = self._clamp_global(self.global_rate * self.global_decrease_factor)
+
+
+class CookieJarCache:
+    """v1.8: 프록시별 예열 쿠키 캐시 (동시 크롤링 시 작업자들이 공유)
+
+    상품마다 메인/상품 페이지를 방문해 쿠키를 받는 대신, 프록시(직접 연결이면 None)별로 한 번 예열한
+    쿠키를 ttl초 동안 재사용한다. 만료된 쿠키가 있거나 403/차단 응답을 받으면 무효화되어 다시 예열한다.
+    """
+
+    def __init__(self, ttl: float = 1800.0):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = {}  # proxy -> {"jar": RequestsCookieJar, "created_at": float}
+        self.warm_locks = {}  # proxy -> threading.Lock (같은 프록시를 여러 스레드가 동시에 예열하지 않도록)
+        self.hits = 0
+        self.misses = 0
+
+    def _is_valid(self, entry, now) -> bool:
+        if now - entry["created_at"] > self.ttl:
+            return False
+        return not any(cookie.is_expired(now) for cookie in entry["jar"])
+
+    def get(self, proxy):
+        """유효한 쿠키의 복사본 반환 (없거나 오래되었으면 None)"""
+        with self.lock:
+            entry = self.entries.get(proxy)
+            if entry and self._is_valid(entry, time.time()):
+                self.hits += 1
+                return entry["jar"].copy()
+            self.misses += 1
+            return None
+
+    def put(self, proxy, cookies) -> None:
+        """예열로 받은 쿠키 저장 (ttl 새로 시작)"""
+        jar = rq.cookies.RequestsCookieJar()
+        for cookie in getattr(cookies, "jar", cookies):
+            jar.set_cookie(cookie)
+        with self.lock:
+            self.entries[proxy] = {"jar": jar, "created_at": time.time()}
+
+    def update(self, proxy, cookies) -> None:
+        """응답에서 새로 받은 쿠키를 캐시된 쿠키에 반영 (ttl은 유지)"""
+        with self.lock:
+            entry = self.entries.get(proxy)
+            if not entry:
+                return
+            for cookie in getattr(cookies, "jar", cookies):
+                entry["jar"].set_cookie(cookie)
+
+    def invalidate(self, proxy) -> None:
+        with self.lock:
+            self.entries.pop(proxy, None)
+
+    def warm_lock(self, proxy):
+        with self.lock:
+            return self.warm_locks.setdefault(proxy, threading.Lock())
+
+
 class ChromeDriver:
     def __init__(self, proxy_rotator=None) -> None:
+        if not SELENIUM_AVAILABLE:
+            raise ImportError("Selenium이 설치되지 않았습니다. pip install selenium으로 설치하세요.")
+
         self.proxy_rotator = proxy_rotator
         self.ua = NonWindowsUserAgent()  # Windows 제외 User-Agent 사용
         self.set_options()
@@ -279,6 +876,10 @@ class ChromeDriver:
         self.set_driver()
 
 
+# v1.8: 리뷰 API 페이지당 리뷰 수 (build_review_payload의 size)
+REVIEW_PAGE_SIZE = 10
+
+
 class URLManager:
     """URL 관리 클래스 (JSON 지원)"""
 
@@ -286,6 +887,7 @@ class URLManager:
         self.file_path = file_path
         self.products = []  # URL과 상품명을 함께 저장
         self.current_index = 0
+        self.lock = threading.Lock()  # v1.8: 여러 작업자가 동시에 상품을 가져갈 수 있도록
 
     def load_urls_from_json(self):
         """JSON 파일에서 URL 목록과 상품명 로드"""
@@ -309,7 +911,9 @@ class URLManager:
                         if "coupang.com" in url and "products/" in url:
                             self.products.append({
                                 'url': url,
-                                'name': product_name
+                                'name': product_name,
+                                # v1.8: 브랜드 크롤러가 수집한 리뷰 수 (크롤링 계획용, 없으면 None)
+                                'review_count': self.parse_review_count(item.get('review_count')),
                             })
                         else:
                             print(f"[WARNING] 잘못된 URL 형식 (항목 {i}): {url}")
@@ -328,6 +932,14 @@ class URLManager:
             print(f"[ERROR] JSON 파일 읽기 실패: {e}")
             return False
 
+    @staticmethod
+    def parse_review_count(value):
+        """카탈로그의 리뷰 수("1,234" 등)를 정수로 변환 (비어 있거나 알 수 없으면 None)"""
+        if isinstance(value, int):
+            return value
+        digits = re.sub(r"[^\d]", "", str(value or ""))
+        return int(digits) if digits else None
+
     def create_sample_file(self):
         """샘플 JSON 파일 생성"""
         sample_data = [
@@ -351,12 +963,18 @@ class URLManager:
 
     def get_next_product(self):
         """다음 상품 정보 반환 (URL과 상품명)"""
-        if self.current_index < len(self.products):
-            product = self.products[self.current_index]
-            self.current_index += 1
-            return product
+        with self.lock:
+            if self.current_index < len(self.products):
+                product = self.products[self.current_index]
+                self.current_index += 1
+                return product
         return None
 
+    def reorder_products(self, products: list) -> None:
+        """v1.8: 아직 가져가지 않은 상품들의 순서를 바꿈 (우선순위 스케줄용)"""
+        with self.lock:
+            self.products = self.products[:self.current_index] + list(products)
+
     def get_remaining_count(self):
         """남은 상품 개수 반환"""
         return len(self.products) - self.current_index
@@ -366,6 +984,1090 @@ class URLManager:
         return self.current_index, len(self.products)
 
 
+class BeautifulSoupReviewParser:
+    """기존 BeautifulSoup(html.parser) 파싱 경로 (필드마다 select_one CSS 질의)"""
+
+    name = "bs4"
+
+    def parse(self, html: str) -> list:
+        articles = bs(html, "html.parser").select("article.sdp-review__article__list")
+        return [Coupang.extract_review(article) for article in articles]
+
+
+class SinglePassReviewParser:
+    """v1.8: 리뷰 article 하위 노드를 한 번만 순회하면서 클래스 이름으로 모든 필드를 추출하는 공통 로직
+
+    하위 클래스는 문서 파싱, article 목록, 노드의 태그/클래스/텍스트 접근만 구현한다.
+    추출 결과는 Coupang.extract_review(BeautifulSoup 경로)와 동일하다.
+    """
+
+    ARTICLE_CLASS = "sdp-review__article__list"
+    # 클래스 이름 -> 필드 (해당 클래스를 가진 첫 번째 노드의 텍스트 사용)
+    TEXT_FIELD_CLASSES = {
+        ("div", "sdp-review__article__list__info__product-info__reg-date"): "review_date",
+        ("span", "sdp-review__article__list__info__user__name"): "user_name",
+        ("div", "sdp-review__article__list__info__product-info__name"): "prod_name",
+        ("div", "sdp-review__article__list__headline"): "headline",
+        ("span", "js_reviewArticleHelpfulCount"): "helpful_count",
+    }
+    RATING_CLASS = "sdp-review__article__list__info__product-info__star-orange"
+    CONTENT_CLASSES = {"sdp-review__article__list__review__content", "js_reviewArticleContent"}
+    REVIEW_WRAPPER_CLASS = "sdp-review__article__list__review"
+    ATTACHMENT_CLASS = "sdp-review__article__list__attachment__list"
+
+    def parse(self, html: str) -> list:
+        return [self.extract_review(article) for article in self.iter_articles(html)]
+
+    def extract_review(self, article) -> dict:
+        texts = {}
+        rating_value = None
+        content = None
+        fallback_content = None
+        image_count = 0
+
+        for node in self.iter_descendants(article):
+            tag = self.tag_of(node)
+            classes = self.classes_of(node)
+            if not classes:
+                continue
+
+            for class_name in classes:
+                field = self.TEXT_FIELD_CLASSES.get((tag, class_name))
+                if field and field not in texts:
+                    texts[field] = self.text_of(node).strip()
+
+            if tag != "div":
+                continue
+
+            if rating_value is None and self.RATING_CLASS in classes:
+                rating_value = self.attr_of(node, "data-rating")
+            if content is None and self.CONTENT_CLASSES.issubset(classes):
+                content = self.text_of(node)
+            if fallback_content is None and self.REVIEW_WRAPPER_CLASS in classes:
+                fallback_content = self.first_div_child_text(node)
+            if self.ATTACHMENT_CLASS in classes:
+                image_count += self.count_images(node)
+
+        if rating_value:
+            try:
+                rating = int(rating_value)
+            except (ValueError, TypeError):
+                rating = 0
+        else:
+            rating = 0
+
+        if content is None:
+            content = fallback_content
+        review_content = re.sub("[\n\t]", "", content.strip()) if content is not None else ""
+
+        return {
+            "prod_name": texts.get("prod_name", "-"),
+            "review_date": texts.get("review_date", "-"),
+            "user_name": texts.get("user_name", "-"),
+            "rating": rating,
+            "headline": texts.get("headline", ""),
+            "review_content": review_content,
+            "helpful_count": texts.get("helpful_count", "0"),
+            "image_count": image_count,
+        }
+
+
+class LxmlReviewParser(SinglePassReviewParser):
+    """lxml 파서 + 미리 컴파일한 XPath로 article을 찾는 백엔드"""
+
+    name = "lxml"
+
+    def __init__(self):
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml이 설치되지 않았습니다. pip install lxml로 설치하세요.")
+        self.article_xpath = lxml_etree.XPath(
+            f'//article[contains(concat(" ", normalize-space(@class), " "), " {self.ARTICLE_CLASS} ")]'
+        )
+        self.first_div_child_xpath = lxml_etree.XPath("./div[1]")
+        self.image_xpath = lxml_etree.XPath(".//img")
+
+    def iter_articles(self, html: str):
+        if not html or not html.strip():
+            return []
+        return self.article_xpath(lxml_html.fromstring(html))
+
+    @staticmethod
+    def iter_descendants(article):
+        return article.iter(lxml_etree.Element)
+
+    @staticmethod
+    def tag_of(node) -> str:
+        return node.tag
+
+    @staticmethod
+    def classes_of(node):
+        class_attr = node.get("class")
+        return set(class_attr.split()) if class_attr else None
+
+    @staticmethod
+    def text_of(node) -> str:
+        return node.text_content()
+
+    @staticmethod
+    def attr_of(node, name: str):
+        return node.get(name)
+
+    def first_div_child_text(self, node):
+        children = self.first_div_child_xpath(node)
+        return children[0].text_content() if children else None
+
+    def count_images(self, node) -> int:
+        return len(self.image_xpath(node))
+
+
+class SelectolaxReviewParser(SinglePassReviewParser):
+    """selectolax(lexbor) 백엔드"""
+
+    name = "selectolax"
+
+    def __init__(self):
+        if not SELECTOLAX_AVAILABLE:
+            raise ImportError("selectolax가 설치되지 않았습니다. pip install selectolax로 설치하세요.")
+        self.article_selector = f"article.{self.ARTICLE_CLASS}"
+
+    def iter_articles(self, html: str):
+        return LexborHTMLParser(html).css(self.article_selector)
+
+    @staticmethod
+    def iter_descendants(article):
+        return article.traverse(include_text=False)
+
+    @staticmethod
+    def tag_of(node) -> str:
+        return node.tag
+
+    @staticmethod
+    def classes_of(node):
+        class_attr = node.attributes.get("class")
+        return set(class_attr.split()) if class_attr else None
+
+    @staticmethod
+    def text_of(node) -> str:
+        return node.text(deep=True)
+
+    @staticmethod
+    def attr_of(node, name: str):
+        return node.attributes.get(name)
+
+    @staticmethod
+    def first_div_child_text(node):
+        child = node.child
+        while child is not None:
+            if child.tag == "div":
+                return child.text(deep=True)
+            child = child.next
+        return None
+
+    @staticmethod
+    def count_images(node) -> int:
+        return len(node.css("img"))
+
+
+REVIEW_PARSERS = {
+    "bs4": BeautifulSoupReviewParser,
+    "lxml": LxmlReviewParser,
+    "selectolax": SelectolaxReviewParser,
+}
+
+
+def get_review_parser(name: str = "auto"):
+    """리뷰 파서 백엔드 생성 ("auto"는 설치된 것 중 가장 빠른 백엔드 선택)"""
+    if name == "auto":
+        if SELECTOLAX_AVAILABLE:
+            name = "selectolax"
+        elif LXML_AVAILABLE:
+            name = "lxml"
+        else:
+            name = "bs4"
+
+    if name not in REVIEW_PARSERS:
+        raise ValueError(f"지원하지 않는 파서 백엔드입니다: {name} (가능: auto, {', '.join(REVIEW_PARSERS)})")
+    return REVIEW_PARSERS[name]()
+
+
+class BlockPageClassifier:
+    """v1.8: 리뷰 API 응답 분류기 (차단 페이지 지문, 응답별 판정 캐시)
+
+    판정 순서 (앞에서 결정되면 뒤는 보지 않음):
+        blocked  차단 상태 코드 (403, 429)
+        reviews  리뷰 항목이 있음 (파싱한 리뷰가 0개면 파서/레이아웃 문제로 보고 unknown처럼 재시도)
+        empty    리뷰 항목 없이 빈 리뷰 목록 표시만 있음 (리뷰 끝)
+        blocked  짧은 응답(max_block_length자 이하)의 <title> 또는 본문에 알려진 차단 마커가 있음
+        unknown  그 외 (리뷰 목록 구조가 없는 응답 - 오류 페이지, 레이아웃 변경 등)
+
+    HTML 전체를 소문자로 바꾸거나 "bot", "security" 같은 흔한 단어를 찾지 않으므로 정상 페이지를 차단으로
+    오판하지 않는다. 차단 페이지는 보통 내용이 똑같으므로 (상태 코드, 길이, 앞/뒤 일부의 해시)별 판정을 캐시한다
+    (응답 전체를 해시하지 않으므로 응답 크기와 무관하게 일정한 비용). 동시 크롤링 시 작업자들이 공유한다.
+    """
+
+    BLOCK_STATUS_CODES = (403, 429)
+    REVIEW_CONTAINER_MARKERS = ("sdp-review__article__list",)
+    REVIEW_LIST_END_MARKERS = ("sdp-review__article__no-review",)
+    CACHE_KEY_CHARS = 1024  # 캐시 키에 쓰는 응답 앞/뒤 글자 수
+    # <title>은 소문자로 바꿔 비교
+    BLOCK_TITLE_MARKERS = (
+        "access denied", "pardon our interruption", "attention required", "just a moment", "captcha",
+        "robot check", "request blocked", "보안 확인", "접근이 차단", "접근 거부",
+    )
+    BLOCK_BODY_MARKERS = (
+        "errors.edgesuite.net", "/_sec/cp_challenge", "_Incapsula_Resource", "cf-chl-", "g-recaptcha",
+        "h-captcha", "captcha-delivery", "You don't have permission to access", "Access Denied",
+    )
+
+    def __init__(self, max_block_length: int = 20000, cache_size: int = 1024):
+        self.max_block_length = max_block_length
+        self.cache_size = cache_size
+        self.cache = {}  # (상태 코드, 길이, 앞/뒤 해시) -> 판정 (삽입 순서로 오래된 것부터 제거)
+        self.lock = threading.Lock()
+
+    def classify(self, html: str, status_code: int = 200) -> str:
+        """응답 판정 ("reviews", "empty", "blocked", "unknown")"""
+        key = (status_code, len(html), hash(html[:self.CACHE_KEY_CHARS]), hash(html[-self.CACHE_KEY_CHARS:]))
+        with self.lock:
+            verdict = self.cache.get(key)
+        if verdict is not None:
+            return verdict
+
+        verdict = self._classify(html, status_code)
+        with self.lock:
+            if len(self.cache) >= self.cache_size:
+                self.cache.pop(next(iter(self.cache)))
+            self.cache[key] = verdict
+        return verdict
+
+    def _classify(self, html: str, status_code: int) -> str:
+        if status_code in self.BLOCK_STATUS_CODES:
+            return "blocked"
+        if any(marker in html for marker in self.REVIEW_CONTAINER_MARKERS):
+            return "reviews"
+        if any(marker in html for marker in self.REVIEW_LIST_END_MARKERS):
+            return "empty"
+        if len(html) > self.max_block_length:
+            return "unknown"
+
+        title = self.get_title(html).lower()
+        if title and any(marker in title for marker in self.BLOCK_TITLE_MARKERS):
+            return "blocked"
+        if any(marker in html for marker in self.BLOCK_BODY_MARKERS):
+            return "blocked"
+        return "unknown"
+
+    @staticmethod
+    def get_title(html: str) -> str:
+        """문서 앞부분의 <title> 텍스트 (없으면 빈 문자열)"""
+        head = html[:4096]
+        start = head.find("<title")
+        if start < 0:
+            start = head.find("<TITLE")
+        if start < 0:
+            return ""
+        start = head.find(">", start) + 1
+        end = head.find("</", start)
+        return head[start:end if end >= 0 else len(head)].strip()
+
+
+class CrawlCheckpoint:
+    """v1.8: 재시작 가능한 크롤링 체크포인트 (SQLite)
+
+    상품별로 마지막으로 처리한 페이지와 연속 빈 페이지 수, 완료 여부를 기록하고
+    이미 저장한 리뷰 키를 보관한다. 중단 후 재시작하면 완료된 상품은 건너뛰고
+    진행 중이던 상품은 다음 페이지부터 이어서 크롤링한다.
+    상품별 크롤링 이력(마지막 크롤링 시각, 수집 리뷰 수, 요청 수)은 진행 기록을 초기화해도 유지하며
+    우선순위 스케줄의 예상 신규 리뷰 수 추정에 쓴다.
+    """
+
+    def __init__(self, db_path="data/crawl_checkpoint.sqlite3"):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS product_progress (
+                    product_code TEXT PRIMARY KEY,
+                    last_page INTEGER NOT NULL DEFAULT 0,
+                    consecutive_empty_pages INTEGER NOT NULL DEFAULT 0,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS review_keys (
+                    product_code TEXT NOT NULL,
+                    review_key TEXT NOT NULL,
+                    PRIMARY KEY (product_code, review_key)
+                ) WITHOUT ROWID
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS product_history (
+                    product_code TEXT PRIMARY KEY,
+                    first_crawled_at REAL NOT NULL,
+                    last_crawled_at REAL NOT NULL,
+                    last_interval REAL,
+                    crawls INTEGER NOT NULL DEFAULT 0,
+                    total_reviews INTEGER NOT NULL DEFAULT 0,
+                    last_new_reviews INTEGER NOT NULL DEFAULT 0,
+                    last_requests INTEGER NOT NULL DEFAULT 0,
+                    partial_reviews INTEGER NOT NULL DEFAULT 0,
+                    partial_requests INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
+    @staticmethod
+    def make_review_key(prod_code: str, review: dict) -> str:
+        """리뷰 식별 키 (상품코드, 작성자, 작성일자, 별점, 헤드라인, 본문 해시)
+
+        헤드라인이 없는 짧은 리뷰는 작성자/작성일자가 같으면 구분되지 않으므로 별점과 본문까지 포함한다.
+        """
+        raw = "\x1f".join([
+            str(prod_code), str(review.get("user_name", "")), str(review.get("review_date", "")),
+            str(review.get("rating", "")), str(review.get("headline", "")), str(review.get("review_content", "")),
+        ])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    def get_progress(self, prod_code: str):
+        """(마지막 처리 페이지, 연속 빈 페이지 수) 반환 (기록이 없으면 (0, 0))"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT last_page, consecutive_empty_pages FROM product_progress WHERE product_code = ?",
+                (prod_code,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    def is_completed(self, prod_code: str) -> bool:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT completed FROM product_progress WHERE product_code = ?", (prod_code,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def filter_new_reviews(self, prod_code: str, reviews: list) -> list:
+        """이미 저장된 리뷰를 제외한 목록 반환"""
+        if not reviews:
+            return reviews
+
+        keys = [self.make_review_key(prod_code, review) for review in reviews]
+        with self.lock:
+            placeholders = ",".join("?" * len(keys))
+            seen = {row[0] for row in self.conn.execute(
+                f"SELECT review_key FROM review_keys WHERE product_code = ? AND review_key IN ({placeholders})",
+                (prod_code, *keys)
+            )}
+        return [review for review, key in zip(reviews, keys) if key not in seen]
+
+    def mark_page(self, prod_code: str, page: int, consecutive_empty_pages: int, reviews=(),
+                  progress_key: str = None) -> None:
+        """페이지 처리 완료 기록 (저장된 리뷰 키와 함께 하나의 트랜잭션으로 커밋)
+
+        progress_key를 지정하면 진행 기록은 그 키(별점 스트림 등)로, 리뷰 키는 상품코드로 기록한다.
+        """
+        keys = [(prod_code, self.make_review_key(prod_code, review)) for review in reviews]
+        with self.lock, self.conn:
+            if keys:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO review_keys (product_code, review_key) VALUES (?, ?)", keys
+                )
+            self.conn.execute("""
+                INSERT INTO product_progress (product_code, last_page, consecutive_empty_pages, completed, updated_at)
+                VALUES (?, ?, ?, 0, ?)
+                ON CONFLICT(product_code) DO UPDATE SET
+                    last_page = excluded.last_page,
+                    consecutive_empty_pages = excluded.consecutive_empty_pages,
+                    updated_at = excluded.updated_at
+            """, (progress_key or prod_code, page, consecutive_empty_pages, time.time()))
+
+    def add_review_keys(self, prod_code: str, reviews) -> None:
+        """저장된 리뷰 키만 기록 (작업 큐의 페이지 구간 작업용)"""
+        keys = [(prod_code, self.make_review_key(prod_code, review)) for review in reviews]
+        if not keys:
+            return
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO review_keys (product_code, review_key) VALUES (?, ?)", keys
+            )
+
+    def mark_completed(self, prod_code: str) -> None:
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO product_progress (product_code, completed, updated_at) VALUES (?, 1, ?)
+                ON CONFLICT(product_code) DO UPDATE SET completed = 1, updated_at = excluded.updated_at
+            """, (prod_code, time.time()))
+
+    def record_product_run(self, prod_code: str, new_reviews: int, requests: int, finished: bool = True) -> None:
+        """상품 1개 크롤링 결과(새로 저장한 리뷰 수, 요청 수)를 크롤링 이력에 누적
+
+        finished=False(예산 소진 등으로 중간에 멈춤)이면 수집 리뷰 수만 누적하고, 상품을 끝까지 크롤링한
+        실행에서 그 사이 실행들의 리뷰/요청 수를 합쳐 마지막 크롤링 결과로 기록한다.
+        """
+        now = time.time()
+        with self.lock, self.conn:
+            if not finished:
+                self.conn.execute("""
+                    INSERT INTO product_history (product_code, first_crawled_at, last_crawled_at, crawls,
+                                                 total_reviews, partial_reviews, partial_requests)
+                    VALUES (?, ?, ?, 0, ?, ?, ?)
+                    ON CONFLICT(product_code) DO UPDATE SET
+                        total_reviews = product_history.total_reviews + excluded.total_reviews,
+                        partial_reviews = product_history.partial_reviews + excluded.partial_reviews,
+                        partial_requests = product_history.partial_requests + excluded.partial_requests
+                """, (prod_code, now, now, new_reviews, new_reviews, requests))
+                return
+
+            self.conn.execute("""
+                INSERT INTO product_history (product_code, first_crawled_at, last_crawled_at, last_interval, crawls,
+                                             total_reviews, last_new_reviews, last_requests)
+                VALUES (?, ?, ?, NULL, 1, ?, ?, ?)
+                ON CONFLICT(product_code) DO UPDATE SET
+                    last_interval = CASE WHEN product_history.crawls > 0
+                        THEN excluded.last_crawled_at - product_history.last_crawled_at END,
+                    last_crawled_at = excluded.last_crawled_at,
+                    crawls = product_history.crawls + 1,
+                    total_reviews = product_history.total_reviews + excluded.total_reviews,
+                    last_new_reviews = product_history.partial_reviews + excluded.last_new_reviews,
+                    last_requests = product_history.partial_requests + excluded.last_requests,
+                    partial_reviews = 0,
+                    partial_requests = 0
+            """, (prod_code, now, now, new_reviews, new_reviews, requests))
+
+    def get_product_history(self) -> dict:
+        """상품코드 -> 크롤링 이력 dict"""
+        with self.lock:
+            cursor = self.conn.execute("""
+                SELECT product_code, first_crawled_at, last_crawled_at, last_interval, crawls,
+                       total_reviews, last_new_reviews, last_requests
+                FROM product_history
+            """)
+            columns = [col[0] for col in cursor.description]
+            return {row[0]: dict(zip(columns, row)) for row in cursor}
+
+    def clear_progress(self) -> None:
+        """전체 크롤링이 끝나면 완료된 상품의 진행 기록(완료 표시 포함) 초기화 (리뷰 키와 크롤링 이력은 유지)
+
+        실패한 상품의 진행 기록은 남겨 다음 실행에서 실패한 페이지부터 다시 크롤링한다.
+        별점 스트림 진행 기록({상품코드}:{별점})은 상품이 완료되었을 때만 지운다 (일부 스트림만 끝난 상품은 끝난 스트림을 건너뜀).
+        """
+        with self.lock, self.conn:
+            cleared = self.conn.execute("""
+                DELETE FROM product_progress WHERE completed = 1 AND (
+                    instr(product_code, ':') = 0 OR substr(product_code, 1, instr(product_code, ':') - 1) IN (
+                        SELECT product_code FROM product_progress WHERE completed = 1
+                    )
+                )
+            """).rowcount
+            remaining = self.conn.execute("SELECT COUNT(*) FROM product_progress").fetchone()[0]
+        print(f"[INFO] 전체 크롤링 완료로 완료된 상품의 체크포인트 진행 기록 {cleared}개를 초기화했습니다. "
+              f"(다음 실행에서 이어서 크롤링할 진행 기록 {remaining}개)")
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class CrawlWorkQueue:
+    """v1.8: 여러 크롤러 프로세스/머신이 함께 쓰는 (상품, 페이지 구간) 작업 큐 (SQLite)
+
+    카탈로그의 상품마다 pages_per_task 페이지씩 구간 작업을 만들고, 작업자는 작업을 임대(lease)해 처리한 뒤
+    완료를 기록한다. 임대 시간이 지나도록 완료되지 않은 작업(프로세스 종료 등)은 다른 작업자가 다시 가져가며,
+    max_attempts번 실패한 작업은 failed로 남긴다. 어떤 구간에서 리뷰 끝(빈 리뷰 목록/짧은 페이지)을 확인하면
+    그 이후 구간은 요청하지 않고 skipped로 처리한다.
+    여러 머신에서 쓸 때는 파일 잠금이 동작하는 공유 파일시스템에 큐 파일을 두어야 한다.
+    """
+
+    def __init__(self, db_path="data/crawl_queue.sqlite3", lease_seconds: float = 1800.0, max_attempts: int = 3,
+                 owner: str = None):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self.lock = threading.Lock()
+        # 다른 프로세스와의 트랜잭션은 BEGIN IMMEDIATE로 직접 관리
+        self.conn = sqlite3.connect(db_path, timeout=60, check_same_thread=False, isolation_level=None)
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id INTEGER PRIMARY KEY,
+                    product_code TEXT NOT NULL,
+                    product_url TEXT NOT NULL,
+                    product_name TEXT NOT NULL,
+                    start_page INTEGER NOT NULL,
+                    end_page INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    updated_at REAL,
+                    UNIQUE (product_code, start_page)
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, lease_expires)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS product_ends (
+                    product_code TEXT PRIMARY KEY,
+                    empty_from_page INTEGER NOT NULL
+                )
+            """)
+            # 상품별 결과 스트림 파일과, 모든 구간이 끝나 xlsx 변환을 맡은 작업자가 정해진 상품
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS product_outputs (
+                    product_code TEXT NOT NULL,
+                    output_file TEXT NOT NULL,
+                    PRIMARY KEY (product_code, output_file)
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS finished_products (
+                    product_code TEXT PRIMARY KEY,
+                    finished_at REAL NOT NULL
+                )
+            """)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """프로세스 간 쓰기 잠금을 잡은 트랜잭션"""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def seed(self, products: list, max_pages: int, pages_per_task: int = 30, plan_pages=None) -> int:
+        """카탈로그 상품들의 구간 작업 생성 (이미 있는 작업은 그대로 두므로 여러 프로세스가 호출해도 안전)
+
+        plan_pages(product)가 페이지 수를 돌려주면 그 페이지까지만 작업을 만든다 (크롤링 계획).
+        """
+        pages_per_task = max(1, pages_per_task)
+        rows = []
+        for product in products:
+            url = product['url'].split('#')[0]
+            prod_code = Coupang.get_product_code(url=url)
+            product_pages = (plan_pages(product) if plan_pages else None) or max_pages
+            for start_page in range(1, product_pages + 1, pages_per_task):
+                end_page = min(start_page + pages_per_task - 1, product_pages)
+                rows.append((prod_code, url, product['name'], start_page, end_page, time.time()))
+
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO tasks (product_code, product_url, product_name, start_page, end_page, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            added = conn.total_changes - before
+            # 구간 작업이 새로 생긴 상품은 다시 끝날 때 xlsx를 새로 변환
+            conn.execute("""
+                DELETE FROM finished_products WHERE product_code IN (
+                    SELECT product_code FROM tasks WHERE status IN ('pending', 'leased')
+                )
+            """)
+            return added
+
+    def acquire(self, worker_name: str = None):
+        """처리할 작업 1개를 임대해 반환 (남은 작업이 없으면 None)"""
+        owner = f"{self.owner}:{worker_name}" if worker_name else self.owner
+        now = time.time()
+        with self.transaction() as conn:
+            # 리뷰 끝 이후 구간은 건너뛰고, 임대 만료 후 시도 횟수를 다 쓴 작업은 실패 처리
+            conn.execute("""
+                UPDATE tasks SET status = 'skipped', lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE status IN ('pending', 'leased') AND start_page >= (
+                    SELECT empty_from_page FROM product_ends WHERE product_ends.product_code = tasks.product_code
+                )
+            """, (now,))
+            conn.execute("""
+                UPDATE tasks SET status = 'failed', lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """, (now, now, self.max_attempts))
+
+            row = conn.execute("""
+                SELECT task_id, product_code, product_url, product_name, start_page, end_page, attempts FROM tasks
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY start_page, task_id LIMIT 1
+            """, (now,)).fetchone()
+            if row is None:
+                return None
+
+            conn.execute("""
+                UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_owner = ?, lease_expires = ?,
+                    updated_at = ?
+                WHERE task_id = ?
+            """, (owner, now + self.lease_seconds, now, row[0]))
+
+        return {
+            "task_id": row[0], "product_code": row[1], "url": row[2], "name": row[3],
+            "start_page": row[4], "end_page": row[5], "attempt": row[6] + 1, "owner": owner,
+        }
+
+    def complete(self, task: dict, empty_from_page: int = None, output_file: str = None) -> list:
+        """작업 완료 기록 (empty_from_page: 이 페이지부터 리뷰가 없음을 확인했으면 그 페이지)
+
+        이 작업으로 상품의 모든 구간이 끝났으면 상품의 결과 스트림 파일 목록을 반환한다 (xlsx 변환용, 상품마다 한 번).
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute("""
+                UPDATE tasks SET status = 'done', lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE task_id = ? AND lease_owner = ?
+            """, (now, task["task_id"], task["owner"]))
+            if empty_from_page is not None:
+                conn.execute("""
+                    INSERT INTO product_ends (product_code, empty_from_page) VALUES (?, ?)
+                    ON CONFLICT(product_code) DO UPDATE SET
+                        empty_from_page = MIN(empty_from_page, excluded.empty_from_page)
+                """, (task["product_code"], empty_from_page))
+                # 리뷰 끝 이후 구간은 다음 임대를 기다리지 않고 바로 건너뜀 (상품이 끝났는지 판단하기 위해)
+                conn.execute("""
+                    UPDATE tasks SET status = 'skipped', lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                    WHERE product_code = ? AND status IN ('pending', 'leased') AND start_page >= (
+                        SELECT empty_from_page FROM product_ends WHERE product_code = ?
+                    )
+                """, (now, task["product_code"], task["product_code"]))
+            return self._finish_product(conn, task["product_code"], output_file)
+
+    def fail(self, task: dict, output_file: str = None) -> list:
+        """작업 실패 기록 (시도 횟수가 남았으면 다시 대기열로, 상품의 모든 구간이 끝났으면 결과 파일 목록 반환)"""
+        with self.transaction() as conn:
+            conn.execute("""
+                UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE task_id = ? AND lease_owner = ?
+            """, (self.max_attempts, time.time(), task["task_id"], task["owner"]))
+            return self._finish_product(conn, task["product_code"], output_file)
+
+    @staticmethod
+    def _finish_product(conn, prod_code: str, output_file: str = None) -> list:
+        """결과 파일을 기록하고, 상품의 남은 구간이 없으면 처음 확인한 작업자에게만 결과 파일 목록 반환"""
+        if output_file:
+            conn.execute("INSERT OR IGNORE INTO product_outputs (product_code, output_file) VALUES (?, ?)",
+                         (prod_code, output_file))
+        remaining = conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE product_code = ? AND status IN ('pending', 'leased')", (prod_code,)
+        ).fetchone()[0]
+        if remaining:
+            return []
+        claimed = conn.execute("INSERT OR IGNORE INTO finished_products (product_code, finished_at) VALUES (?, ?)",
+                               (prod_code, time.time())).rowcount
+        if not claimed:
+            return []
+        return [row[0] for row in conn.execute(
+            "SELECT output_file FROM product_outputs WHERE product_code = ? ORDER BY output_file", (prod_code,)
+        )]
+
+    def release(self, task: dict) -> None:
+        """처리하지 못한 작업을 시도 횟수 차감 없이 대기열로 되돌림 (크롤링 예산 소진 등)"""
+        with self.transaction() as conn:
+            conn.execute("""
+                UPDATE tasks SET status = 'pending', attempts = MAX(attempts - 1, 0),
+                    lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE task_id = ? AND lease_owner = ?
+            """, (time.time(), task["task_id"], task["owner"]))
+
+    def get_counts(self) -> dict:
+        """상태별 작업 수"""
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        counts = {"pending": 0, "leased": 0, "done": 0, "skipped": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class ReviewDeduplicator:
+    """v1.8: 저장 전 리뷰 중복 제거용 Bloom 필터 (실행 간 파일로 유지)
+
+    리뷰 키(체크포인트와 같은 상품코드, 작성자, 작성일자, 별점, 헤드라인, 본문 해시)를 비트 배열에 기록하여 페이지가 밀리거나,
+    프록시 교체 후 같은 페이지를 다시 받거나, 상품을 다시 크롤링할 때 같은 리뷰가 두 번 저장되지 않게 한다.
+    기본 설정(200만 개, 오탐률 1e-6)에서 약 7MB이며, 오탐이면 새 리뷰가 버려지므로 오탐률은 낮게 유지한다.
+    """
+
+    MAGIC = b"CPRVBF03"  # 03: 체크포인트 리뷰 키로 해시 (이전 형식 필터는 새로 만듦)
+    HEADER = struct.Struct("<QQQ")  # 비트 수, 해시 함수 수, 기록된 리뷰 수
+
+    def __init__(self, file_path="data/review_dedup.bloom", capacity: int = 2_000_000, error_rate: float = 1e-6):
+        self.file_path = file_path
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.count = 0
+        self.dirty = False
+        self._capacity_warned = False
+
+        if not self.load():
+            self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+            self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+            self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def load(self) -> bool:
+        """저장된 필터 로드 (없거나 손상되었으면 False)"""
+        if not self.file_path or not os.path.exists(self.file_path):
+            return False
+        try:
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+            if not data.startswith(self.MAGIC):
+                raise ValueError("파일 형식이 다릅니다")
+            num_bits, num_hashes, count = self.HEADER.unpack_from(data, len(self.MAGIC))
+            bits = bytearray(data[len(self.MAGIC) + self.HEADER.size:])
+            if len(bits) != (num_bits + 7) // 8:
+                raise ValueError("비트 배열 크기가 맞지 않습니다")
+        except Exception as e:
+            print(f"[WARNING] 리뷰 중복 제거 필터 로드 실패, 새로 만듭니다: {e}")
+            return False
+
+        self.num_bits, self.num_hashes, self.count, self.bits = num_bits, num_hashes, count, bits
+        print(f"[INFO] 리뷰 중복 제거 필터 로드: 리뷰 {count}개 ({self.file_path})")
+        return True
+
+    def save(self) -> None:
+        """변경된 필터를 파일에 기록 (임시 파일에 쓴 뒤 교체)"""
+        with self.lock:
+            if not self.dirty or not self.file_path:
+                return
+            try:
+                file_dir = os.path.dirname(self.file_path)
+                if file_dir and not os.path.exists(file_dir):
+                    os.makedirs(file_dir)
+                tmp_file = f"{self.file_path}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(self.MAGIC)
+                    f.write(self.HEADER.pack(self.num_bits, self.num_hashes, self.count))
+                    f.write(self.bits)
+                os.replace(tmp_file, self.file_path)
+                self.dirty = False
+            except Exception as e:
+                print(f"[WARNING] 리뷰 중복 제거 필터 저장 실패: {e}")
+
+    @staticmethod
+    def make_digest(prod_code: str, review: dict) -> bytes:
+        # 체크포인트와 같은 리뷰 키를 써야 두 중복 제거가 같은 리뷰를 같은 리뷰로 판단함
+        review_key = CrawlCheckpoint.make_review_key(prod_code, review)
+        return hashlib.blake2b(review_key.encode("ascii"), digest_size=16).digest()
+
+    def _positions(self, digest: bytes):
+        # 이중 해싱: h1 + i * h2 (h2는 홀수로 만들어 모든 위치를 돌 수 있게 함)
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, prod_code: str, review: dict) -> bool:
+        """처음 보는 리뷰면 기록하고 True, 이미 본 리뷰면 False"""
+        positions = self._positions(self.make_digest(prod_code, review))
+        with self.lock:
+            if all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in positions):
+                return False
+            for pos in positions:
+                self.bits[pos >> 3] |= 1 << (pos & 7)
+            self.count += 1
+            self.dirty = True
+            if self.count > self.capacity and not self._capacity_warned:
+                self._capacity_warned = True
+                print(f"[WARNING] 리뷰 중복 제거 필터가 설계 용량({self.capacity}개)을 넘어 오탐률이 높아집니다.")
+        return True
+
+    def filter_new(self, prod_code: str, reviews: list) -> list:
+        """처음 보는 리뷰만 남긴 목록 반환 (같은 목록 안의 중복도 제거)"""
+        return [review for review in reviews if self.add(prod_code, review)]
+
+
+class HtmlArchive:
+    """v1.8: 리뷰 페이지 원본 HTML 압축 보관소 (내용 주소 방식)
+
+    HTML은 sha256 해시를 이름으로 objects/{앞 2자리}/{해시}.html.zst 에 한 번만 저장하고
+    (zstandard가 없으면 gzip, .html.gz), 어떤 상품의 몇 페이지를 언제 받았는지는 SQLite 색인에 기록한다.
+    추출 로직이 바뀌면 reextract_reviews.py로 네트워크 없이 보관소 전체를 다시 파싱할 수 있다.
+    """
+
+    def __init__(self, archive_dir="data/html_archive", compression_level: int = 10):
+        self.archive_dir = archive_dir
+        self.compression = "zst" if ZSTD_AVAILABLE else "gz"
+        self.compression_level = compression_level
+        os.makedirs(os.path.join(archive_dir, "objects"), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(archive_dir, "index.sqlite3"), check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    product_code TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    compression TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    ratings TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            # 별점 샤딩 이전에 만든 색인에는 ratings 컬럼이 없음
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(pages)")}
+            if "ratings" not in columns:
+                self.conn.execute("ALTER TABLE pages ADD COLUMN ratings TEXT NOT NULL DEFAULT ''")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_product ON pages (product_code, page)")
+
+    def object_path(self, sha256: str, compression: str) -> str:
+        return os.path.join(self.archive_dir, "objects", sha256[:2], f"{sha256}.html.{compression}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.compression == "zst":
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        return gzip.compress(data, compresslevel=min(self.compression_level, 9))
+
+    @staticmethod
+    def decompress(data: bytes, compression: str) -> bytes:
+        if compression == "zst":
+            if not ZSTD_AVAILABLE:
+                raise ImportError("zstandard가 설치되지 않아 .zst 보관 파일을 읽을 수 없습니다. pip install zstandard")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def store(self, prod_code: str, page: int, html: str, rating: str = "") -> str:
+        """HTML 보관 (같은 내용은 한 번만 저장) 후 해시 반환 (rating: 별점 샤딩 스트림의 ratings 값)"""
+        data = html.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.object_path(sha256, self.compression)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self.compress(data))
+            os.replace(tmp_path, path)
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO pages (product_code, page, sha256, compression, fetched_at, ratings) VALUES (?, ?, ?, ?, ?, ?)",
+                (str(prod_code), int(page), sha256, self.compression, time.time(), str(rating or ""))
+            )
+        return sha256
+
+    def load(self, sha256: str, compression: str) -> str:
+        with open(self.object_path(sha256, compression), 'rb') as f:
+            return self.decompress(f.read(), compression).decode("utf-8")
+
+    def get_latest_pages(self) -> dict:
+        """상품코드 -> [(별점, 페이지, 해시, 압축 방식), ...] (스트림/페이지마다 가장 최근에 받은 HTML, 스트림/페이지 순)"""
+        with self.lock:
+            rows = self.conn.execute("""
+                SELECT product_code, ratings, page, sha256, compression FROM pages AS p
+                WHERE fetched_at = (
+                    SELECT MAX(fetched_at) FROM pages
+                    WHERE product_code = p.product_code AND ratings = p.ratings AND page = p.page
+                )
+                ORDER BY product_code, ratings, page
+            """).fetchall()
+
+        products = {}
+        for prod_code, rating, page, sha256, compression in rows:
+            products.setdefault(prod_code, []).append((rating, page, sha256, compression))
+        return products
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class CrawlTelemetry:
+    """v1.8: 크롤링 단계별 지연 히스토그램과 이벤트 카운터
+
+    단계(stage)별 소요 시간을 고정 버킷 히스토그램으로, 403/빈 페이지/타임아웃/프록시 교체 등은
+    카운터로 집계하고 interval초마다 output_file에 기록한다.
+    확장자가 .prom이면 Prometheus 텍스트 형식, 그 외에는 JSON으로 기록한다.
+
+    단계:
+        connect    요청 전송부터 응답 헤더 수신까지 (연결 수립, 프록시, 서버 처리 포함)
+        download   응답 본문 수신
+        parse      리뷰 HTML 파싱
+        store      리뷰 저장 (SaveData)
+        checkpoint 체크포인트 기록 (flush + SQLite 커밋)
+        archive    원본 HTML 압축 보관
+        sleep      재시도/세션 예열 대기
+        pace       적응형 요청 간격(AdaptivePacer) 대기
+        rate_limit 전역 속도 제한기 대기
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    COUNTERS = (
+        "requests", "review_requests", "pages", "reviews", "http_403", "http_error", "empty_pages", "blocked_pages",
+        "timeouts", "network_errors", "proxy_swaps", "warm_ups", "duplicate_reviews",
+    )
+
+    def __init__(self, output_file="data/crawl_metrics.json", interval: float = 30.0):
+        self.output_file = output_file
+        self.interval = interval
+        self.started_at = time.time()
+
+        self.lock = threading.Lock()
+        self.counters = {name: 0 for name in self.COUNTERS}
+        self.histograms = {}  # stage -> {"counts": 버킷별 개수(+Inf 포함), "sum", "count", "max"}
+
+        self._closed = threading.Event()
+        self._writer = None
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간 기록"""
+        seconds = max(0.0, seconds)
+        idx = bisect.bisect_left(self.BUCKETS, seconds)
+        with self.lock:
+            hist = self.histograms.get(stage)
+            if hist is None:
+                hist = {"counts": [0] * (len(self.BUCKETS) + 1), "sum": 0.0, "count": 0, "max": 0.0}
+                self.histograms[stage] = hist
+            hist["counts"][idx] += 1
+            hist["sum"] += seconds
+            hist["count"] += 1
+            hist["max"] = max(hist["max"], seconds)
+
+    @contextlib.contextmanager
+    def timer(self, stage: str):
+        """with 블록의 소요 시간을 stage에 기록"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start_time)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def get_counter(self, name: str) -> int:
+        with self.lock:
+            return self.counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """현재 집계값 (히스토그램 버킷은 누적 개수)"""
+        with self.lock:
+            histograms = {}
+            for stage, hist in self.histograms.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.BUCKETS + (float("inf"),), hist["counts"]):
+                    cumulative += count
+                    buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+                histograms[stage] = {
+                    "count": hist["count"],
+                    "sum": round(hist["sum"], 6),
+                    "mean": round(hist["sum"] / hist["count"], 6) if hist["count"] else 0.0,
+                    "max": round(hist["max"], 6),
+                    "buckets": buckets,
+                }
+            return {
+                "updated_at": time.time(),
+                "uptime_seconds": round(time.time() - self.started_at, 3),
+                "counters": dict(self.counters),
+                "dedup_rate": round(self.get_dedup_rate(), 6),
+                "histograms": histograms,
+            }
+
+    def get_dedup_rate(self) -> float:
+        """받은 리뷰 중 중복으로 버린 비율"""
+        duplicates = self.counters.get("duplicate_reviews", 0)
+        fetched = self.counters.get("reviews", 0) + duplicates
+        return duplicates / fetched if fetched else 0.0
+
+    def to_prometheus(self, snapshot: dict = None) -> str:
+        """Prometheus 텍스트 형식으로 변환"""
+        snapshot = snapshot or self.snapshot()
+        lines = [
+            "# HELP coupang_crawl_events_total Crawl event counters.",
+            "# TYPE coupang_crawl_events_total counter",
+        ]
+        for name, value in snapshot["counters"].items():
+            lines.append(f'coupang_crawl_events_total{{event="{name}"}} {value}')
+
+        lines += [
+            "# HELP coupang_crawl_stage_seconds Time spent per crawl stage.",
+            "# TYPE coupang_crawl_stage_seconds histogram",
+        ]
+        for stage, hist in snapshot["histograms"].items():
+            for bound, count in hist["buckets"].items():
+                lines.append(f'coupang_crawl_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+            lines.append(f'coupang_crawl_stage_seconds_sum{{stage="{stage}"}} {hist["sum"]}')
+            lines.append(f'coupang_crawl_stage_seconds_count{{stage="{stage}"}} {hist["count"]}')
+
+        lines += [
+            "# HELP coupang_crawl_uptime_seconds Seconds since telemetry started.",
+            "# TYPE coupang_crawl_uptime_seconds gauge",
+            f"coupang_crawl_uptime_seconds {snapshot['uptime_seconds']}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """output_file에 현재 집계값 기록 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 잘린 파일을 보지 않음)"""
+        if not self.output_file:
+            return
+        try:
+            out_dir = os.path.dirname(self.output_file)
+            if out_dir and not os.path.exists(out_dir):
+                os.makedirs(out_dir)
+
+            snapshot = self.snapshot()
+            if self.output_file.endswith(".prom"):
+                content = self.to_prometheus(snapshot)
+            else:
+                content = json.dumps(snapshot, ensure_ascii=False, indent=2)
+
+            tmp_file = f"{self.output_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_file, self.output_file)
+        except Exception as e:
+            print(f"[WARNING] 텔레메트리 기록 실패: {e}")
+
+    def start(self) -> None:
+        """interval초마다 파일에 기록하는 백그라운드 스레드 시작"""
+        if self._writer or not self.interval or self.interval <= 0:
+            return
+        self._closed.clear()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def _write_loop(self) -> None:
+        while not self._closed.wait(self.interval):
+            self.write()
+
+    def close(self) -> None:
+        """기록 스레드를 멈추고 마지막 값을 기록"""
+        self._closed.set()
+        if self._writer:
+            self._writer.join(timeout=5)
+            self._writer = None
+        self.write()
+
+    def print_summary(self) -> None:
+        """단계별 시간 합계와 카운터 출력"""
+        snapshot = self.snapshot()
+        print("\n" + "=" * 70)
+        print("⏱️ 단계별 소요 시간")
+        print("=" * 70)
+        total = sum(hist["sum"] for hist in snapshot["histograms"].values()) or 1e-9
+        for stage, hist in sorted(snapshot["histograms"].items(), key=lambda item: -item[1]["sum"]):
+            print(f"{stage:<11} 합계 {hist['sum']:>9.1f}초 ({hist['sum'] / total * 100:5.1f}%) | "
+                  f"{hist['count']:>6}회 | 평균 {hist['mean'] * 1000:>8.1f}ms | 최대 {hist['max'] * 1000:>8.1f}ms")
+        print("-" * 70)
+        print(" | ".join(f"{name} {value}" for name, value in snapshot["counters"].items()))
+        print(f"🧹 중복 리뷰 제거율: {snapshot['dedup_rate'] * 100:.2f}% "
+              f"({snapshot['counters'].get('duplicate_reviews', 0)}개)")
+        if self.output_file:
+            print(f"📈 텔레메트리 파일: {self.output_file}")
+        print("=" * 70)
+
+
 class Coupang:
     @staticmethod
     def get_product_code(url: str) -> str:
@@ -377,27 +2079,62 @@ class Coupang:
         return bs(resp.text, "html.parser")
 
     def __del__(self) -> None:
-        if hasattr(self, 'ch') and self.ch.driver:
-            self.ch.driver.quit()
-
-    def __init__(self, proxy_list=None) -> None:
+        # ch 프로퍼티를 거치면 브라우저가 새로 시작되므로 이미 시작된 드라이버만 종료
+        if getattr(self, '_ch', None) and self._ch.driver:
+            self._ch.driver.quit()
+        if hasattr(self, 'proxy_rotator'):
+            self.proxy_rotator.close_all_sessions()
+
+    def __init__(self, proxy_list=None, url_manager=None, rate_limiter=None, checkpoint=None,
+                 use_browser=True, telemetry=None, pacer=None, cookie_cache=None, html_archive=None,
+                 review_dedup=None, block_classifier=None, use_checkpoint=False, use_html_archive=False,
+                 use_review_dedup=False) -> None:
         # delay 관련 설정
-        self.base_review_url: str = "https://www.coupang.com/vp/product/reviews"
+        self.base_url: str = "https://www.coupang.com"  # v1.8: 리플레이 서버 등으로 교체 가능
+        self.base_review_url: str = f"{self.base_url}/vp/product/reviews"
         self.retries = 10  # 재시도 횟수 줄임
         self.delay_min = 1.0  # 최소 딜레이 증가
         self.delay_max = 2.0  # 최대 딜레이 증가
-        self.page_delay_min = 0.0  # 페이지 간 최소 딜레이 증가
-        self.page_delay_max = 0.0  # 페이지 간 최대 딜레이 증가
         self.max_pages = 150  # v1.6: 최대 페이지를 300으로 제한
+        self.warm_up_delay_min = 2.0  # 세션 예열 시 메인 페이지 방문 후 최소 대기
+        self.warm_up_delay_max = 4.0  # 세션 예열 시 메인 페이지 방문 후 최대 대기
+        self.prefetch_window = 2  # v1.8: 상품 내 동시에 요청해 둘 페이지 수 (1이면 순차 요청)
+
+        # v1.8: 리뷰 HTML 파서 백엔드 ("auto", "selectolax", "lxml", "bs4")
+        self.parser_backend = "auto"
+        self.review_parser = get_review_parser(self.parser_backend)
+
+        # v1.8: 응답 분류기 - 모든 페이지에서 차단 응답이면 파싱 없이 바로 프록시를 교체 (동시 크롤링 시 작업자들이 공유)
+        self.block_classifier = block_classifier if block_classifier else BlockPageClassifier()
+
+        # v1.8: 요청 백엔드 ("requests": 스레드 + requests.Session, "httpx": asyncio + 프록시별 연결 풀)
+        self.fetch_backend = "requests"
+        self.async_max_in_flight = 200  # httpx 백엔드에서 동시에 진행할 최대 요청 수
+        self.async_max_products = 20  # httpx 백엔드에서 동시에 크롤링할 최대 상품 수
+        self.async_max_requests_per_sec = 5.0  # httpx 백엔드의 전체 초당 요청 수
+
+        # v1.8: 저장 방식 설정 ("xlsx": 행마다 통파일 저장, "csv"/"jsonl": 스트리밍 append)
+        # 기본값은 기존과 같은 xlsx이며, 스트리밍 저장은 sink_format을 바꿔 사용
+        self.sink_format = "xlsx"
+        self.sink_batch_size = 100  # 몇 행마다 디스크에 기록할지
+        self.sink_flush_interval = 5.0  # 배치가 차지 않아도 몇 초마다 기록할지
+        self.sink_export_xlsx = True  # 상품 완료 시 xlsx로 변환
 
         # 타임아웃 관련 설정
         self.consecutive_timeouts = 0
-        self.max_consecutive_timeouts = 5  # 연속 타임아웃 허용 횟수 감소
-        self.long_wait_min = 10  # 긴 대기 시간 줄임 (5분)
-        self.long_wait_max = 15  # 긴 대기 시간 줄임 (7분)
-
-        # 프록시 로테이터 초기화
-        self.proxy_rotator = ProxyRotator(proxy_list)
+        self.max_consecutive_timeouts = 5  # 직접 연결일 때 연속 타임아웃 허용 횟수
+        self.long_wait_min = 10  # 전체 대기 최소 시간(초)
+        self.long_wait_max = 15  # 전체 대기 최대 시간(초)
+        self.global_backoff_ratio = 0.8  # v1.8: 회로가 열린 프록시가 이 비율 이상일 때만 전체 대기
+
+        # 프록시 로테이터 초기화 (v1.8: 프록시별 연결 풀 세션을 소유)
+        self.session_pool_size = 10  # 프록시별 최대 keep-alive 연결 수
+        self.session_idle_timeout = 300  # 이 시간(초) 이상 쓰지 않은 프록시 세션은 닫음
+        self.proxy_rotator = ProxyRotator(
+            proxy_list,
+            pool_size=self.session_pool_size,
+            session_idle_timeout=self.session_idle_timeout,
+        )
 
         # Windows 제외 User-Agent 초기화
         self.ua = NonWindowsUserAgent()
@@ -419,17 +2156,124 @@ class Coupang:
             "dnt": "1",
         }
 
-        # 쿠키 저장용 세션
-        self.session = rq.Session()
+        # v1.8: 프록시별 예열 쿠키 캐시 (상품마다 예열하지 않고 쿠키가 없거나 오래되었을 때만 예열)
+        self.cookie_ttl = 1800.0
+        self.cookie_cache = cookie_cache if cookie_cache else CookieJarCache(self.cookie_ttl)
 
         # 헤더에 랜덤 User-Agent 적용
         self.update_headers()
 
-        self.ch = ChromeDriver(self.proxy_rotator)
+        # v1.8: 리뷰 페이지는 모두 requests로 가져오므로 Chrome은 실제로 필요한 코드가 ch에 처음 접근할 때 시작
+        # use_browser=False이면 requests 전용 모드 (Chrome/Selenium 없이 실행, ch는 항상 None)
+        self.use_browser = use_browser
+        self._ch = None
+        self.browser_lock = threading.Lock()
         self.page_title = None
 
-        # v1.6: URL 매니저 초기화
-        self.url_manager = URLManager()
+        # v1.6: URL 매니저 초기화 (v1.8: 동시 크롤링 시 작업자들이 같은 매니저를 공유)
+        self.url_manager = url_manager if url_manager else URLManager()
+
+        # v1.8: 전역 요청 속도 제한기 (동시 크롤링 시 모든 작업자가 공유)
+        self.rate_limiter = rate_limiter
+
+        # v1.8: 페이지/상품 간 고정 대기 대신 AIMD 적응형 요청 간격 (동시 크롤링 시 작업자들이 공유)
+        # 성공하면 점점 빨라지고 403/차단/빈 페이지/타임아웃이면 간격을 크게 늘림
+        # 간격 하한은 프록시(직접 연결이면 연결 하나)별로 적용되며, 전체 초당 요청 수 상한은 rate_limiter가 정한다
+        # (둘 다 지키므로 더 느린 쪽이 적용됨: 프록시 N개면 pacer 상한은 초당 N / pace_min_interval회)
+        self.pace_min_interval = 0.2  # 프록시별 요청 간격 하한(초)
+        self.pace_max_interval = 30.0  # 요청 간격 상한(초)
+        self.pace_initial_interval = 1.0  # 시작 요청 간격(초)
+        self.pacer = pacer if pacer else AdaptivePacer(
+            min_interval=self.pace_min_interval,
+            max_interval=self.pace_max_interval,
+            initial_interval=self.pace_initial_interval,
+        )
+
+        # v1.8: 작업자별 처리량 집계용 통계
+        self.crawl_stats = {"requests": 0, "pages": 0, "reviews": 0, "duplicates": 0}
+        self.stats_lock = threading.Lock()  # 미리 요청하는 페이지 스레드/별점 스트림이 동시에 갱신
+
+        # v1.8: 단계별 지연 히스토그램/이벤트 카운터 (동시 크롤링 시 작업자들이 공유)
+        # 파일 확장자가 .prom이면 Prometheus 텍스트 형식, 그 외에는 JSON으로 telemetry_interval초마다 기록
+        self.telemetry_file = "data/crawl_metrics.json"
+        self.telemetry_interval = 30.0
+        self.telemetry = telemetry if telemetry else CrawlTelemetry(self.telemetry_file, self.telemetry_interval)
+
+        # v1.8: 재시작 가능한 체크포인트 (동시 크롤링 시 작업자들이 공유)
+        # 체크포인트/리뷰 중복 제거/HTML 보관소는 생성자에서 켜고 끄며(use_*, 기본은 꺼짐), 켜져 있고 전달받지 않았을 때만 기본 경로로 만든다.
+        # 다른 경로를 쓰려면 인스턴스를 직접 전달 (작업자는 항상 전달받은 공유 인스턴스만 사용)
+        self.checkpoint = checkpoint
+        if self.checkpoint is None and use_checkpoint:
+            self.checkpoint = CrawlCheckpoint()
+        self.use_checkpoint = self.checkpoint is not None
+
+        # v1.8: 저장 전 리뷰 중복 제거 (Bloom 필터, 실행 간 유지, 동시 크롤링 시 작업자들이 공유)
+        self.review_dedup = review_dedup
+        if self.review_dedup is None and use_review_dedup:
+            self.review_dedup = ReviewDeduplicator()
+        self.use_review_dedup = self.review_dedup is not None
+
+        # v1.8: 크롤링 계획 - 카탈로그의 리뷰 수로 상품별 페이지 수(리뷰 수 / 페이지 크기)를 정해 그만큼만 요청
+        # (리뷰 끝을 연속 빈 페이지로 확인하지 않음). 카탈로그 수집 이후 늘어난 리뷰를 위해 review_plan_margin_pages만큼 더 요청
+        self.use_review_plan = True
+        self.review_plan_margin_pages = 1
+
+        # v1.8: 별점 샤딩 - 상품을 별점(1~5)별 리뷰 스트림으로 나눠 동시에 크롤링하고 하나의 파일로 합침
+        # (리뷰가 많은 상품이 max_pages에서 잘리지 않고, 스트림 5개를 병렬로 처리)
+        self.rating_shards = False
+        self.store_lock = threading.Lock()
+
+        # v1.8: 공유 작업 큐 (start_queue) - 여러 프로세스/머신이 같은 큐 파일로 (상품, 페이지 구간) 작업을 나눠 처리
+        self.work_queue_file = "data/crawl_queue.sqlite3"
+        self.work_queue_pages_per_task = 30
+        self.work_queue_lease_seconds = 1800.0
+        self.work_queue_max_attempts = 3
+
+        # v1.8: 증분 모드 - 체크포인트의 리뷰 키(이전 실행에서 저장한 리뷰)를 색인으로 사용해
+        # 페이지 전체가 이미 수집된 리뷰이면 해당 상품의 나머지 페이지는 요청하지 않음
+        self.incremental = False
+
+        # v1.8: 우선순위 스케줄 - 남은 상품을 요청당 예상 신규 리뷰 수 순으로 크롤링
+        # (카탈로그 리뷰 수, 마지막 크롤링 이후 경과 시간, 체크포인트의 과거 수집량으로 추정)
+        # 시간/요청 예산을 정하면 예산을 다 쓴 시점에 멈추고 남은 상품/페이지는 다음 실행에서 이어서 크롤링
+        # 기본값은 기존처럼 카탈로그 순서대로 크롤링 (예산은 우선순위 스케줄과 관계없이 적용)
+        self.use_priority_schedule = False
+        self.crawl_time_budget = None  # 초 (None이면 제한 없음)
+        self.crawl_request_budget = None  # 리뷰 페이지 요청 수 (None이면 제한 없음)
+        self.review_rate_prior_days = 365.0  # 한 번만 크롤링한 상품은 수집한 리뷰가 이 기간 동안 쌓였다고 보고 증가 속도 추정
+        self.crawl_deadline_at = None
+        self.budget_request_start = 0
+        self.budget_stopped = False  # 마지막 상품/구간 크롤링이 예산 소진으로 중간에 멈췄는지
+        self.crawl_completed = False  # 마지막 상품/구간 크롤링이 실제 끝(리뷰 끝/구간 끝 등)까지 진행됐는지
+
+        # v1.8: 녹화 모드 - 지정하면 리뷰 페이지 응답을 {record_dir}/{상품코드}/page_NNNN.html로 저장 (리플레이 서버용)
+        self.record_dir = None
+
+        # v1.8: 받은 리뷰 페이지 원본 HTML을 압축 보관 (추출 로직 변경 시 reextract_reviews.py로 재추출)
+        self.html_archive = html_archive
+        if self.html_archive is None and use_html_archive:
+            self.html_archive = HtmlArchive()
+        self.use_html_archive = self.html_archive is not None
+
+        # v1.8: 현재 요청 중인 프록시들 (미리 요청하는 페이지는 다른 프록시를 사용)
+        self.in_flight_proxies = set()
+
+    @property
+    def ch(self):
+        """Selenium 드라이버 (처음 접근할 때 시작, requests 전용 모드면 None)"""
+        if self._ch is None and self.use_browser:
+            with self.browser_lock:
+                if self._ch is None:
+                    print("[INFO] Chrome 브라우저 시작...")
+                    self._ch = ChromeDriver(self.proxy_rotator)
+        return self._ch
+
+    def close_browser(self) -> None:
+        """시작된 브라우저가 있으면 종료"""
+        with self.browser_lock:
+            if self._ch and self._ch.driver:
+                self._ch.driver.quit()
+            self._ch = None
 
     def get_realistic_headers(self):
         """실제 브라우저와 유사한 헤더 생성 (Windows 제외)"""
@@ -472,58 +2316,143 @@ class Coupang:
         self.headers = self.get_realistic_headers()
         print(f"[DEBUG] 헤더 User-Agent 업데이트: {self.headers['user-agent'][:70]}...")
 
-    def get_session_with_proxy(self):
-        """프록시가 적용된 requests 세션 반환"""
-        session = rq.Session()
-        session.headers.update(self.headers)
-
-        # 더 현실적인 타임아웃 설정
-        session.timeout = (10, 30)  # 연결 타임아웃 10초, 읽기 타임아웃 30초
+    def record_response(self, payload: dict, html: str) -> None:
+        """리뷰 페이지 응답(200)을 HTML 보관소에 저장하고, 녹화 모드면 디스크에도 그대로 저장"""
+        if self.html_archive:
+            try:
+                with self.telemetry.timer("archive"):
+                    self.html_archive.store(payload["productId"], payload["page"], html, payload.get("ratings", ""))
+            except Exception as e:
+                print(f"[WARNING] HTML 보관 실패: {e}")
 
+        if not self.record_dir:
+            return
+        try:
+            product_dir = os.path.join(self.record_dir, str(payload["productId"]))
+            os.makedirs(product_dir, exist_ok=True)
+            rating = payload.get("ratings", "")
+            suffix = f"_r{rating}" if rating else ""  # 별점 스트림 페이지는 전체 스트림 페이지와 구분
+            file_name = os.path.join(product_dir, f"page_{int(payload['page']):04d}{suffix}.html")
+            with open(file_name, 'w', encoding='utf-8') as f:
+                f.write(html)
+        except Exception as e:
+            print(f"[WARNING] 응답 녹화 실패: {e}")
+
+    def set_parser_backend(self, name: str) -> None:
+        """리뷰 HTML 파서 백엔드 변경 ("auto", "selectolax", "lxml", "bs4")"""
+        self.review_parser = get_review_parser(name)
+        self.parser_backend = name
+        print(f"[INFO] 리뷰 파서 백엔드: {self.review_parser.name}")
+
+    def wait_for_rate_limit(self, proxy=None, review_page: bool = False):
+        """전역 속도 제한기가 있으면 요청 전에 토큰 대기 후, 적응형 요청 간격(전역 + 프록시별)만큼 대기
+
+        review_page이면 리뷰 페이지 요청으로도 집계한다 (요청 예산은 세션 예열을 빼고 리뷰 페이지 요청만 셈).
+        """
+        if self.rate_limiter:
+            with self.telemetry.timer("rate_limit"):
+                self.rate_limiter.acquire()
+        self.telemetry.observe("pace", self.pacer.wait(proxy))
+        self.add_crawl_stat("requests")
+        self.telemetry.increment("requests")
+        if review_page:
+            self.telemetry.increment("review_requests")
+
+    def add_crawl_stat(self, name: str, value: int = 1) -> None:
+        """작업자별 통계 증가 (여러 스레드에서 호출되므로 잠금 안에서 갱신)"""
+        with self.stats_lock:
+            self.crawl_stats[name] += value
+
+    def pause(self, seconds: float) -> None:
+        """대기 (대기 시간은 텔레메트리의 sleep 단계로 기록)"""
+        if seconds <= 0:
+            return
+        self.telemetry.observe("sleep", seconds)
+        time.sleep(seconds)
+
+    def get_session_with_proxy(self, exclude=()):
+        """프록시별 연결 풀 세션과 사용한 프록시 반환 (exclude: 가급적 피할 프록시들)
+
+        v1.8: 세션은 ProxyRotator가 프록시별로 재사용하므로 헤더/쿠키는 세션에 넣지 않고 요청마다 전달한다.
+        """
+        proxy = None
         if self.proxy_rotator and self.proxy_rotator.proxy_list:
             # 성능 우선 랜덤 선택 사용
-            proxy = self.proxy_rotator.get_random_proxy_from_working_set()
+            proxy = self.proxy_rotator.get_random_proxy_from_working_set(exclude=set(exclude))
             if proxy:
-                proxy_dict = self.proxy_rotator.get_proxy_dict(proxy)
-                if proxy_dict:
-                    session.proxies.update(proxy_dict)
-                    print(f"[DEBUG] 요청에 프록시 적용: {proxy}")
+                print(f"[DEBUG] 요청에 프록시 적용: {proxy}")
 
-        return session
+        return self.proxy_rotator.get_session(proxy), proxy
 
-    def warm_up_session(self, prod_code):
-        """세션을 예열하여 쿠팡 사이트와의 연결을 설정"""
+    def warm_up_session(self, prod_code, proxy=None, session=None):
+        """세션을 예열하여 쿠팡 사이트와의 연결을 설정 (v1.8: 해당 프록시로 받은 쿠키 jar 반환)"""
+        cookies = rq.cookies.RequestsCookieJar()
+        self.telemetry.increment("warm_ups")
         try:
             print("[INFO] 세션 예열 중...")
 
             # 메인 페이지 먼저 방문
-            main_url = "https://www.coupang.com"
-            session = self.get_session_with_proxy()
+            main_url = self.base_url
+            if session is None:
+                session = self.proxy_rotator.get_session(proxy)
 
             # 메인 페이지 방문
-            resp = session.get(main_url, timeout=15)
+            self.wait_for_rate_limit(proxy)
+            resp = session.get(main_url, headers=self.headers, timeout=15)
             if resp.status_code == 200:
                 print("[DEBUG] 메인 페이지 방문 성공")
 
                 # 쿠키 업데이트
-                self.session.cookies.update(resp.cookies)
+                cookies.update(resp.cookies)
 
                 # 잠시 대기
-                time.sleep(random.uniform(2, 4))
+                self.pause(random.uniform(self.warm_up_delay_min, self.warm_up_delay_max))
 
                 # 상품 페이지 방문
-                product_url = f"https://www.coupang.com/vp/products/{prod_code}"
-                resp2 = session.get(product_url, timeout=15)
+                product_url = f"{self.base_url}/vp/products/{prod_code}"
+                self.wait_for_rate_limit(proxy)
+                resp2 = session.get(product_url, headers=self.headers, cookies=cookies, timeout=15)
 
                 if resp2.status_code == 200:
                     print("[DEBUG] 상품 페이지 방문 성공")
-                    self.session.cookies.update(resp2.cookies)
-                    return True
+                    cookies.update(resp2.cookies)
 
         except Exception as e:
             print(f"[WARNING] 세션 예열 실패: {e}")
 
-        return False
+        return cookies
+
+    def get_warm_cookies(self, prod_code, proxy=None, session=None):
+        """프록시별 캐시된 쿠키 반환 (없거나 오래되었을 때만 예열, 같은 프록시는 한 번만 예열)"""
+        cookies = self.cookie_cache.get(proxy)
+        if cookies is not None:
+            return cookies
+
+        with self.cookie_cache.warm_lock(proxy):
+            # 다른 스레드가 기다리는 동안 예열을 마쳤으면 그 쿠키 사용
+            cookies = self.cookie_cache.get(proxy)
+            if cookies is None:
+                self.cookie_cache.put(proxy, self.warm_up_session(prod_code, proxy, session))
+                cookies = self.cookie_cache.get(proxy)
+        return cookies
+
+    def is_product_completed(self, product: dict) -> bool:
+        """체크포인트상 이미 완료된 상품인지 확인"""
+        if not self.checkpoint:
+            return False
+        prod_code = self.get_product_code(url=product['url'].split('#')[0])
+        return self.checkpoint.is_completed(prod_code)
+
+    def create_save_data(self, export_xlsx: bool = True):
+        """설정된 저장 방식에 맞는 SaveData 인스턴스 생성 (export_xlsx=False이면 닫을 때 xlsx로 변환하지 않음)"""
+        if self.sink_format == "xlsx":
+            return SaveData()
+        return StreamingSaveData(
+            sink_format=self.sink_format,
+            batch_size=self.sink_batch_size,
+            flush_interval=self.sink_flush_interval,
+            export_xlsx=self.sink_export_xlsx and export_xlsx,
+        )
 
     def get_product_title(self, product_name: str) -> str:
         """JSON에서 가져온 상품명 사용"""
@@ -535,28 +2464,42 @@ class Coupang:
         return isinstance(exception, (Timeout, ConnectTimeout, ReadTimeout)) or \
             (isinstance(exception, RequestException) and "timeout" in str(exception).lower())
 
-    def handle_consecutive_timeouts(self) -> None:
-        """연속 타임아웃 처리"""
-        if self.consecutive_timeouts >= self.max_consecutive_timeouts:
-            wait_time = random.uniform(self.long_wait_min, self.long_wait_max)
-            wait_minutes = wait_time / 60
-            print(f"[WARNING] 연속 {self.consecutive_timeouts}회 타임아웃 발생!")
-            print(f"[INFO] 서버 안정화를 위해 {wait_minutes:.1f}분 대기합니다...")
-
-            remaining_time = wait_time
-            while remaining_time > 0:
-                minutes_left = remaining_time / 60
-                print(f"[INFO] 남은 대기 시간: {minutes_left:.1f}분")
-
-                sleep_duration = min(30, remaining_time)
-                time.sleep(sleep_duration)
-                remaining_time -= sleep_duration
+    def get_global_backoff(self) -> float:
+        """v1.8: 타임아웃 후 전체 크롤링을 멈추고 기다려야 할 시간(초) (0이면 대기하지 않음)
 
+        프록시를 사용하면 타임아웃은 해당 프록시의 회로만 열고(ProxyRotator) 나머지 프록시로 계속 진행한다.
+        회로가 열린 프록시 비율이 global_backoff_ratio 이상일 때만 가장 먼저 half-open이 되는 프록시까지
+        (long_wait_max 이하로) 대기한다. 직접 연결이면 연결이 하나뿐이므로 연속 타임아웃이
+        max_consecutive_timeouts에 도달했을 때 long_wait_min~long_wait_max초 대기한다.
+        """
+        if self.proxy_rotator and self.proxy_rotator.proxy_list:
+            open_ratio = self.proxy_rotator.get_open_breaker_ratio()
+            if open_ratio < self.global_backoff_ratio:
+                return 0.0
+            wait_time = min(self.long_wait_max, max(self.long_wait_min, self.proxy_rotator.seconds_until_next_half_open()))
+            print(f"[WARNING] 프록시 {open_ratio * 100:.0f}%의 회로가 열려 있습니다. {wait_time:.0f}초 전체 대기합니다.")
+            return wait_time
+
+        if self.consecutive_timeouts < self.max_consecutive_timeouts:
+            return 0.0
+        wait_time = random.uniform(self.long_wait_min, self.long_wait_max)
+        print(f"[WARNING] 연속 {self.consecutive_timeouts}회 타임아웃 발생! 서버 안정화를 위해 {wait_time:.0f}초 대기합니다.")
+        self.consecutive_timeouts = 0
+        return wait_time
+
+    def handle_consecutive_timeouts(self) -> None:
+        """타임아웃 후 필요한 경우에만 전체 대기 (get_global_backoff 참고)"""
+        wait_time = self.get_global_backoff()
+        if wait_time > 0:
+            self.pause(wait_time)
             print(f"[INFO] 대기 완료! 크롤링을 재개합니다.")
-            self.consecutive_timeouts = 0
 
     def start(self) -> None:
         """v1.7: 다중 상품 처리를 위한 메인 시작 함수 (JSON 지원)"""
+        if self.fetch_backend == "httpx":
+            self.start_async()
+            return
+
         print("=" * 70)
         print("🛒 쿠팡 리뷰 크롤러 v1.7 (JSON 지원 + 랜덤 프록시)")
         print("=" * 70)
@@ -568,8 +2511,14 @@ class Coupang:
 
         total_products = len(self.url_manager.products)
         print(f"[INFO] 총 {total_products}개 상품을 순차적으로 크롤링합니다.")
+        if self.incremental:
+            if self.checkpoint:
+                print(f"[INFO] 증분 모드: 이미 수집된 리뷰가 나오는 페이지에서 다음 상품으로 진행합니다.")
+            else:
+                print(f"[WARNING] 증분 모드는 체크포인트(리뷰 색인)가 필요합니다. 전체 크롤링으로 진행합니다.")
         print(f"[INFO] 각 상품당 최대 {self.max_pages}페이지까지 크롤링합니다.")
-        print(f"[INFO] 연속 5번 리뷰 없음 감지시 다음 상품으로 진행합니다.")
+        self.print_crawl_plan(self.url_manager.products)
+        self.schedule_products()
 
         # 프록시 사용 정보 출력
         if self.proxy_rotator and self.proxy_rotator.proxy_list:
@@ -582,10 +2531,18 @@ class Coupang:
         # 전체 통계
         total_success_products = 0
         total_failed_products = 0
+        interrupted = False
         overall_start_time = time.time()
+        self.telemetry.start()
 
         # 상품별 크롤링 실행
         while True:
+            if self.is_budget_exhausted():
+                print(f"\n[INFO] 크롤링 예산을 모두 사용했습니다. 남은 상품 {self.url_manager.get_remaining_count()}개는 "
+                      f"다음 실행에서 이어서 크롤링합니다.")
+                interrupted = True
+                break
+
             product = self.url_manager.get_next_product()
             if not product:
                 break
@@ -595,8 +2552,14 @@ class Coupang:
             print(f"[INFO] 현재 상품: {product['name']}")
             print(f"[INFO] 상품 URL: {product['url']}")
 
+            if self.is_product_completed(product):
+                print(f"[INFO] 체크포인트상 이미 완료된 상품입니다. 건너뜁니다.")
+                total_success_products += 1
+                continue
+
             try:
-                success = self.crawl_single_product(product['url'], product['name'])
+                success = self.crawl_single_product(product['url'], product['name'],
+                                                    review_count=product.get('review_count'))
                 if success:
                     total_success_products += 1
                     print(f"✅ 상품 {current_progress} 크롤링 성공")
@@ -607,17 +2570,19 @@ class Coupang:
             except KeyboardInterrupt:
                 print(f"\n[INFO] 사용자에 의해 중단되었습니다.")
                 print(f"[INFO] 진행률: {current_progress - 1}/{total_progress} 완료")
+                if self.checkpoint:
+                    print(f"[INFO] 다시 실행하면 체크포인트에서 이어서 크롤링합니다.")
+                interrupted = True
                 break
             except Exception as e:
                 print(f"[ERROR] 상품 크롤링 중 예외 발생: {e}")
                 total_failed_products += 1
                 continue
 
-            # 상품 간 대기 시간
-            if self.url_manager.get_remaining_count() > 0:
-                delay = random.uniform(10, 20)  # 상품 간 10-20초 대기
-                print(f"[INFO] 다음 상품까지 {delay:.1f}초 대기...")
-                time.sleep(delay)
+        # 완료된 상품의 진행 기록만 초기화 (실패한 상품은 다음 실행에서 실패한 페이지부터 다시 크롤링)
+        if self.checkpoint and not interrupted:
+            self.checkpoint.clear_progress()
+        self.telemetry.close()
 
         # 전체 결과 요약
         overall_end_time = time.time()
@@ -633,9 +2598,468 @@ class Coupang:
         print(f"총 소요 시간: {total_elapsed / 60:.1f}분")
         print(f"📁 결과 파일들은 'Coupang-reviews' 폴더에서 확인하세요.")
         print("=" * 70)
+        self.telemetry.print_summary()
+        self.proxy_rotator.print_proxy_stats()
+
+    def start_async(self) -> None:
+        """v1.8: httpx 비동기 백엔드로 여러 상품을 한 이벤트 루프에서 동시에 크롤링"""
+        print("=" * 70)
+        print(f"🛒 쿠팡 리뷰 크롤러 v1.8 (httpx 비동기 백엔드)")
+        print("=" * 70)
+
+        if not self.url_manager.load_urls_from_json():
+            print("[ERROR] JSON 파일을 로드할 수 없습니다.")
+            return
+
+        total_products = len(self.url_manager.products)
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter(self.async_max_requests_per_sec, burst=self.async_max_products)
+
+        print(f"[INFO] 총 {total_products}개 상품 | 동시 상품 {self.async_max_products}개 | "
+              f"최대 동시 요청 {self.async_max_in_flight}개 | 초당 {self.async_max_requests_per_sec}회")
+        self.print_crawl_plan(self.url_manager.products)
+        self.schedule_products()
+        print("=" * 70)
+
+        if self.rating_shards:
+            print("[WARNING] httpx 백엔드는 별점 샤딩을 지원하지 않아 전체 리뷰 스트림으로 크롤링합니다.")
+
+        overall_start_time = time.time()
+        self.telemetry.start()
+        fetcher = AsyncReviewFetcher(self, max_in_flight=self.async_max_in_flight)
+        try:
+            summary = asyncio.run(fetcher.run(self.url_manager, max_concurrent_products=self.async_max_products))
+        finally:
+            self.telemetry.close()
+        total_elapsed = time.time() - overall_start_time
+
+        # 예산 소진으로 멈췄으면 진행 기록을 남겨 다음 실행에서 이어서 크롤링 (실패한 상품의 진행 기록은 항상 유지)
+        if self.checkpoint and not self.is_budget_exhausted():
+            self.checkpoint.clear_progress()
+
+        print("\n" + "=" * 70)
+        print("📊 전체 크롤링 결과 요약 (httpx)")
+        print("=" * 70)
+        print(f"총 상품 수: {total_products}개")
+        print(f"성공한 상품: {summary['success']}개")
+        print(f"실패한 상품: {summary['failed']}개")
+        print(f"페이지 {self.crawl_stats['pages']}개 | 리뷰 {self.crawl_stats['reviews']}개 | 요청 {self.crawl_stats['requests']}회")
+        print(f"총 소요 시간: {total_elapsed / 60:.1f}분 ({self.crawl_stats['pages'] / max(total_elapsed, 1e-9):.2f}페이지/초)")
+        print("=" * 70)
+        self.telemetry.print_summary()
+        self.proxy_rotator.print_proxy_stats()
+
+    def start_concurrent(self, num_workers: int = 4, max_requests_per_sec: float = 2.0) -> None:
+        """v1.8: 작업자 N명이 상품을 하나씩 맡아 동시에 크롤링
+
+        작업자마다 별도의 Coupang 인스턴스(세션/헤더/프록시/SaveData)를 사용하고,
+        모든 작업자는 하나의 URLManager와 RateLimiter를 공유한다.
+        """
+        if num_workers <= 1:
+            self.start()
+            return
+
+        print("=" * 70)
+        print(f"🛒 쿠팡 리뷰 크롤러 v1.8 (동시 크롤링: 작업자 {num_workers}명)")
+        print("=" * 70)
+
+        if not self.url_manager.load_urls_from_json():
+            print("[ERROR] JSON 파일을 로드할 수 없습니다.")
+            return
+
+        total_products = len(self.url_manager.products)
+        num_workers = min(num_workers, total_products)
+        rate_limiter = RateLimiter(max_requests_per_sec, burst=num_workers)
+
+        print(f"[INFO] 총 {total_products}개 상품을 {num_workers}명의 작업자가 동시에 크롤링합니다.")
+        print(f"[INFO] 전체 요청 속도 제한: 초당 {max_requests_per_sec}회")
+        self.print_crawl_plan(self.url_manager.products)
+        self.schedule_products()
+        print("=" * 70)
+
+        workers = self.create_workers(num_workers, rate_limiter)
+
+        overall_start_time = time.time()
+        self.telemetry.start()
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(self.run_worker, worker_id, worker)
+                for worker_id, worker in enumerate(workers)
+            ]
+            worker_summaries = [future.result() for future in futures]
+        total_elapsed = time.time() - overall_start_time
+        self.telemetry.close()
+
+        for worker in workers:
+            for key, value in worker.crawl_stats.items():
+                self.add_crawl_stat(key, value)
+
+        # 예산 소진으로 멈췄으면 진행 기록을 남겨 다음 실행에서 이어서 크롤링 (실패한 상품의 진행 기록은 항상 유지)
+        if self.checkpoint and not self.is_budget_exhausted():
+            self.checkpoint.clear_progress()
+
+        self.print_concurrent_summary(worker_summaries, total_products, total_elapsed)
+        self.telemetry.print_summary()
+        for worker in workers:
+            worker.proxy_rotator.print_proxy_stats()
+
+    def get_planned_pages(self, review_count):
+        """카탈로그 리뷰 수로 정한 요청 페이지 수 (계획을 쓰지 않거나 리뷰 수를 모르면 None)"""
+        if not self.use_review_plan or review_count is None:
+            return None
+        pages = math.ceil(review_count / REVIEW_PAGE_SIZE) + self.review_plan_margin_pages
+        return max(1, min(pages, self.max_pages))
+
+    def print_crawl_plan(self, products: list) -> dict:
+        """v1.8: 크롤링 시작 전 상품별 예상 페이지 수와 전체 예상 요청 수 출력"""
+        plan = {"products": 0, "planned_products": 0, "reviews": 0, "pages": 0, "unplanned_products": 0,
+                "min_requests": 0, "max_requests": 0}
+        for product in products:
+            if self.is_product_completed(product):
+                continue
+            plan["products"] += 1
+            planned_pages = self.get_planned_pages(product.get('review_count'))
+            if planned_pages is None:
+                # 리뷰 수를 모르면 짧은 페이지/빈 리뷰 목록으로 끝을 찾으므로 최소 1 ~ 최대 max_pages 페이지
+                plan["unplanned_products"] += 1
+                plan["min_requests"] += 1
+                plan["max_requests"] += self.max_pages
+            else:
+                plan["planned_products"] += 1
+                plan["reviews"] += product['review_count']
+                plan["pages"] += planned_pages
+        plan["min_requests"] += plan["pages"]
+        plan["max_requests"] += plan["pages"]
+
+        print(f"[INFO] 📋 크롤링 계획: 남은 상품 {plan['products']}개 중 리뷰 수 확인 {plan['planned_products']}개 "
+              f"(리뷰 {plan['reviews']}개 -> {plan['pages']}페이지)")
+        if plan["unplanned_products"]:
+            print(f"[INFO] 리뷰 수를 모르는 상품 {plan['unplanned_products']}개는 짧은 페이지/빈 리뷰 목록으로 끝을 확인합니다.")
+        if plan["min_requests"] == plan["max_requests"]:
+            print(f"[INFO] 예상 리뷰 페이지 요청 수: {plan['min_requests']}회 (재시도/세션 예열 제외)")
+        else:
+            print(f"[INFO] 예상 리뷰 페이지 요청 수: {plan['min_requests']}~{plan['max_requests']}회 (재시도/세션 예열 제외)")
+        if self.rating_shards:
+            print("[INFO] 별점 샤딩 중에는 별점별 리뷰 수를 몰라 스트림마다 끝을 확인하므로 요청 수가 더 많을 수 있습니다.")
+        return plan
+
+    def get_expected_requests(self, reviews: float) -> int:
+        """리뷰 reviews개를 받는 데 필요한 페이지 요청 수 (마지막 짧은 페이지/빈 리뷰 목록 포함)"""
+        return max(1, min(int(reviews) // REVIEW_PAGE_SIZE + 1, self.max_pages))
+
+    def estimate_product_yield(self, product: dict, record, default_reviews: int, now: float) -> tuple:
+        """v1.8: 상품의 (예상 신규 리뷰 수, 예상 요청 수) 추정
+
+        처음 크롤링하는 상품은 카탈로그 리뷰 수(모르면 default_reviews)가 모두 새 리뷰다.
+        크롤링 이력(record)이 있으면 카탈로그 리뷰 수 중 아직 수집하지 못한 리뷰에
+        리뷰 증가 속도 x 마지막 크롤링 이후 경과 시간을 더한다. 증가 속도는 직전 두 크롤링 사이에 새로 수집한
+        리뷰 수로 추정하고, 한 번만 크롤링했으면 수집한 리뷰가 review_rate_prior_days 동안 쌓였다고 본다.
+        """
+        review_count = product.get('review_count')
+        if record is None:
+            expected_reviews = review_count if review_count is not None else default_reviews
+            return expected_reviews, self.get_expected_requests(expected_reviews)
+
+        backlog = max(0, review_count - record["total_reviews"]) if review_count is not None else 0
+        if record["last_interval"]:
+            reviews_per_day = record["last_new_reviews"] / (record["last_interval"] / 86400)
+        else:
+            reviews_per_day = record["total_reviews"] / self.review_rate_prior_days
+        expected_reviews = backlog + reviews_per_day * max(0.0, now - record["last_crawled_at"]) / 86400
+
+        if self.incremental and self.checkpoint:
+            # 증분 모드는 새 리뷰가 있는 페이지와 이미 수집된 리뷰가 나오는 페이지 1개만 요청
+            return expected_reviews, self.get_expected_requests(expected_reviews)
+        total_reviews = max(review_count or 0, record["total_reviews"] + expected_reviews)
+        return expected_reviews, self.get_expected_requests(total_reviews)
+
+    def schedule_products(self) -> None:
+        """v1.8: 크롤링 예산을 시작하고 남은 상품을 요청당 예상 신규 리뷰 수가 많은 순으로 정렬
+
+        예산 안에서 가장 많은 리뷰를 모으도록 요청 1회당 수익이 큰 상품부터 처리한다 (같으면 오래전에 크롤링한 상품 먼저).
+        """
+        self.crawl_deadline_at = time.time() + self.crawl_time_budget if self.crawl_time_budget else None
+        self.budget_request_start = self.telemetry.get_counter("review_requests")
+        if self.crawl_time_budget or self.crawl_request_budget:
+            budgets = []
+            if self.crawl_time_budget:
+                budgets.append(f"시간 {self.crawl_time_budget / 60:.1f}분")
+            if self.crawl_request_budget:
+                budgets.append(f"요청 {self.crawl_request_budget}회")
+            print(f"[INFO] ⏱️ 크롤링 예산: {', '.join(budgets)} (다 쓰면 멈추고 다음 실행에서 이어서 크롤링)")
+
+        if not self.use_priority_schedule:
+            return
+
+        remaining = self.url_manager.products[self.url_manager.current_index:]
+        history = self.checkpoint.get_product_history() if self.checkpoint else {}
+        known_counts = sorted(product['review_count'] for product in remaining if product.get('review_count') is not None)
+        default_reviews = known_counts[len(known_counts) // 2] if known_counts else REVIEW_PAGE_SIZE
+        now = time.time()
+
+        scored = []
+        for product in remaining:
+            record = history.get(self.get_product_code(url=product['url'].split('#')[0]))
+            expected_reviews, expected_requests = self.estimate_product_yield(product, record, default_reviews, now)
+            last_crawled_at = record["last_crawled_at"] if record else 0.0
+            scored.append((expected_reviews / expected_requests, last_crawled_at, expected_reviews, expected_requests, product))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        self.url_manager.reorder_products([item[4] for item in scored])
+
+        total_reviews = sum(item[2] for item in scored)
+        total_requests = sum(item[3] for item in scored)
+        print(f"[INFO] 🗓️ 우선순위 스케줄: 상품 {len(scored)}개를 요청당 예상 신규 리뷰 수 순으로 크롤링 "
+              f"(이력 있는 상품 {sum(1 for item in scored if item[1])}개, 예상 신규 리뷰 {total_reviews:.0f}개 / 요청 {total_requests}회)")
+        for score, _, expected_reviews, expected_requests, product in scored[:3]:
+            print(f"[INFO]   - {product['name']}: 예상 신규 리뷰 {expected_reviews:.0f}개 / 요청 {expected_requests}회 "
+                  f"({score:.1f}리뷰/요청)")
+
+    def get_request_budget_left(self):
+        """남은 요청 예산 (요청 예산이 없으면 None, 세션 예열 등을 뺀 리뷰 페이지 요청만 셈)"""
+        if not self.crawl_request_budget:
+            return None
+        return self.crawl_request_budget - (self.telemetry.get_counter("review_requests") - self.budget_request_start)
+
+    def is_budget_exhausted(self) -> bool:
+        """v1.8: 시간/요청 예산을 다 썼는지 확인 (작업자들은 텔레메트리의 리뷰 페이지 요청 카운터를 공유)"""
+        if self.crawl_deadline_at and time.time() >= self.crawl_deadline_at:
+            return True
+        budget_left = self.get_request_budget_left()
+        return budget_left is not None and budget_left <= 0
+
+    def create_workers(self, num_workers: int, rate_limiter) -> list:
+        """공유 구성요소(URLManager, 속도 제한기, 체크포인트, 텔레메트리 등)를 쓰는 작업자 인스턴스 생성"""
+        workers = []
+        for worker_id in range(num_workers):
+            worker = Coupang(
+                proxy_list=self.get_worker_proxy_list(worker_id, num_workers),
+                url_manager=self.url_manager,
+                rate_limiter=rate_limiter,
+                checkpoint=self.checkpoint,
+                html_archive=self.html_archive,
+                review_dedup=self.review_dedup,
+                block_classifier=self.block_classifier,
+                use_browser=self.use_browser,
+                telemetry=self.telemetry,
+                pacer=self.pacer,
+                cookie_cache=self.cookie_cache,
+                # 꺼져 있으면(None) 작업자도 따로 만들지 않음
+                use_checkpoint=False,
+                use_html_archive=False,
+                use_review_dedup=False,
+            )
+            self.copy_settings_to(worker)
+            workers.append(worker)
+        return workers
+
+    def start_queue(self, num_workers: int = 1, max_requests_per_sec: float = 2.0) -> None:
+        """v1.8: 공유 작업 큐(SQLite)에서 (상품, 페이지 구간) 작업을 임대해 크롤링
+
+        같은 카탈로그와 큐 파일(work_queue_file)로 여러 프로세스/머신에서 실행하면 작업을 겹치지 않게 나눠 처리한다.
+        큐가 비어 있으면 카탈로그로 구간 작업을 만들고(이미 있는 작업은 유지), 남은 작업이 없을 때까지 처리한다.
+        """
+        print("=" * 70)
+        print(f"🛒 쿠팡 리뷰 크롤러 v1.8 (작업 큐: {self.work_queue_file}, 작업자 {num_workers}명)")
+        print("=" * 70)
+
+        if not self.url_manager.load_urls_from_json():
+            print("[ERROR] JSON 파일을 로드할 수 없습니다.")
+            return
+
+        queue = CrawlWorkQueue(self.work_queue_file, lease_seconds=self.work_queue_lease_seconds,
+                               max_attempts=self.work_queue_max_attempts)
+        self.print_crawl_plan(self.url_manager.products)
+        # 같은 시작 페이지의 구간 작업은 먼저 추가된 작업부터 임대되므로 우선순위 순서로 추가
+        self.schedule_products()
+        added = queue.seed(self.url_manager.products, self.max_pages, self.work_queue_pages_per_task,
+                           plan_pages=lambda product: self.get_planned_pages(product.get('review_count')))
+        counts = queue.get_counts()
+        print(f"[INFO] 작업 {added}개 추가 | 대기 {counts['pending']} | 임대 중 {counts['leased']} | "
+              f"완료 {counts['done']} | 건너뜀 {counts['skipped']} | 실패 {counts['failed']}")
+        print(f"[INFO] 작업자 ID: {queue.owner} | 구간당 {self.work_queue_pages_per_task}페이지 | "
+              f"임대 {self.work_queue_lease_seconds / 60:.0f}분 | 최대 {self.work_queue_max_attempts}회 시도")
+        print("=" * 70)
+
+        num_workers = max(1, num_workers)
+        rate_limiter = RateLimiter(max_requests_per_sec, burst=num_workers) if num_workers > 1 else self.rate_limiter
+        workers = self.create_workers(num_workers, rate_limiter) if num_workers > 1 else [self]
+
+        overall_start_time = time.time()
+        self.telemetry.start()
+        try:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                futures = [
+                    executor.submit(self.run_queue_worker, worker_id, worker, queue)
+                    for worker_id, worker in enumerate(workers)
+                ]
+                worker_summaries = [future.result() for future in futures]
+        finally:
+            self.telemetry.close()
+        total_elapsed = time.time() - overall_start_time
+
+        if num_workers > 1:
+            for worker in workers:
+                for key, value in worker.crawl_stats.items():
+                    self.add_crawl_stat(key, value)
+
+        counts = queue.get_counts()
+        queue.close()
+
+        self.print_concurrent_summary(worker_summaries, len(self.url_manager.products), total_elapsed)
+        print(f"[INFO] 작업 큐 상태: 대기 {counts['pending']} | 임대 중 {counts['leased']} | 완료 {counts['done']} | "
+              f"건너뜀 {counts['skipped']} | 실패 {counts['failed']}")
+        self.telemetry.print_summary()
+        for worker in workers:
+            worker.proxy_rotator.print_proxy_stats()
+
+    def run_queue_worker(self, worker_id: int, worker: "Coupang", queue: CrawlWorkQueue) -> dict:
+        """작업자 1명의 작업 큐 루프 (임대할 작업이 없을 때까지 구간 작업을 처리)"""
+        summary = {"worker_id": worker_id, "success": 0, "failed": 0, "elapsed": 0.0}
+        worker_start_time = time.time()
+        # 작업에는 카탈로그 리뷰 수가 없으므로 카탈로그에서 찾아 구간 안의 리뷰 끝 이후 페이지를 미리 요청하지 않게 함
+        review_counts = {product['url'].split('#')[0]: product.get('review_count') for product in self.url_manager.products}
+
+        while True:
+            if worker.is_budget_exhausted():
+                print(f"[WORKER {worker_id}] 크롤링 예산을 모두 사용하여 작업을 마칩니다.")
+                break
+
+            task = queue.acquire(worker_name=str(worker_id))
+            if not task:
+                break
 
-    def crawl_single_product(self, url: str, product_name: str) -> bool:
-        """단일 상품 크롤링"""
+            print(f"\n[WORKER {worker_id}] 작업 시작: {task['name']} 페이지 {task['start_page']}~{task['end_page']} "
+                  f"(시도 {task['attempt']}/{queue.max_attempts})")
+            try:
+                worker.crawl_single_product(task['url'], task['name'], task['start_page'], task['end_page'],
+                                            review_count=review_counts.get(task['url']))
+                # 구간 끝이나 확인된 리뷰 끝까지 진행했을 때만 완료 (차단/실패로 멈춘 구간은 다시 시도하고,
+                # 이후 구간을 건너뛰게 하는 리뷰 끝은 빈 리뷰 목록/짧은 페이지로 확인했을 때만 기록)
+                success = worker.crawl_completed
+            except Exception as e:
+                print(f"[ERROR] [WORKER {worker_id}] 작업 처리 중 예외 발생: {e}")
+                success = False
+
+            if worker.budget_stopped:
+                # 예산 소진으로 구간을 끝까지 못 돌았으면 다음 실행(또는 다른 프로세스)이 다시 가져가도록 반환
+                queue.release(task)
+                print(f"[WORKER {worker_id}] 크롤링 예산 소진으로 작업 반환: {task['name']} 페이지 {task['start_page']}~{task['end_page']}")
+            elif success:
+                output_files = queue.complete(task, empty_from_page=worker.empty_from_page,
+                                              output_file=worker.output_file)
+                summary["success"] += 1
+                print(f"✅ [WORKER {worker_id}] 작업 완료: {task['name']} 페이지 {task['start_page']}~{task['end_page']}")
+                worker.export_product_outputs(output_files)
+            else:
+                output_files = queue.fail(task, output_file=worker.output_file)
+                summary["failed"] += 1
+                print(f"❌ [WORKER {worker_id}] 작업 실패: {task['name']} 페이지 {task['start_page']}~{task['end_page']}")
+                worker.export_product_outputs(output_files)
+
+        summary["elapsed"] = time.time() - worker_start_time
+        summary.update(worker.crawl_stats)
+        return summary
+
+    def export_product_outputs(self, output_files: list) -> None:
+        """작업 큐에서 모든 구간이 끝난 상품의 스트림 파일을 xlsx로 변환 (상품마다 한 작업자만 호출)"""
+        if not self.sink_export_xlsx or self.sink_format == "xlsx":
+            return
+        for output_file in output_files:
+            StreamingSaveData.export_stream_file(output_file)
+
+    # 작업자 인스턴스에 그대로 복사할 설정 속성들
+    WORKER_SETTINGS = (
+        "base_url", "base_review_url", "retries", "delay_min", "delay_max", "max_pages", "warm_up_delay_min", "warm_up_delay_max", "prefetch_window", "sink_format", "sink_batch_size",
+        "sink_flush_interval", "sink_export_xlsx", "incremental", "record_dir", "max_consecutive_timeouts",
+        "long_wait_min", "long_wait_max", "global_backoff_ratio",
+        "rating_shards", "use_review_plan", "review_plan_margin_pages",
+        "use_priority_schedule", "crawl_time_budget", "crawl_request_budget", "review_rate_prior_days",
+        "crawl_deadline_at", "budget_request_start",
+    )
+
+    def copy_settings_to(self, worker: "Coupang") -> None:
+        """현재 인스턴스의 설정을 작업자 인스턴스에 복사"""
+        for name in self.WORKER_SETTINGS:
+            setattr(worker, name, getattr(self, name))
+        worker.parser_backend = self.parser_backend
+        worker.review_parser = get_review_parser(self.parser_backend)
+
+    def get_worker_proxy_list(self, worker_id: int, num_workers: int):
+        """작업자별 프록시 분배 (프록시가 충분하면 겹치지 않게 나눠줌)"""
+        proxy_list = self.proxy_rotator.proxy_list if self.proxy_rotator else []
+        if not proxy_list:
+            return None
+        if len(proxy_list) >= num_workers:
+            return proxy_list[worker_id::num_workers]
+        return list(proxy_list)
+
+    def run_worker(self, worker_id: int, worker: "Coupang") -> dict:
+        """작업자 1명의 크롤링 루프 (URLManager가 빌 때까지 상품을 가져와 처리)"""
+        summary = {"worker_id": worker_id, "success": 0, "failed": 0, "elapsed": 0.0}
+        worker_start_time = time.time()
+
+        while True:
+            if worker.is_budget_exhausted():
+                print(f"[WORKER {worker_id}] 크롤링 예산을 모두 사용하여 작업을 마칩니다.")
+                break
+
+            product = self.url_manager.get_next_product()
+            if not product:
+                break
+
+            print(f"\n[WORKER {worker_id}] 상품 시작: {product['name']}")
+            if self.is_product_completed(product):
+                print(f"[WORKER {worker_id}] 체크포인트상 이미 완료된 상품입니다. 건너뜁니다.")
+                continue
+
+            try:
+                if worker.crawl_single_product(product['url'], product['name'],
+                                               review_count=product.get('review_count')):
+                    summary["success"] += 1
+                    print(f"✅ [WORKER {worker_id}] 상품 크롤링 성공: {product['name']}")
+                else:
+                    summary["failed"] += 1
+                    print(f"❌ [WORKER {worker_id}] 상품 크롤링 실패: {product['name']}")
+            except Exception as e:
+                print(f"[ERROR] [WORKER {worker_id}] 상품 크롤링 중 예외 발생: {e}")
+                summary["failed"] += 1
+
+        summary["elapsed"] = time.time() - worker_start_time
+        summary.update(worker.crawl_stats)
+        return summary
+
+    @staticmethod
+    def print_concurrent_summary(worker_summaries: list, total_products: int, total_elapsed: float) -> None:
+        """작업자별 처리량과 전체 시간당 상품 수 출력"""
+        total_success = sum(summary["success"] for summary in worker_summaries)
+        total_failed = sum(summary["failed"] for summary in worker_summaries)
+        hours = max(total_elapsed, 1e-9) / 3600
+
+        print("\n" + "=" * 70)
+        print("📊 동시 크롤링 결과 요약")
+        print("=" * 70)
+        for summary in worker_summaries:
+            worker_hours = max(summary["elapsed"], 1e-9) / 3600
+            products_done = summary["success"] + summary["failed"]
+            print(f"[WORKER {summary['worker_id']}] 상품 {products_done}개 (성공 {summary['success']}, "
+                  f"실패 {summary['failed']}) | 페이지 {summary['pages']}개 | 리뷰 {summary['reviews']}개 | "
+                  f"요청 {summary['requests']}회 | {products_done / worker_hours:.1f}상품/시간 | "
+                  f"{summary['reviews'] / max(summary['elapsed'], 1e-9):.2f}리뷰/초")
+        print("-" * 70)
+        print(f"총 상품 수: {total_products}개")
+        print(f"성공한 상품: {total_success}개")
+        print(f"실패한 상품: {total_failed}개")
+        print(f"총 소요 시간: {total_elapsed / 60:.1f}분")
+        print(f"전체 처리량: {(total_success + total_failed) / hours:.1f}상품/시간")
+        print(f"📁 결과 파일들은 'Coupang-reviews' 폴더에서 확인하세요.")
+        print("=" * 70)
+
+    def crawl_single_product(self, url: str, product_name: str, start_page: int = 1, end_page: int = None,
+                             review_count: int = None) -> bool:
+        """단일 상품 크롤링 (end_page를 지정하면 작업 큐의 start_page~end_page 구간만 크롤링)
+
+        review_count(카탈로그 리뷰 수)를 알면 계획한 페이지 수까지만 요청한다.
+        """
         if '#' in url:
             url = url.split('#')[0]
             print(f"[DEBUG] URL fragment 제거: {url}")
@@ -643,11 +3067,10 @@ class Coupang:
         prod_code: str = self.get_product_code(url=url)
         print(f"[DEBUG] 상품 코드: {prod_code}")
 
-        # 세션 예열
-        self.warm_up_session(prod_code)
-
         # 상품별 SaveData 인스턴스 생성
-        sd = SaveData()
+        self.output_file = None
+        # 페이지 구간 작업은 상품의 마지막 구간이 끝난 뒤 작업 큐 루프에서 한 번만 xlsx로 변환
+        sd = self.create_save_data(export_xlsx=end_page is None)
 
         try:
             self.title = self.get_product_title(product_name=product_name)
@@ -657,241 +3080,421 @@ class Coupang:
             self.title = "상품명 미확인"
 
         self.page_title = None  # 페이지 타이틀 초기화
-        success_count = 0
-        current_page = 1
-        consecutive_empty_pages = 0
-        max_empty_pages = 5  # v1.6: 연속 빈 페이지 허용 횟수 (5번 연속 리뷰 없음시 다음 상품으로)
-        proxy_change_attempts = 0
+        self.empty_from_page = None  # v1.8: 리뷰 끝을 확인했으면 리뷰가 없는 첫 페이지
+        self.budget_stopped = False
+        self.crawl_completed = False
+        page_range = end_page is not None
+        planned_pages = self.get_planned_pages(review_count)
+        # 카탈로그 리뷰 수로 보면 리뷰 끝이 확인될 페이지 (이후 여유 페이지는 미리 요청하지 않음)
+        expected_pages = self.get_expected_requests(review_count) if planned_pages else None
+        if planned_pages:
+            print(f"[INFO] 카탈로그 리뷰 {review_count}개 -> {planned_pages}페이지까지 요청")
 
         product_start_time = time.time()
+        reviews_before, requests_before = self.crawl_stats["reviews"], self.crawl_stats["requests"]
 
-        while consecutive_empty_pages < max_empty_pages and current_page <= self.max_pages:
-            payload = {
-                "productId": prod_code,
-                "page": current_page,
-                "size": 10,
-                "sortBy": "DATE_DESC",
-                "ratings": "",
-                "q": "",
-                "viRoleCode": 2,
-                "ratingSummary": False,
-            }
-
-            result = self.fetch(payload=payload, sd=sd)
-
-            if result:
-                success_count += 1
-                consecutive_empty_pages = 0
-                proxy_change_attempts = 0
+        # v1.8: 별점 샤딩 - 별점(1~5)마다 별도 리뷰 스트림으로 나눠 동시에 크롤링 (스트림마다 max_pages, 종료 조건 별도)
+        # 페이지 구간 작업(작업 큐)은 구간이 전체 스트림 기준이므로 샤딩하지 않음
+        ratings = self.RATING_SHARDS if self.rating_shards and not page_range else ("",)
+        try:
+            if len(ratings) > 1:
+                print(f"[INFO] 별점별 {len(ratings)}개 스트림으로 나눠 동시에 크롤링합니다.")
+                with ThreadPoolExecutor(max_workers=len(ratings)) as shard_executor:
+                    results = list(shard_executor.map(
+                        lambda rating: self.crawl_review_stream(prod_code, sd, rating=rating, end_page=planned_pages,
+                                                                planned=True, expected_pages=expected_pages), ratings
+                    ))
             else:
-                consecutive_empty_pages += 1
-                print(f"[WARNING] 페이지 {current_page}에서 리뷰를 찾을 수 없습니다. ({consecutive_empty_pages}/{max_empty_pages})")
-
-                # 연속 빈 페이지가 2개 이상이고 프록시를 사용 중이라면 프록시 상태 체크
-                if (consecutive_empty_pages >= 2 and
-                        self.proxy_rotator and
-                        self.proxy_rotator.current_proxy and
-                        proxy_change_attempts < 3):
-
-                    available_proxies = self.proxy_rotator.get_available_proxy_count()
-                    if available_proxies > 1:
-                        print(f"[INFO] 연속 실패로 인한 프록시 교체 시도 ({proxy_change_attempts + 1}/3)")
-                        self.proxy_rotator.mark_proxy_failed(self.proxy_rotator.current_proxy)
-                        proxy_change_attempts += 1
-                        print(f"[INFO] 페이지 {current_page} 다른 프록시로 재시도...")
-                        continue
-
-            current_page += 1
-
-            if result and consecutive_empty_pages == 0:
-                short_delay = random.uniform(1.0, 3.0)
-                time.sleep(short_delay)
+                if planned_pages:
+                    end_page = min(end_page, planned_pages) if page_range else planned_pages
+                results = [self.crawl_review_stream(prod_code, sd, start_page=start_page, end_page=end_page,
+                                                    planned=bool(planned_pages) and not page_range,
+                                                    expected_pages=expected_pages)]
+        finally:
+            # 남은 버퍼 기록 및 최종 xlsx 변환
+            sd.close()
+            self.output_file = getattr(sd, "file_name", None)  # v1.8: 리뷰를 기록한 스트림 파일 (없으면 None)
+
+        if len(results) == 1:
+            self.empty_from_page = results[0]["empty_from_page"]
+        self.budget_stopped = any(result["budget_stopped"] for result in results)
+        # 모든 스트림이 실제 끝(리뷰 끝/계획 페이지/최대 페이지/증분 모드의 수집된 리뷰)에 도달했을 때만 완료로 기록
+        # 차단/실패(연속 빈 페이지)나 예산 소진으로 멈춘 상품은 진행 기록을 그대로 두어 다음 실행에서 다시 시도
+        # 페이지 구간 작업은 구간 끝까지 요청했으면 완료
+        complete_ends = self.COMPLETE_RANGE_ENDS if page_range else self.COMPLETE_STREAM_ENDS
+        completed = all(result["end_kind"] in complete_ends for result in results)
+        self.crawl_completed = completed
+        if self.checkpoint and not page_range:
+            if completed:
+                self.checkpoint.mark_completed(prod_code)
+            self.checkpoint.record_product_run(prod_code, self.crawl_stats["reviews"] - reviews_before,
+                                               self.crawl_stats["requests"] - requests_before,
+                                               finished=completed)
+        if self.review_dedup:
+            self.review_dedup.save()
 
         product_end_time = time.time()
         product_elapsed = product_end_time - product_start_time
 
         # 상품별 결과 출력
         print(f"\n[PRODUCT SUMMARY] 상품 '{self.title}' 크롤링 완료")
-        print(f"[INFO] 성공 페이지: {success_count}개 (총 {current_page - 1}페이지 시도)")
+        for result in results:
+            label = f"[별점 {result['rating']}] " if result["rating"] else ""
+            print(f"[INFO] {label}성공 페이지: {result['success_count']}개 (총 {result['pages_tried']}페이지 시도)")
+            if result["end_reason"]:
+                print(f"[INFO] {label}{result['end_reason']}")
         print(f"[INFO] 소요 시간: {product_elapsed / 60:.1f}분")
 
-        if consecutive_empty_pages >= max_empty_pages:
-            print(f"[INFO] 연속 {max_empty_pages}번 빈 페이지로 인해 다음 상품으로 진행")
+        return any(result["success_count"] > 0 or result["resume_page"] > 0 or result["reached_known_reviews"] or
+                   result["exhausted"] for result in results)
+
+    def crawl_review_stream(self, prod_code: str, sd, rating: str = "", start_page: int = 1,
+                            end_page: int = None, planned: bool = False, expected_pages: int = None) -> dict:
+        """v1.8: 리뷰 스트림 1개(전체 또는 별점 1개)를 리뷰 끝/연속 빈 페이지/최대 페이지까지 크롤링하고 결과 요약 반환
+
+        planned이면 end_page는 크롤링 계획의 마지막 페이지이며, 진행 기록은 체크포인트에 그대로 남긴다.
+        리뷰가 REVIEW_PAGE_SIZE개보다 적은 페이지나 빈 리뷰 목록 응답(fetch_page가 None 반환)은 리뷰 끝으로 보고
+        연속 빈 페이지를 더 요청하지 않는다. expected_pages(카탈로그 리뷰 수로 본 리뷰 끝 페이지)보다 뒤 페이지는
+        미리 요청하지 않는다.
+        """
+        label = f"[별점 {rating}] " if rating else ""
+        # 별점 스트림은 체크포인트 진행 기록을 스트림별로 따로 둠 (리뷰 키는 상품 기준)
+        progress_key = f"{prod_code}:{rating}" if rating else prod_code
+        success_count = 0
+        current_page = start_page
+        # v1.8: 페이지 구간 작업은 작업 큐가 진행 상황을 관리하므로 체크포인트 진행 기록은 쓰지 않음 (리뷰 키만 기록)
+        page_range = end_page is not None and not planned
+        last_page = min(end_page, self.max_pages) if end_page is not None else self.max_pages
+        consecutive_empty_pages = 0
+        max_empty_pages = self.MAX_EMPTY_PAGES
+        proxy_change_attempts = 0
+
+        reached_known_reviews = False
+        exhausted_at = None  # 리뷰 끝으로 확인된 첫 페이지 (짧은 페이지 다음 또는 빈 리뷰 목록 페이지)
+        budget_stopped = False
+        stream_completed = False
+
+        # v1.8: 체크포인트가 있으면 마지막으로 처리한 페이지 다음부터 이어서 크롤링
+        resume_page = 0
+        if self.checkpoint and not page_range and rating and self.checkpoint.is_completed(progress_key):
+            # 별점 스트림은 스트림별로 완료를 기록하므로 다른 스트림이 실패한 상품을 재개할 때 끝난 스트림은 건너뜀
+            print(f"[INFO] {label}체크포인트상 이미 완료된 스트림입니다. 건너뜁니다.")
+            stream_completed = True
+        elif self.checkpoint and not page_range:
+            resume_page, consecutive_empty_pages = self.checkpoint.get_progress(progress_key)
+            if consecutive_empty_pages >= max_empty_pages:
+                # 지난 실행이 연속 빈 페이지(차단/실패)로 끝났으면 첫 빈 페이지부터 다시 시도
+                resume_page = max(0, resume_page - consecutive_empty_pages)
+                consecutive_empty_pages = 0
+            if resume_page:
+                current_page = resume_page + 1
+                print(f"[INFO] {label}체크포인트에서 재개: 페이지 {current_page}부터 (연속 빈 페이지 {consecutive_empty_pages}회)")
+                if self.sink_format == "xlsx":
+                    print("[WARNING] xlsx 저장 방식은 기존 파일을 덮어씁니다. 이어쓰기에는 csv/jsonl 저장 방식을 사용하세요.")
+
+        # v1.8: 페이지 파이프라이닝 - 페이지 N을 파싱/저장하는 동안 N+1 이후 페이지를 다른 프록시로 미리 요청
+        # 아직 결과를 모르는 페이지가 모두 빈 페이지라고 가정해도 연속 빈 페이지 한도 안에 들 때만 미리 요청하고,
+        # 카탈로그 리뷰 수로 본 리뷰 끝(expected_pages) 이후 페이지는 앞 페이지를 모두 처리한 뒤에만 요청한다.
+        # 미리 받아 둔 페이지가 리뷰 끝(짧은 페이지/빈 리뷰 목록)이면 그 뒤 페이지는 요청하지 않는다. 리뷰 수를 모르는
+        # 스트림(별점 스트림 포함)은 리뷰 끝 페이지를 받기 전에 이미 요청을 보낸 페이지(최대 prefetch_window - 1개)만 더 받을 수 있다.
+        window = max(1, self.prefetch_window)
+        pending = {}  # page -> Future
+        next_page = current_page
+        executor = ThreadPoolExecutor(max_workers=window)
+
+        try:
+            while not stream_completed and consecutive_empty_pages < max_empty_pages and current_page <= last_page:
+                # 예산을 다 썼으면 이미 요청해 둔 페이지까지만 처리
+                if current_page not in pending and self.is_budget_exhausted():
+                    budget_stopped = True
+                    break
+
+                budget_left = self.get_request_budget_left()
+                prefetched_end = self.has_prefetched_end(pending)
+                while (len(pending) < window and
+                       next_page <= last_page and
+                       not prefetched_end and
+                       consecutive_empty_pages + len(pending) < max_empty_pages and
+                       (expected_pages is None or next_page <= expected_pages or not pending) and
+                       (budget_left is None or len(pending) < budget_left)):
+                    payload = self.build_review_payload(prod_code, next_page, rating)
+                    pending[next_page] = executor.submit(self.fetch_page, payload)
+                    next_page += 1
+
+                reviews = pending.pop(current_page).result()
+                # 빈 리뷰 목록 응답(None)은 리뷰 끝, 빈 리스트는 차단/실패
+                exhausted = reviews is None
+                reviews = reviews or []
+                fetched_count = len(reviews)
+
+                if reviews:
+                    # 별점 스트림들이 같은 SaveData와 중복 제거 필터를 쓰므로 중복 제거와 저장은 한 번에 하나씩
+                    with self.store_lock:
+                        # 페이지가 밀리거나 재시도/재실행으로 이미 저장한 리뷰가 다시 나온 경우 제외
+                        new_reviews = self.drop_duplicate_reviews(prod_code, reviews)
+
+                        # v1.8: 증분 모드 - 최신순 정렬이므로 페이지 전체가 이미 수집된 리뷰면 이후도 모두 수집된 리뷰
+                        if self.incremental and not new_reviews:
+                            print(f"[INFO] {label}증분 모드: 페이지 {current_page}의 리뷰 {len(reviews)}개가 모두 이미 수집된 리뷰입니다.")
+                            reached_known_reviews = True
+                            break
+
+                        reviews = new_reviews
+                        with self.telemetry.timer("store"):
+                            self.store_reviews(reviews, sd)
+                        self.add_crawl_stat("pages")
+                    success_count += 1
+                    self.telemetry.increment("pages")
+                    consecutive_empty_pages = 0
+                    proxy_change_attempts = 0
+                    # 한 페이지를 다 채우지 못한 페이지가 마지막 페이지
+                    if fetched_count < REVIEW_PAGE_SIZE:
+                        exhausted_at = current_page + 1
+                elif exhausted:
+                    exhausted_at = current_page
+                else:
+                    consecutive_empty_pages += 1
+                    print(f"[WARNING] {label}페이지 {current_page}에서 리뷰를 찾을 수 없습니다. ({consecutive_empty_pages}/{max_empty_pages})")
+
+                    # 연속 빈 페이지가 2개 이상이고 프록시를 사용 중이라면 다른 프록시로 같은 페이지 재시도
+                    # (v1.8: 차단된 프록시는 fetch_page가 응답 분류 결과로 이미 교체하므로 여기서는 버리지 않음)
+                    if (consecutive_empty_pages >= 2 and
+                            self.proxy_rotator and
+                            self.proxy_rotator.current_proxy and
+                            proxy_change_attempts < 3):
+
+                        available_proxies = self.proxy_rotator.get_available_proxy_count()
+                        if available_proxies > 1:
+                            print(f"[INFO] 연속 실패로 인한 다른 프록시 재시도 ({proxy_change_attempts + 1}/3)")
+                            proxy_change_attempts += 1
+                            print(f"[INFO] {label}페이지 {current_page} 다른 프록시로 재시도...")
+                            payload = self.build_review_payload(prod_code, current_page, rating)
+                            pending[current_page] = executor.submit(self.fetch_page, payload)
+                            continue
+
+                # 저장한 행을 디스크에 기록한 뒤에 페이지 완료를 기록해야 재시작 시 누락이 없음
+                # 리뷰 끝이면 연속 빈 페이지 한도로 기록하여 재시작 시 이 스트림을 다시 요청하지 않음
+                if self.checkpoint:
+                    with self.store_lock, self.telemetry.timer("checkpoint"):
+                        sd.flush()
+                        if page_range:
+                            self.checkpoint.add_review_keys(prod_code, reviews)
+                        else:
+                            self.checkpoint.mark_page(prod_code, current_page,
+                                                      max_empty_pages if exhausted_at else consecutive_empty_pages,
+                                                      reviews, progress_key=progress_key)
+
+                current_page += 1
+                if exhausted_at:
+                    break
+        finally:
+            # 종료 조건에 걸린 뒤 남은 미리 요청 페이지는 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # 차단/실패로 받지 못한 페이지(연속 빈 페이지)는 리뷰 끝으로 보지 않음
+        # (작업 큐가 이후 구간을 건너뛰므로 빈 리뷰 목록/짧은 페이지로 확인한 리뷰 끝만 기록)
+        empty_from_page = exhausted_at
+
+        # 종료 종류 (COMPLETE_STREAM_ENDS에 속하면 스트림의 실제 끝)
+        end_kind, end_reason = None, None
+        if stream_completed:
+            end_kind = "completed"
+        elif reached_known_reviews:
+            end_kind, end_reason = "known_reviews", "이미 수집된 리뷰에 도달하여 다음 상품으로 진행 (증분 모드)"
+        elif exhausted_at:
+            end_kind, end_reason = "exhausted", f"리뷰 끝 확인 (페이지 {exhausted_at}부터 리뷰 없음)"
+        elif budget_stopped:
+            end_kind = "budget"
+            end_reason = f"크롤링 예산 소진으로 페이지 {current_page} 전에 중단 (다음 실행에서 이어서 크롤링)"
+        elif consecutive_empty_pages >= max_empty_pages:
+            end_kind = "empty_pages"
+            end_reason = f"연속 {max_empty_pages}번 빈 페이지로 인해 다음 상품으로 진행 (완료로 기록하지 않음)"
+        elif consecutive_empty_pages:
+            end_kind = "failed"
+            end_reason = f"마지막 {consecutive_empty_pages}페이지를 받지 못해 완료로 기록하지 않음"
+        elif page_range and current_page > last_page:
+            end_kind, end_reason = "range", f"페이지 구간 {start_page}~{last_page} 완료"
+        elif planned and current_page > last_page:
+            end_kind, end_reason = "planned", f"계획한 페이지 수({last_page})까지 요청하여 완료"
         elif current_page > self.max_pages:
-            print(f"[INFO] 최대 페이지 수({self.max_pages})에 도달하여 완료")
+            end_kind, end_reason = "max_pages", f"최대 페이지 수({self.max_pages})에 도달하여 완료"
+
+        if self.checkpoint and rating and end_kind in self.COMPLETE_STREAM_ENDS:
+            self.checkpoint.mark_completed(progress_key)
+
+        return {
+            "rating": rating,
+            "success_count": success_count,
+            "pages_tried": current_page - 1,
+            "resume_page": resume_page,
+            "reached_known_reviews": reached_known_reviews,
+            "exhausted": exhausted_at is not None,
+            "budget_stopped": budget_stopped,
+            "empty_from_page": empty_from_page,
+            "end_kind": end_kind,
+            "end_reason": end_reason,
+        }
+
+    # v1.8: 별점 샤딩 시 스트림별 ratings 파라미터 값
+    RATING_SHARDS = ("5", "4", "3", "2", "1")
+    # v1.8: 상품을 완료로 기록할 수 있는 스트림 종료 종류 (차단/실패/예산 소진은 제외)
+    COMPLETE_STREAM_ENDS = ("completed", "known_reviews", "exhausted", "planned", "max_pages")
+    # v1.8: 페이지 구간 작업(작업 큐)을 완료로 기록할 수 있는 종료 종류 (구간 끝까지 요청한 경우 포함)
+    COMPLETE_RANGE_ENDS = COMPLETE_STREAM_ENDS + ("range",)
+    # v1.6: 연속 빈 페이지 허용 횟수 (5번 연속 리뷰 없음시 다음 상품으로)
+    MAX_EMPTY_PAGES = 5
+
+    @staticmethod
+    def is_end_page(reviews) -> bool:
+        """리뷰 끝 페이지인지 (빈 리뷰 목록 응답(None)이거나 리뷰가 REVIEW_PAGE_SIZE개보다 적은 페이지)"""
+        return reviews is None or 0 < len(reviews) < REVIEW_PAGE_SIZE
+
+    @classmethod
+    def has_prefetched_end(cls, pending: dict) -> bool:
+        """미리 요청해 둔 페이지(Future/Task) 중 이미 받은 페이지가 리뷰 끝인지 (그 뒤 페이지는 더 요청하지 않음)"""
+        return any(future.done() and not future.cancelled() and future.exception() is None and
+                   cls.is_end_page(future.result()) for future in pending.values())
 
-        return success_count > 0
+    @staticmethod
+    def build_review_payload(prod_code: str, page: int, rating: str = "") -> dict:
+        """리뷰 API 요청 파라미터 생성 (rating을 지정하면 해당 별점 리뷰만)"""
+        return {
+            "productId": prod_code,
+            "page": page,
+            "size": REVIEW_PAGE_SIZE,
+            "sortBy": "DATE_DESC",
+            "ratings": rating,
+            "q": "",
+            "viRoleCode": 2,
+            "ratingSummary": False,
+        }
 
     def fetch(self, payload: dict, sd) -> bool:
+        """페이지 1개를 요청/파싱하고 리뷰를 저장 (리뷰가 있으면 True)"""
+        reviews = self.fetch_page(payload)
+        if not reviews:
+            return False
+
+        self.store_reviews(reviews, sd)
+        return True
+
+    def fetch_page(self, payload: dict) -> list:
+        """v1.8: 페이지 1개를 요청/파싱만 하고 리뷰 목록 반환 (저장은 store_reviews)
+
+        파이프라인 모드에서 여러 페이지가 동시에 요청되므로 프록시는 self.proxy_rotator.current_proxy가
+        아닌 이번 요청에서 사용한 프록시를 기준으로 실패 처리한다.
+        빈 리뷰 목록 지문(리뷰 끝)이면 None, 차단/실패로 리뷰를 받지 못했으면 빈 리스트를 반환한다.
+        """
         now_page: int = payload["page"]
         print(f"\n[INFO] Start crawling page {now_page} ...")
         attempt: int = 0
         proxy_attempts: int = 0
         max_proxy_attempts: int = min(10, len(self.proxy_rotator.proxy_list) if self.proxy_rotator else 0)
+        unknown_retried = False
+        blocked_proxies = set()  # 이 페이지 요청에서 차단된 프록시 (재요청에 다시 쓰지 않음)
 
         while attempt < self.retries:
+            proxy = None
             try:
                 # 매 요청마다 새로운 User-Agent 사용
                 if attempt > 0:
                     self.update_headers()
 
-                session = self.get_session_with_proxy()
-                session.cookies.update(self.session.cookies)
-                session.headers.update({
-                    "Referer": f"https://www.coupang.com/vp/products/{payload['productId']}"
-                })
-
-                resp = session.get(
-                    url=self.base_review_url,
-                    params=payload,
-                    timeout=(15, 30),
-                )
-
+                # 다른 페이지가 사용 중인 프록시와 이 페이지에서 차단된 프록시는 가급적 피해서 선택
+                session, proxy = self.get_session_with_proxy(exclude=self.in_flight_proxies | blocked_proxies)
+                cookies = self.get_warm_cookies(payload["productId"], proxy, session)
+                headers = {
+                    **self.headers,
+                    "Referer": f"https://www.coupang.com/vp/products/{payload['productId']}",
+                }
+
+                if proxy:
+                    self.in_flight_proxies.add(proxy)
+                try:
+                    self.wait_for_rate_limit(proxy, review_page=True)
+                    request_start = time.time()
+                    resp = session.get(
+                        url=self.base_review_url,
+                        params=payload,
+                        headers=headers,
+                        cookies=cookies,
+                        timeout=(15, 30),
+                    )
+                finally:
+                    if proxy:
+                        self.in_flight_proxies.discard(proxy)
+
+                # resp.elapsed는 요청 전송부터 응답 헤더 파싱까지, 나머지는 본문 수신 시간
+                request_elapsed = time.time() - request_start
+                connect_elapsed = min(resp.elapsed.total_seconds(), request_elapsed)
+                self.telemetry.observe("connect", connect_elapsed)
+                self.telemetry.observe("download", request_elapsed - connect_elapsed)
                 self.consecutive_timeouts = 0
+                self.cookie_cache.update(proxy, resp.cookies)
 
-                if resp.status_code == 403:
-                    print(f"[ERROR] HTTP 403 응답 - 프록시가 차단됨")
-                    if self.proxy_rotator and self.proxy_rotator.current_proxy:
-                        self.proxy_rotator.mark_proxy_failed(self.proxy_rotator.current_proxy)
+                # v1.8: 응답 분류 (상태 코드/길이/제목/마커, 같은 응답은 캐시)
+                # 차단이면 파싱하지 않고 프록시의 회로를 바로 열어 다른 프록시로 재요청 (요청 간격은 AdaptivePacer가 늘림)
+                html = resp.text
+                page_kind = self.block_classifier.classify(html, resp.status_code)
+                if page_kind == "blocked":
+                    if resp.status_code == 403:
+                        print(f"[ERROR] HTTP 403 응답 - 프록시가 차단됨")
+                        self.telemetry.increment("http_403")
+                    else:
+                        print(f"[WARNING] 페이지 {now_page}: 차단 페이지 감지 (HTTP {resp.status_code})")
+                        self.telemetry.increment("blocked_pages")
+                    self.pacer.record_failure(proxy)
+                    self.cookie_cache.invalidate(proxy)
                     attempt += 1
+                    if proxy:
+                        self.proxy_rotator.mark_proxy_blocked(proxy)
+                        blocked_proxies.add(proxy)
+                        self.telemetry.increment("proxy_swaps")
+                        proxy_attempts += 1
+                        if proxy_attempts > max_proxy_attempts:
+                            print(f"[ERROR] 프록시 {max_proxy_attempts}개가 연속 차단되어 페이지 {now_page}를 건너뜁니다.")
+                            return []
                     continue
                 elif resp.status_code != 200:
                     print(f"[ERROR] HTTP {resp.status_code} 응답")
+                    self.telemetry.increment("http_error")
                     attempt += 1
                     continue
 
-                html = resp.text
-                soup = bs(html, "html.parser")
+                self.record_response(payload, html)
 
-                if self.page_title is None:
-                    first_review = soup.select_one("article.sdp-review__article__list")
-                    if first_review:
-                        title_elem = first_review.select_one("div.sdp-review__article__list__info__product-info__name")
-                        self.page_title = title_elem.text.strip() if title_elem else self.title
-                    else:
-                        self.page_title = self.title
+                # v1.8: 빈 리뷰 목록은 리뷰 끝이므로 파싱하지 않고 프록시를 바꿔 다시 요청하지도 않음
+                if page_kind == "empty":
+                    print(f"[INFO] 페이지 {now_page}: 빈 리뷰 목록 (리뷰 끝)")
+                    self.telemetry.increment("empty_pages")
+                    self.proxy_rotator.record_success(proxy, request_elapsed)
+                    self.pacer.record_success(proxy, request_elapsed)
+                    return None
 
-                articles = soup.select("article.sdp-review__article__list")
-                article_length = len(articles)
+                with self.telemetry.timer("parse"):
+                    reviews = self.review_parser.parse(html)
+                article_length = len(reviews)
 
                 if article_length == 0:
-                    print(f"[WARNING] 페이지 {now_page}에서 리뷰를 찾을 수 없습니다.")
-
-                    # 프록시 사용 중이라면 다른 프록시로 재시도
-                    if self.proxy_rotator and self.proxy_rotator.current_proxy and proxy_attempts < max_proxy_attempts:
-                        print(f"[INFO] 프록시 차단 가능성으로 다른 프록시로 재시도 ({proxy_attempts + 1}/{max_proxy_attempts})")
-                        self.proxy_rotator.mark_proxy_failed(self.proxy_rotator.current_proxy)
-                        proxy_attempts += 1
+                    # 리뷰 항목이 있는데 파싱한 리뷰가 없거나(파서/레이아웃 문제), 리뷰 목록 구조도 차단 지문도 없는 응답은
+                    # 리뷰 끝으로 보지 않고, 프록시를 버리지 않고 한 번만 다시 요청
+                    # 리뷰 목록 없는 응답은 소프트 차단일 수 있으므로 요청 간격은 늘림
+                    print(f"[WARNING] 페이지 {now_page}에서 리뷰를 찾을 수 없습니다. "
+                          f"({'리뷰 항목 파싱 실패' if page_kind == 'reviews' else '리뷰 목록 없는 응답'}, {len(html)}자)")
+                    if page_kind == "unknown":
+                        self.pacer.record_failure(proxy)
+                    if now_page == 1:
+                        print(f"[DEBUG] 첫 페이지 응답 제목: {self.block_classifier.get_title(html)!r}")
+                    if not unknown_retried:
+                        unknown_retried = True
                         attempt += 1
-                        retry_delay = random.uniform(1.0, 3.0)
-                        print(f"[DEBUG] {retry_delay:.1f}초 후 다른 프록시로 재시도...")
-                        time.sleep(retry_delay)
                         continue
-
-                    # 차단 감지 및 추가 처리
-                    if now_page == 1:
-                        print("[DEBUG] 첫 페이지 HTML 구조 확인:")
-                        print(f"  - 전체 길이: {len(html)} 문자")
-                        print(f"  - 'review' 포함 횟수: {html.lower().count('review')}")
-                        print(f"  - 'article' 포함 횟수: {html.lower().count('article')}")
-
-                        blocked_indicators = [
-                            "access denied", "blocked", "forbidden",
-                            "captcha", "robot", "bot", "security", "verification"
-                        ]
-
-                        html_lower = html.lower()
-                        is_blocked = False
-                        for indicator in blocked_indicators:
-                            if indicator in html_lower:
-                                print(f"[WARNING] 차단 감지: '{indicator}' 발견")
-                                is_blocked = True
-                                break
-
-                        if is_blocked and attempt < self.retries - 2:
-                            print("[INFO] 차단 감지로 인한 추가 재시도...")
-                            attempt += 1
-                            long_delay = random.uniform(5.0, 10.0)
-                            print(f"[DEBUG] {long_delay:.1f}초 대기 후 재시도...")
-                            time.sleep(long_delay)
-                            continue
-
-                    return False
+                    return []
 
                 print(f"[SUCCESS] 페이지 {now_page}에서 {article_length}개 리뷰 발견")
-
-                # 리뷰 데이터 처리
-                for idx in range(article_length):
-                    dict_data: dict[str, str | int] = dict()
-
-                    review_date_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__reg-date"
-                    )
-                    review_date = review_date_elem.text.strip() if review_date_elem else "-"
-
-                    user_name_elem = articles[idx].select_one(
-                        "span.sdp-review__article__list__info__user__name"
-                    )
-                    user_name = user_name_elem.text.strip() if user_name_elem else "-"
-
-                    rating_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__star-orange"
-                    )
-                    if rating_elem and rating_elem.get("data-rating"):
-                        try:
-                            rating = int(rating_elem.get("data-rating"))
-                        except (ValueError, TypeError):
-                            rating = 0
-                    else:
-                        rating = 0
-
-                    prod_name_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__info__product-info__name"
-                    )
-                    prod_name = prod_name_elem.text.strip() if prod_name_elem else "-"
-
-                    headline_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__headline"
-                    )
-                    headline = headline_elem.text.strip() if headline_elem else ""
-
-                    review_content_elem = articles[idx].select_one(
-                        "div.sdp-review__article__list__review__content.js_reviewArticleContent"
-                    )
-                    if review_content_elem:
-                        review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
-                    else:
-                        review_content_elem = articles[idx].select_one(
-                            "div.sdp-review__article__list__review > div"
-                        )
-                        if review_content_elem:
-                            review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
-                        else:
-                            review_content = ""
-
-                    helpful_count_elem = articles[idx].select_one("span.js_reviewArticleHelpfulCount")
-                    helpful_count = helpful_count_elem.text.strip() if helpful_count_elem else "0"
-
-                    review_images = articles[idx].select("div.sdp-review__article__list__attachment__list img")
-                    image_count = len(review_images)
-
-                    dict_data["title"] = self.page_title
-                    dict_data["prod_name"] = prod_name
-                    dict_data["review_date"] = review_date
-                    dict_data["user_name"] = user_name
-                    dict_data["rating"] = rating
-                    dict_data["headline"] = headline
-                    dict_data["review_content"] = review_content
-                    dict_data["helpful_count"] = helpful_count
-                    dict_data["image_count"] = image_count
-
-                    sd.save(datas=dict_data)
-                    print(f"[SUCCESS] 리뷰 저장 완료: {user_name} - {rating}점")
-
-                page_delay = random.uniform(self.page_delay_min, self.page_delay_max)
-                print(f"[DEBUG] 다음 페이지까지 {page_delay:.1f}초 대기...")
-                time.sleep(page_delay)
-                return True
+                self.proxy_rotator.record_success(proxy, request_elapsed)
+                self.pacer.record_success(proxy, request_elapsed)
+                return reviews
 
             except RequestException as e:
                 attempt += 1
@@ -901,8 +3504,10 @@ class Coupang:
                     "403", "proxy", "connection", "timeout", "refused", "unreachable"
                 ])
 
-                if is_proxy_error and self.proxy_rotator and self.proxy_rotator.current_proxy:
-                    self.proxy_rotator.mark_proxy_failed(self.proxy_rotator.current_proxy)
+                # 타임아웃은 해당 프록시의 회로에만 반영
+                if (is_proxy_error or self.is_timeout_error(e)) and proxy:
+                    self.proxy_rotator.mark_proxy_failed(proxy)
+                    self.telemetry.increment("proxy_swaps")
                     print("[INFO] 프록시 오류로 인한 다른 프록시로 재시도합니다.")
 
                     available_proxies = self.proxy_rotator.get_available_proxy_count()
@@ -913,28 +3518,131 @@ class Coupang:
 
                 if self.is_timeout_error(e):
                     self.consecutive_timeouts += 1
+                    self.telemetry.increment("timeouts")
+                    self.pacer.record_failure(proxy)
                     print(f"[ERROR] 타임아웃 발생 (연속 {self.consecutive_timeouts}회): {e}")
-
-                    if self.consecutive_timeouts >= self.max_consecutive_timeouts:
-                        self.handle_consecutive_timeouts()
+                    self.handle_consecutive_timeouts()
                 else:
                     self.consecutive_timeouts = 0
+                    self.telemetry.increment("network_errors")
                     print(f"[ERROR] 네트워크 오류: {e}")
 
                 print(f"[ERROR] Attempt {attempt}/{self.retries} failed")
                 if attempt < self.retries:
                     retry_delay = random.uniform(self.delay_min, self.delay_max)
                     print(f"[DEBUG] {retry_delay:.1f}초 후 재시도...")
-                    time.sleep(retry_delay)
+                    self.pause(retry_delay)
                 else:
                     print(f"[ERROR] 최대 요청 횟수 초과! 페이지 {now_page} 크롤링 실패.")
-                    return False
+                    return []
             except Exception as e:
                 print(f"[ERROR] 예상치 못한 오류 발생: {e}")
                 self.consecutive_timeouts = 0
-                return False
+                return []
 
-        return False
+        return []
+
+    @staticmethod
+    def extract_review(article) -> dict:
+        """리뷰 article 요소 1개에서 필드 추출 (상품명 title은 저장 시점에 채움)"""
+        dict_data: dict[str, str | int] = dict()
+
+        review_date_elem = article.select_one(
+            "div.sdp-review__article__list__info__product-info__reg-date"
+        )
+        review_date = review_date_elem.text.strip() if review_date_elem else "-"
+
+        user_name_elem = article.select_one(
+            "span.sdp-review__article__list__info__user__name"
+        )
+        user_name = user_name_elem.text.strip() if user_name_elem else "-"
+
+        rating_elem = article.select_one(
+            "div.sdp-review__article__list__info__product-info__star-orange"
+        )
+        if rating_elem and rating_elem.get("data-rating"):
+            try:
+                rating = int(rating_elem.get("data-rating"))
+            except (ValueError, TypeError):
+                rating = 0
+        else:
+            rating = 0
+
+        prod_name_elem = article.select_one(
+            "div.sdp-review__article__list__info__product-info__name"
+        )
+        prod_name = prod_name_elem.text.strip() if prod_name_elem else "-"
+
+        headline_elem = article.select_one(
+            "div.sdp-review__article__list__headline"
+        )
+        headline = headline_elem.text.strip() if headline_elem else ""
+
+        review_content_elem = article.select_one(
+            "div.sdp-review__article__list__review__content.js_reviewArticleContent"
+        )
+        if review_content_elem:
+            review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
+        else:
+            review_content_elem = article.select_one(
+                "div.sdp-review__article__list__review > div"
+            )
+            if review_content_elem:
+                review_content = re.sub("[\n\t]", "", review_content_elem.text.strip())
+            else:
+                review_content = ""
+
+        helpful_count_elem = article.select_one("span.js_reviewArticleHelpfulCount")
+        helpful_count = helpful_count_elem.text.strip() if helpful_count_elem else "0"
+
+        review_images = article.select("div.sdp-review__article__list__attachment__list img")
+        image_count = len(review_images)
+
+        dict_data["prod_name"] = prod_name
+        dict_data["review_date"] = review_date
+        dict_data["user_name"] = user_name
+        dict_data["rating"] = rating
+        dict_data["headline"] = headline
+        dict_data["review_content"] = review_content
+        dict_data["helpful_count"] = helpful_count
+        dict_data["image_count"] = image_count
+        return dict_data
+
+    @staticmethod
+    def resolve_page_title(reviews: list, fallback: str) -> str:
+        """첫 리뷰의 구매상품명을 페이지 타이틀로 사용 (없으면 fallback)"""
+        first_prod_name = reviews[0]["prod_name"] if reviews else "-"
+        return first_prod_name if first_prod_name != "-" else fallback
+
+    def drop_duplicate_reviews(self, prod_code: str, reviews: list) -> list:
+        """체크포인트의 리뷰 키와 중복 제거 필터로 이미 저장한 리뷰를 제외하고, 제외한 수를 집계"""
+        fetched_count = len(reviews)
+        if self.checkpoint:
+            reviews = self.checkpoint.filter_new_reviews(prod_code, reviews)
+        if self.review_dedup:
+            reviews = self.review_dedup.filter_new(prod_code, reviews)
+
+        duplicates = fetched_count - len(reviews)
+        if duplicates:
+            self.add_crawl_stat("duplicates", duplicates)
+            self.telemetry.increment("duplicate_reviews", duplicates)
+            print(f"[INFO] 중복 리뷰 {duplicates}개 제외 (상품 {prod_code})")
+        return reviews
+
+    def store_reviews(self, reviews: list, sd) -> None:
+        """파싱된 리뷰 목록을 저장 (파이프라인 모드에서도 항상 페이지 순서대로 호출됨)"""
+        if not reviews:
+            return
+
+        if self.page_title is None:
+            self.page_title = self.resolve_page_title(reviews, self.title)
+
+        for review in reviews:
+            dict_data = {"title": self.page_title, **review}
+            sd.save(datas=dict_data)
+            self.add_crawl_stat("reviews")
+            self.telemetry.increment("reviews")
+            print(f"[SUCCESS] 리뷰 저장 완료: {review['user_name']} - {review['rating']}점")
 
     @staticmethod
     def clear_console() -> None:
@@ -949,14 +3657,445 @@ class Coupang:
             pass
 
 
+class AsyncReviewFetcher:
+    """v1.8: asyncio + httpx 기반 리뷰 수집 백엔드
+
+    프록시마다 연결 풀을 가진 httpx.AsyncClient 하나를 만들어 페이지/상품 전체에서 재사용한다.
+    요청 하나마다 스레드나 세션을 만들지 않으므로 단일 코어에서도 수백 개의 요청을 동시에 유지할 수 있으며,
+    재시도/403/빈 페이지 처리 규칙은 Coupang.fetch_page와 동일하다.
+    체크포인트(SQLite), 중복 제거 필터, HTML 보관소, 저장 파일처럼 디스크를 쓰는 작업은
+    asyncio.to_thread로 스레드에서 실행해 이벤트 루프(다른 요청들)를 막지 않는다.
+    """
+
+    def __init__(self, crawler: "Coupang", max_in_flight: int = 200, max_connections_per_proxy: int = 20):
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx가 설치되지 않았습니다. pip install httpx로 설치하세요.")
+
+        self.crawler = crawler
+        self.proxy_rotator = crawler.proxy_rotator
+        self.max_in_flight = max_in_flight
+        self.max_connections_per_proxy = max_connections_per_proxy
+        self.clients = {}  # proxy(None이면 직접 연결) -> httpx.AsyncClient
+        self.cookie_cache = crawler.cookie_cache  # 프록시별 예열 쿠키 (requests 백엔드와 같은 캐시)
+        self.warm_locks = {}  # proxy -> asyncio.Lock
+        self.semaphore = None  # 이벤트 루프 안에서 생성
+        self.in_flight_proxies = set()
+
+    def get_client(self, proxy):
+        """프록시별 연결 풀 클라이언트 반환 (없으면 생성 후 재사용)"""
+        client = self.clients.get(proxy)
+        if client is None:
+            proxy_url = None
+            if proxy:
+                proxy_dict = self.proxy_rotator.get_proxy_dict(proxy)
+                proxy_url = proxy_dict['https'] if proxy_dict else None
+
+            client = httpx.AsyncClient(
+                proxy=proxy_url,
+                timeout=httpx.Timeout(30.0, connect=15.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_proxy,
+                    max_keepalive_connections=self.max_connections_per_proxy,
+                ),
+                follow_redirects=True,
+            )
+            self.clients[proxy] = client
+        return client
+
+    def select_proxy(self, exclude=()):
+        """다른 요청이 사용 중인 프록시(와 exclude)를 피해서 선택"""
+        if self.proxy_rotator and self.proxy_rotator.proxy_list:
+            return self.proxy_rotator.get_random_proxy_from_working_set(exclude=self.in_flight_proxies | set(exclude))
+        return None
+
+    async def close(self) -> None:
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+
+    async def request(self, url: str, params=None, headers=None, timeout=None, proxy=None, cookies=None,
+                      review_page: bool = False):
+        """전역 속도 제한 + 동시 요청 수 제한을 거쳐 GET 요청 (응답, 사용한 프록시 반환, review_page이면 리뷰 페이지 요청으로 집계)"""
+        client = self.get_client(proxy)
+        telemetry = self.crawler.telemetry
+
+        async with self.semaphore:
+            if self.crawler.rate_limiter:
+                with telemetry.timer("rate_limit"):
+                    await self.crawler.rate_limiter.acquire_async()
+            telemetry.observe("pace", await self.crawler.pacer.wait_async(proxy))
+            self.crawler.add_crawl_stat("requests")
+            telemetry.increment("requests")
+            if review_page:
+                telemetry.increment("review_requests")
+
+            if proxy:
+                self.in_flight_proxies.add(proxy)
+            try:
+                # 헤더 수신(connect)과 본문 수신(download) 시간을 나눠 재기 위해 스트리밍으로 받음
+                request = client.build_request("GET", url, params=params, headers=headers,
+                                               cookies=httpx.Cookies(cookies) if cookies is not None else None,
+                                               timeout=timeout)
+                request_start = time.perf_counter()
+                resp = await client.send(request, stream=True)
+                headers_received = time.perf_counter()
+                try:
+                    await resp.aread()
+                finally:
+                    await resp.aclose()
+                telemetry.observe("connect", headers_received - request_start)
+                telemetry.observe("download", time.perf_counter() - headers_received)
+            finally:
+                if proxy:
+                    self.in_flight_proxies.discard(proxy)
+        return resp, proxy
+
+    async def pause(self, seconds: float) -> None:
+        """이벤트 루프를 막지 않고 대기 (대기 시간은 텔레메트리의 sleep 단계로 기록)"""
+        if seconds <= 0:
+            return
+        self.crawler.telemetry.observe("sleep", seconds)
+        await asyncio.sleep(seconds)
+
+    async def warm_up_session(self, prod_code: str, proxy=None):
+        """메인 페이지와 상품 페이지를 방문해 쿠키 확보 (해당 프록시로 받은 쿠키 jar 반환)"""
+        cookies = rq.cookies.RequestsCookieJar()
+        self.crawler.telemetry.increment("warm_ups")
+        try:
+            print("[INFO] 세션 예열 중... (async)")
+            headers = self.crawler.get_realistic_headers()
+            resp, _ = await self.request(self.crawler.base_url, headers=headers, timeout=15, proxy=proxy)
+            if resp.status_code == 200:
+                for cookie in resp.cookies.jar:
+                    cookies.set_cookie(cookie)
+                await self.pause(random.uniform(self.crawler.warm_up_delay_min, self.crawler.warm_up_delay_max))
+
+                product_url = f"{self.crawler.base_url}/vp/products/{prod_code}"
+                resp2, _ = await self.request(product_url, headers=headers, timeout=15, proxy=proxy, cookies=cookies)
+                if resp2.status_code == 200:
+                    for cookie in resp2.cookies.jar:
+                        cookies.set_cookie(cookie)
+        except Exception as e:
+            print(f"[WARNING] 세션 예열 실패: {e}")
+        return cookies
+
+    async def get_warm_cookies(self, prod_code: str, proxy=None):
+        """Coupang.get_warm_cookies의 async 버전 (같은 프록시는 한 번만 예열)"""
+        cookies = self.cookie_cache.get(proxy)
+        if cookies is not None:
+            return cookies
+
+        lock = self.warm_locks.setdefault(proxy, asyncio.Lock())
+        async with lock:
+            cookies = self.cookie_cache.get(proxy)
+            if cookies is None:
+                self.cookie_cache.put(proxy, await self.warm_up_session(prod_code, proxy))
+                cookies = self.cookie_cache.get(proxy)
+        return cookies
+
+    async def fetch_page(self, payload: dict) -> list:
+        """Coupang.fetch_page의 async 버전 (페이지 1개를 요청/파싱하여 리뷰 목록 반환, 리뷰 끝이면 None)"""
+        crawler = self.crawler
+        telemetry = crawler.telemetry
+        now_page: int = payload["page"]
+        attempt: int = 0
+        proxy_attempts: int = 0
+        max_proxy_attempts: int = min(10, len(self.proxy_rotator.proxy_list) if self.proxy_rotator else 0)
+        unknown_retried = False
+        blocked_proxies = set()  # 이 페이지 요청에서 차단된 프록시 (재요청에 다시 쓰지 않음)
+
+        while attempt < crawler.retries:
+            proxy = None
+            try:
+                headers = crawler.get_realistic_headers()
+                headers["Referer"] = f"https://www.coupang.com/vp/products/{payload['productId']}"
+
+                proxy = self.select_proxy(exclude=blocked_proxies)
+                cookies = await self.get_warm_cookies(payload["productId"], proxy)
+                resp, proxy = await self.request(crawler.base_review_url, params=payload, headers=headers,
+                                                 proxy=proxy, cookies=cookies, review_page=True)
+                # 대기열/속도 제한/요청 간격 대기를 뺀 실제 요청 시간
+                request_elapsed = resp.elapsed.total_seconds()
+                crawler.consecutive_timeouts = 0
+                self.cookie_cache.update(proxy, resp.cookies)
+
+                # 차단 응답이면 파싱하지 않고 프록시의 회로를 바로 열어 다른 프록시로 재요청 (요청 간격은 AdaptivePacer가 늘림)
+                html = resp.text
+                page_kind = crawler.block_classifier.classify(html, resp.status_code)
+                if page_kind == "blocked":
+                    if resp.status_code == 403:
+                        print(f"[ERROR] HTTP 403 응답 - 프록시가 차단됨 (페이지 {now_page})")
+                        telemetry.increment("http_403")
+                    else:
+                        print(f"[WARNING] 차단 페이지 감지 (HTTP {resp.status_code}, 페이지 {now_page})")
+                        telemetry.increment("blocked_pages")
+                    crawler.pacer.record_failure(proxy)
+                    self.cookie_cache.invalidate(proxy)
+                    attempt += 1
+                    if proxy:
+                        self.proxy_rotator.mark_proxy_blocked(proxy)
+                        blocked_proxies.add(proxy)
+                        telemetry.increment("proxy_swaps")
+                        proxy_attempts += 1
+                        if proxy_attempts > max_proxy_attempts:
+                            return []
+                    continue
+                elif resp.status_code != 200:
+                    print(f"[ERROR] HTTP {resp.status_code} 응답 (페이지 {now_page})")
+                    telemetry.increment("http_error")
+                    attempt += 1
+                    continue
+
+                await asyncio.to_thread(crawler.record_response, payload, html)
+
+                # 빈 리뷰 목록은 리뷰 끝이므로 파싱하지 않고 프록시를 바꿔 다시 요청하지도 않음
+                if page_kind == "empty":
+                    telemetry.increment("empty_pages")
+                    self.proxy_rotator.record_success(proxy, request_elapsed)
+                    crawler.pacer.record_success(proxy, request_elapsed)
+                    return None
+
+                with telemetry.timer("parse"):
+                    reviews = crawler.review_parser.parse(html)
+
+                if not reviews:
+                    # 리뷰 항목 파싱 실패 또는 리뷰 목록 구조도 차단 지문도 없는 응답은 한 번만 다시 요청
+                    # (리뷰 목록 없는 응답은 소프트 차단일 수 있으므로 요청 간격은 늘림)
+                    if page_kind == "unknown":
+                        crawler.pacer.record_failure(proxy)
+                    if not unknown_retried:
+                        unknown_retried = True
+                        attempt += 1
+                        continue
+                    return []
+
+                self.proxy_rotator.record_success(proxy, request_elapsed)
+                crawler.pacer.record_success(proxy, request_elapsed)
+                return reviews
+
+            except httpx.HTTPError as e:
+                attempt += 1
+
+                error_str = f"{type(e).__name__} {e}".lower()
+                is_proxy_error = any(keyword in error_str for keyword in [
+                    "403", "proxy", "connect", "timeout", "refused", "unreachable"
+                ])
+                # 타임아웃은 해당 프록시의 회로에만 반영
+                if (is_proxy_error or isinstance(e, httpx.TimeoutException)) and proxy:
+                    self.proxy_rotator.mark_proxy_failed(proxy)
+                    telemetry.increment("proxy_swaps")
+
+                if isinstance(e, httpx.TimeoutException):
+                    crawler.consecutive_timeouts += 1
+                    telemetry.increment("timeouts")
+                    crawler.pacer.record_failure(proxy)
+                    print(f"[ERROR] 타임아웃 발생 (연속 {crawler.consecutive_timeouts}회, 페이지 {now_page}): {e}")
+                    # 대부분의 프록시 회로가 열렸을 때만 대기 (이벤트 루프 전체를 막지 않도록 이 요청만 대기)
+                    wait_time = crawler.get_global_backoff()
+                    if wait_time > 0:
+                        await self.pause(wait_time)
+                else:
+                    crawler.consecutive_timeouts = 0
+                    telemetry.increment("network_errors")
+                    print(f"[ERROR] 네트워크 오류 (페이지 {now_page}): {e}")
+
+                if attempt < crawler.retries:
+                    await self.pause(random.uniform(crawler.delay_min, crawler.delay_max))
+                else:
+                    print(f"[ERROR] 최대 요청 횟수 초과! 페이지 {now_page} 크롤링 실패.")
+                    return []
+            except Exception as e:
+                print(f"[ERROR] 예상치 못한 오류 발생: {e}")
+                crawler.consecutive_timeouts = 0
+                return []
+
+        return []
+
+    async def crawl_product(self, url: str, product_name: str, review_count: int = None) -> bool:
+        """상품 1개 크롤링 (종료 규칙과 크롤링 계획은 Coupang.crawl_single_product와 동일)"""
+        crawler = self.crawler
+        url = url.split('#')[0]
+        prod_code = crawler.get_product_code(url=url)
+
+        sd = await asyncio.to_thread(crawler.create_save_data)
+        page_title = None
+        success_count = 0
+        current_page = 1
+        consecutive_empty_pages = 0
+        max_empty_pages = crawler.MAX_EMPTY_PAGES
+        planned_pages = crawler.get_planned_pages(review_count)
+        last_page = planned_pages or crawler.max_pages
+        # 카탈로그 리뷰 수로 보면 리뷰 끝이 확인될 페이지 (이후 여유 페이지는 미리 요청하지 않음)
+        expected_pages = crawler.get_expected_requests(review_count) if planned_pages else None
+        proxy_change_attempts = 0
+        reached_known_reviews = False
+        exhausted = False
+        budget_stopped = False
+        stored_reviews = 0
+        requested_pages = 0  # 여러 상품이 동시에 진행되므로 크롤링 이력용 요청 수는 상품별로 직접 셈
+
+        # 체크포인트가 있으면 마지막으로 처리한 페이지 다음부터 이어서 크롤링
+        resume_page = 0
+        if crawler.checkpoint:
+            resume_page, consecutive_empty_pages = await asyncio.to_thread(crawler.checkpoint.get_progress, prod_code)
+            if consecutive_empty_pages >= max_empty_pages:
+                # 지난 실행이 연속 빈 페이지(차단/실패)로 끝났으면 첫 빈 페이지부터 다시 시도
+                resume_page = max(0, resume_page - consecutive_empty_pages)
+                consecutive_empty_pages = 0
+            current_page = resume_page + 1
+
+        window = max(1, crawler.prefetch_window)
+        pending = {}  # page -> Task
+        next_page = current_page
+
+        try:
+            while consecutive_empty_pages < max_empty_pages and current_page <= last_page:
+                # 예산을 다 썼으면 이미 요청해 둔 페이지까지만 처리
+                if current_page not in pending and crawler.is_budget_exhausted():
+                    budget_stopped = True
+                    break
+
+                budget_left = crawler.get_request_budget_left()
+                prefetched_end = crawler.has_prefetched_end(pending)
+                while (len(pending) < window and
+                       next_page <= last_page and
+                       not prefetched_end and
+                       consecutive_empty_pages + len(pending) < max_empty_pages and
+                       (expected_pages is None or next_page <= expected_pages or not pending) and
+                       (budget_left is None or len(pending) < budget_left)):
+                    payload = crawler.build_review_payload(prod_code, next_page)
+                    pending[next_page] = asyncio.ensure_future(self.fetch_page(payload))
+                    requested_pages += 1
+                    next_page += 1
+
+                reviews = await pending.pop(current_page)
+                # 빈 리뷰 목록 응답(None)과 리뷰가 REVIEW_PAGE_SIZE개보다 적은 페이지는 리뷰 끝
+                exhausted = crawler.is_end_page(reviews)
+                reviews = reviews or []
+
+                if reviews:
+                    fetched_count = len(reviews)
+                    new_reviews = await asyncio.to_thread(crawler.drop_duplicate_reviews, prod_code, reviews)
+                    if crawler.incremental and not new_reviews:
+                        print(f"[INFO] 증분 모드: {product_name} 페이지 {current_page}부터는 이미 수집된 리뷰입니다.")
+                        reached_known_reviews = True
+                        break
+                    reviews = new_reviews
+                    if page_title is None and reviews:
+                        page_title = crawler.resolve_page_title(reviews, product_name)
+                    await asyncio.to_thread(self.save_reviews, sd, page_title, reviews)
+                    crawler.add_crawl_stat("reviews", len(reviews))
+                    stored_reviews += len(reviews)
+                    crawler.add_crawl_stat("pages")
+                    crawler.telemetry.increment("reviews", len(reviews))
+                    crawler.telemetry.increment("pages")
+                    success_count += 1
+                    consecutive_empty_pages = 0
+                    print(f"[SUCCESS] {product_name} 페이지 {current_page}: {fetched_count}개 중 {len(reviews)}개 리뷰 저장")
+                    proxy_change_attempts = 0
+                elif not exhausted:
+                    consecutive_empty_pages += 1
+
+                    # 연속 빈 페이지가 2개 이상이면 다른 프록시로 같은 페이지 재시도 (순차 모드와 동일)
+                    if (consecutive_empty_pages >= 2 and
+                            self.proxy_rotator and
+                            self.proxy_rotator.current_proxy and
+                            proxy_change_attempts < 3 and
+                            self.proxy_rotator.get_available_proxy_count() > 1):
+                        proxy_change_attempts += 1
+                        payload = crawler.build_review_payload(prod_code, current_page)
+                        pending[current_page] = asyncio.ensure_future(self.fetch_page(payload))
+                        requested_pages += 1
+                        continue
+
+                if crawler.checkpoint:
+                    await asyncio.to_thread(self.save_progress, sd, prod_code, current_page,
+                                            max_empty_pages if exhausted else consecutive_empty_pages, reviews)
+
+                current_page += 1
+                if exhausted:
+                    break
+        finally:
+            for task in pending.values():
+                task.cancel()
+            await asyncio.to_thread(sd.close)
+
+        # 실제 끝(리뷰 끝/계획 페이지/최대 페이지/증분 모드의 수집된 리뷰)에 도달했을 때만 완료로 기록
+        # 차단/실패(연속 빈 페이지)나 예산 소진으로 멈춘 상품은 진행 기록을 그대로 두어 다음 실행에서 다시 시도
+        completed = not budget_stopped and (reached_known_reviews or exhausted or
+                                            (consecutive_empty_pages == 0 and current_page > last_page))
+        await asyncio.to_thread(self.finish_product, prod_code, stored_reviews, requested_pages, completed)
+
+        print(f"[PRODUCT SUMMARY] 상품 '{product_name}' 완료: 성공 페이지 {success_count}개")
+        return success_count > 0 or resume_page > 0 or reached_known_reviews or exhausted
+
+    def save_reviews(self, sd, page_title: str, reviews: list) -> None:
+        """페이지의 리뷰들을 저장 파일에 기록 (asyncio.to_thread로 실행)"""
+        with self.crawler.telemetry.timer("store"):
+            for review in reviews:
+                sd.save(datas={"title": page_title, **review})
+
+    def save_progress(self, sd, prod_code: str, page: int, empty_pages: int, reviews: list) -> None:
+        """저장 파일을 flush하고 체크포인트에 페이지 진행 기록 (asyncio.to_thread로 실행)"""
+        with self.crawler.telemetry.timer("checkpoint"):
+            sd.flush()
+            self.crawler.checkpoint.mark_page(prod_code, page, empty_pages, reviews)
+
+    def finish_product(self, prod_code: str, stored_reviews: int, requested_pages: int, completed: bool) -> None:
+        """상품 완료 여부/크롤링 이력을 체크포인트에 기록하고 중복 제거 필터 저장 (asyncio.to_thread로 실행)"""
+        crawler = self.crawler
+        if crawler.checkpoint:
+            if completed:
+                crawler.checkpoint.mark_completed(prod_code)
+            crawler.checkpoint.record_product_run(prod_code, stored_reviews, requested_pages, finished=completed)
+        if crawler.review_dedup:
+            crawler.review_dedup.save()
+
+    async def run(self, url_manager: URLManager, max_concurrent_products: int = 20) -> dict:
+        """URLManager의 상품들을 최대 max_concurrent_products개씩 동시에 크롤링"""
+        self.semaphore = asyncio.Semaphore(self.max_in_flight)
+        summary = {"success": 0, "failed": 0}
+
+        async def product_worker():
+            while True:
+                if self.crawler.is_budget_exhausted():
+                    return
+                product = url_manager.get_next_product()
+                if not product:
+                    return
+                if self.crawler.is_product_completed(product):
+                    summary["success"] += 1
+                    continue
+                try:
+                    if await self.crawl_product(product['url'], product['name'], product.get('review_count')):
+                        summary["success"] += 1
+                    else:
+                        summary["failed"] += 1
+                except Exception as e:
+                    print(f"[ERROR] 상품 크롤링 중 예외 발생 ({product['name']}): {e}")
+                    summary["failed"] += 1
+
+        try:
+            await asyncio.gather(*(product_worker() for _ in range(max_concurrent_products)))
+        finally:
+            await self.close()
+        return summary
+
+
 class SaveData:
+    HEADERS = [
+        "상품명", "구매상품명", "작성일자", "구매자명", "평점",
+        "헤드라인", "리뷰내용", "도움수", "이미지수"
+    ]
+    FIELDS = [
+        "title", "prod_name", "review_date", "user_name", "rating",
+        "headline", "review_content", "helpful_count", "image_count"
+    ]
+
     def __init__(self) -> None:
         self.wb: Workbook = Workbook()
         self.ws = self.wb.active
-        self.ws.append([
-            "상품명", "구매상품명", "작성일자", "구매자명", "평점",
-            "헤드라인", "리뷰내용", "도움수", "이미지수"
-        ])
+        self.ws.append(self.HEADERS)
         self.row: int = 2
         self.dir_name: str = "data/Coupang-reviews-homeplanet"
         self.create_directory()
@@ -987,6 +4126,14 @@ class SaveData:
         except Exception as e:
             print(f"[ERROR] 데이터 저장 중 오류 발생: {e}")
 
+    def flush(self) -> None:
+        """행마다 바로 저장하므로 별도 flush 불필요 (StreamingSaveData와 인터페이스 통일)"""
+        pass
+
+    def close(self) -> None:
+        """StreamingSaveData와 인터페이스 통일"""
+        pass
+
     def __del__(self) -> None:
         try:
             if hasattr(self, 'wb'):
@@ -995,6 +4142,216 @@ class SaveData:
             pass
 
 
+class StreamingSaveData:
+    """v1.8: append-only 스트리밍 저장소
+
+    리뷰 행을 메모리 버퍼에 모았다가 batch_size개가 쌓이거나 flush_interval초가 지나면
+    CSV/JSONL 파일 끝에 덧붙이고 fsync 한다. 크래시가 나도 잃는 것은 아직 flush되지 않은
+    한 배치뿐이며, xlsx 변환은 close() 시점에 한 번만 수행한다.
+    """
+
+    SUPPORTED_FORMATS = ("csv", "jsonl")
+
+    def __init__(self, sink_format: str = "csv", batch_size: int = 100, flush_interval: float = 5.0,
+                 export_xlsx: bool = True, dir_name: str = "data/Coupang-reviews-homeplanet") -> None:
+        if sink_format not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"지원하지 않는 저장 형식입니다: {sink_format} (가능: {', '.join(self.SUPPORTED_FORMATS)})")
+
+        self.sink_format = sink_format
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.export_xlsx = export_xlsx
+        self.dir_name: str = dir_name
+        self.file_name = None
+        self.row_count = 0
+
+        self._buffer = []
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._last_flush = time.time()
+        self._timer = None
+
+        self.create_directory()
+
+        # 타이머 기반 flush (리뷰가 드문드문 들어와도 flush_interval 안에 디스크에 기록)
+        if self.flush_interval and self.flush_interval > 0:
+            self._timer = threading.Thread(target=self._flush_loop, daemon=True)
+            self._timer.start()
+
+    def create_directory(self) -> None:
+        if not os.path.exists(self.dir_name):
+            os.makedirs(self.dir_name)
+            print(f"[INFO] 디렉토리 생성: {self.dir_name}")
+
+    def _flush_loop(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            if time.time() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def _open(self, title: str) -> None:
+        """첫 행이 들어올 때 상품명으로 파일을 연다 (이미 있으면 이어쓰기)"""
+        safe_title = re.sub(r'[<>:"/\\|?*]', '_', title)
+        self.file_name = os.path.join(self.dir_name, f"{safe_title}.{self.sink_format}")
+
+        if self.sink_format == "csv":
+            if not os.path.exists(self.file_name):
+                self._create_csv()
+            self._file = open(self.file_name, 'a', encoding='utf-8', newline='')
+            self._writer = csv.writer(self._file)
+        else:
+            self._file = open(self.file_name, 'a', encoding='utf-8')
+
+        print(f"[INFO] 스트리밍 저장 시작 ({self.sink_format}): {self.file_name}")
+
+    def _create_csv(self) -> None:
+        """헤더만 있는 CSV 파일 생성 (Excel에서 한글이 깨지지 않도록 BOM 포함)
+
+        작업 큐 모드에서는 여러 프로세스/작업자가 같은 상품 파일을 동시에 열 수 있으므로, 헤더를 쓴 임시 파일을
+        os.link로 연결해 파일이 처음 생길 때 한 번만 헤더가 기록되게 한다 (이미 있으면 그 파일에 이어씀).
+        """
+        tmp_file = f"{self.file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8-sig', newline='') as f:
+            csv.writer(f).writerow(SaveData.HEADERS)
+        try:
+            os.link(tmp_file, self.file_name)
+        except FileExistsError:
+            pass
+        except OSError:
+            # 하드 링크를 지원하지 않는 파일시스템이면 배타적 생성으로 대신함
+            try:
+                with open(self.file_name, 'x', encoding='utf-8-sig', newline='') as f:
+                    csv.writer(f).writerow(SaveData.HEADERS)
+            except FileExistsError:
+                pass
+        finally:
+            os.remove(tmp_file)
+
+    def save(self, datas: dict[str, str | int]) -> None:
+        try:
+            with self._lock:
+                self._buffer.append([datas[field] for field in SaveData.FIELDS])
+                should_flush = len(self._buffer) >= self.batch_size
+
+            if should_flush:
+                self.flush()
+
+        except Exception as e:
+            print(f"[ERROR] 데이터 저장 중 오류 발생: {e}")
+
+    def flush(self) -> None:
+        """버퍼의 행들을 파일 끝에 기록하고 디스크에 동기화"""
+        with self._lock:
+            self._last_flush = time.time()
+            if not self._buffer:
+                return
+
+            try:
+                if self._file is None:
+                    self._open(str(self._buffer[0][0]))
+
+                if self.sink_format == "csv":
+                    chunk = io.StringIO()
+                    csv.writer(chunk).writerows(self._buffer)
+                    text = chunk.getvalue()
+                else:
+                    text = "".join(
+                        json.dumps(dict(zip(SaveData.FIELDS, row)), ensure_ascii=False) + "\n" for row in self._buffer
+                    )
+
+                # 작업 큐 모드에서는 여러 프로세스가 같은 상품 파일에 덧붙이므로 배치를 한 번에 기록
+                self._file.write(text)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self.row_count += len(self._buffer)
+                self._buffer = []
+
+            except Exception as e:
+                print(f"[ERROR] 스트리밍 저장 flush 중 오류 발생: {e}")
+
+    def read_rows(self):
+        """기록된 스트림 파일의 행을 FIELDS 순서의 리스트로 반환"""
+        if self.file_name:
+            yield from self.read_stream_file(self.file_name)
+
+    @staticmethod
+    def read_stream_file(file_name: str):
+        """스트림 파일(.csv/.jsonl)의 행을 FIELDS 순서의 리스트로 반환"""
+        if not os.path.exists(file_name):
+            return
+
+        if file_name.endswith(".csv"):
+            with open(file_name, 'r', encoding='utf-8-sig', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # 헤더
+                for row in reader:
+                    # CSV는 모든 값이 문자열이므로 숫자 컬럼 복원
+                    for idx in (4, 8):
+                        if idx < len(row) and row[idx].isdigit():
+                            row[idx] = int(row[idx])
+                    yield row
+        else:
+            with open(file_name, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 크래시로 잘린 마지막 줄은 건너뜀
+                        continue
+                    yield [item.get(field, "") for field in SaveData.FIELDS]
+
+    def export_to_xlsx(self) -> str | None:
+        """스트림 파일을 xlsx로 한 번에 변환 (write_only 모드)"""
+        if not self.file_name:
+            return None
+        return self.export_stream_file(self.file_name)
+
+    @classmethod
+    def export_stream_file(cls, file_name: str) -> str | None:
+        """스트림 파일(.csv/.jsonl)을 같은 이름의 xlsx로 변환 (작업 큐 모드에서는 상품의 마지막 구간이 끝난 뒤 한 번)"""
+        xlsx_name = os.path.splitext(file_name)[0] + ".xlsx"
+        try:
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(SaveData.HEADERS)
+            for row in cls.read_stream_file(file_name):
+                ws.append(row)
+            wb.save(filename=xlsx_name)
+            wb.close()
+            print(f"[INFO] xlsx 변환 완료: {xlsx_name}")
+            return xlsx_name
+        except Exception as e:
+            print(f"[ERROR] xlsx 변환 중 오류 발생: {e}")
+            return None
+
+    def close(self) -> None:
+        """남은 버퍼를 flush하고 파일을 닫은 뒤 필요하면 xlsx로 변환"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._timer:
+            self._timer.join(timeout=1)
+
+        self.flush()
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+        if self.export_xlsx:
+            self.export_to_xlsx()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except:
+            pass
+
+
 def load_proxy_list_from_file(file_path="env/proxy_list.txt"):
     """txt 파일에서 프록시 목록 로드"""
     try:
@@ -1087,8 +4444,12 @@ def is_valid_proxy_format(ip, port):
         return False
 
 
-def test_proxy(proxy_string):
-    """프록시 연결 테스트"""
+PROXY_PROBE_URL = "http://httpbin.org/ip"  # 프록시 상태 확인용 URL (테스트 시 로컬 스텁 URL로 교체 가능)
+PROXY_HEALTH_CACHE_FILE = "env/proxy_health_cache.json"
+
+
+def measure_proxy_latency(proxy_string, probe_url=PROXY_PROBE_URL, timeout=10):
+    """프록시로 probe_url을 요청해 응답 시간(초) 반환 (실패 시 None)"""
     try:
         parts = proxy_string.split(':')
         if len(parts) == 4:
@@ -1098,14 +4459,106 @@ def test_proxy(proxy_string):
                 'https': f'http://{username}:{password}@{ip}:{port}'
             }
         else:
-            return False
+            return None
 
-        response = rq.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=10)
+        start_time = time.time()
+        response = rq.get(probe_url, proxies=proxy_dict, timeout=timeout)
         if response.status_code == 200:
-            return True
+            return time.time() - start_time
     except:
         pass
-    return False
+    return None
+
+
+def test_proxy(proxy_string, probe_url=PROXY_PROBE_URL, timeout=10):
+    """프록시 연결 테스트"""
+    return measure_proxy_latency(proxy_string, probe_url=probe_url, timeout=timeout) is not None
+
+
+def load_proxy_health_cache(cache_file=PROXY_HEALTH_CACHE_FILE):
+    """프록시 상태 캐시 로드 ({proxy: {"ok", "latency", "checked_at"}})"""
+    try:
+        if not os.path.exists(cache_file):
+            return {}
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {item["proxy"]: item for item in data.get("proxies", [])}
+    except Exception as e:
+        print(f"[WARNING] 프록시 상태 캐시 읽기 실패: {e}")
+        return {}
+
+
+def save_proxy_health_cache(results, probe_url, cache_file=PROXY_HEALTH_CACHE_FILE):
+    """프록시 상태를 응답 시간 순으로 정렬해 캐시 파일에 저장 (실패한 프록시는 맨 뒤)"""
+    ranked = sorted(
+        results.values(),
+        key=lambda item: (not item["ok"], item["latency"] if item["latency"] is not None else float('inf'))
+    )
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        if cache_dir and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"probe_url": probe_url, "updated_at": time.time(), "proxies": ranked},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, cache_file)
+        print(f"[INFO] 프록시 상태 캐시 저장: {cache_file}")
+    except Exception as e:
+        print(f"[WARNING] 프록시 상태 캐시 저장 실패: {e}")
+    return ranked
+
+
+def check_proxies_concurrently(proxy_list, probe_url=PROXY_PROBE_URL, parallelism=32, timeout=10,
+                               cache_file=PROXY_HEALTH_CACHE_FILE, revalidate_ttl=3600):
+    """v1.8: 프록시 상태를 병렬로 확인하고 작동하는 프록시를 응답 시간 순으로 반환
+
+    revalidate_ttl초 이내에 같은 probe_url로 확인한 프록시는 캐시 결과를 재사용한다.
+    """
+    cache = load_proxy_health_cache(cache_file) if cache_file else {}
+    now = time.time()
+
+    results = {}
+    to_check = []
+    for proxy in proxy_list:
+        cached = cache.get(proxy)
+        if (cached and cached.get("probe_url", probe_url) == probe_url and
+                now - cached.get("checked_at", 0) < revalidate_ttl):
+            results[proxy] = cached
+        else:
+            to_check.append(proxy)
+
+    if results:
+        print(f"[INFO] 최근 확인된 프록시 {len(results)}개는 캐시 결과를 사용합니다.")
+
+    if to_check:
+        print(f"[INFO] 프록시 {len(to_check)}개를 동시에 {parallelism}개씩 테스트합니다...")
+        with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+            futures = {
+                executor.submit(measure_proxy_latency, proxy, probe_url, timeout): proxy
+                for proxy in to_check
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                proxy = futures[future]
+                latency = future.result()
+                results[proxy] = {
+                    "proxy": proxy,
+                    "ok": latency is not None,
+                    "latency": latency,
+                    "checked_at": time.time(),
+                    "probe_url": probe_url,
+                }
+                status = f"성공 ({latency:.2f}초)" if latency is not None else "실패"
+                print(f"[TEST] {i}/{len(to_check)} - {proxy.split(':')[0]}:{proxy.split(':')[1]} {status}")
+
+    if cache_file:
+        ranked = save_proxy_health_cache(results, probe_url, cache_file)
+    else:
+        ranked = sorted(results.values(),
+                        key=lambda item: (not item["ok"], item["latency"] if item["latency"] is not None else float('inf')))
+
+    return [item["proxy"] for item in ranked if item["ok"]]
 
 
 def get_proxy_list():
@@ -1149,15 +4602,7 @@ def get_proxy_list():
 
         if test_proxies == 'y':
             print("\n[INFO] 프록시 연결 테스트 중...")
-            working_proxies = []
-
-            for i, proxy in enumerate(proxy_list, 1):
-                print(f"[TEST] {i}/{len(proxy_list)} - {proxy.split(':')[0]}:{proxy.split(':')[1]} 테스트 중...", end='')
-                if test_proxy(proxy):
-                    print(" 성공")
-                    working_proxies.append(proxy)
-                else:
-                    print(" 실패")
+            working_proxies = check_proxies_concurrently(proxy_list)
 
             if working_proxies:
                 print(f"\n[SUCCESS] {len(working_proxies)}/{len(proxy_list)}개 프록시가 정상 작동합니다.")
@@ -1178,14 +4623,59 @@ def get_proxy_list():
             return proxy_list
 
 
+def get_concurrency_settings():
+    """v1.8: 동시 작업자 수와 전체 초당 요청 수 입력 (httpx 백엔드 선택 시 (0, None) 반환)"""
+    if HTTPX_AVAILABLE:
+        use_async = input("httpx 비동기 백엔드를 사용하시겠습니까? (y/N): ").lower().strip()
+        if use_async == 'y':
+            return 0, None
+
+    num_workers_input = input("동시 작업자 수를 입력하세요 (기본 1 = 순차 실행): ").strip()
+    num_workers = int(num_workers_input) if num_workers_input.isdigit() and int(num_workers_input) > 0 else 1
+
+    max_rps = 2.0
+    if num_workers > 1:
+        max_rps_input = input(f"전체 초당 최대 요청 수를 입력하세요 (기본 {max_rps}): ").strip()
+        try:
+            max_rps = float(max_rps_input) if max_rps_input else max_rps
+        except ValueError:
+            print(f"[WARNING] 잘못된 입력입니다. 기본값 {max_rps}을 사용합니다.")
+
+    return num_workers, max_rps
+
+
 if __name__ == "__main__":
     try:
         # 프록시 목록 가져오기
         proxy_list = get_proxy_list()
+        num_workers, max_rps = get_concurrency_settings()
 
         # 크롤러 시작
-        coupang = Coupang(proxy_list=proxy_list)
-        coupang.start()
+        coupang = Coupang(proxy_list=proxy_list, use_browser=SELENIUM_AVAILABLE, use_checkpoint=True,
+                          use_html_archive=True, use_review_dedup=True)
+        coupang.sink_format = "csv"  # 스트리밍 저장 후 상품 완료 시 xlsx로 변환
+        coupang.use_priority_schedule = True
+        incremental = input("증분 모드로 실행하시겠습니까? (이미 수집된 리뷰에서 중단) (y/N): ").lower().strip()
+        coupang.incremental = incremental == 'y'
+        rating_shards = input("별점별 스트림으로 나눠 동시에 크롤링하시겠습니까? (리뷰가 많은 상품용) (y/N): ").lower().strip()
+        coupang.rating_shards = rating_shards == 'y'
+        time_budget = input("크롤링 시간 예산(분)을 입력하세요 (엔터: 제한 없음): ").strip()
+        coupang.crawl_time_budget = float(time_budget) * 60 if time_budget else None
+        request_budget = input("리뷰 페이지 요청 예산(회)을 입력하세요 (엔터: 제한 없음): ").strip()
+        coupang.crawl_request_budget = int(request_budget) if request_budget else None
+        use_queue = input("작업 큐 모드로 실행하시겠습니까? (여러 프로세스/머신이 같은 카탈로그를 나눠 크롤링) (y/N): ").lower().strip()
+
+        if use_queue == 'y':
+            if num_workers == 0:
+                print("[WARNING] 작업 큐 모드는 httpx 백엔드를 지원하지 않아 requests 백엔드로 실행합니다.")
+            coupang.start_queue(num_workers=max(num_workers, 1), max_requests_per_sec=max_rps or 2.0)
+        elif num_workers == 0:
+            coupang.fetch_backend = "httpx"
+            coupang.start()
+        elif num_workers > 1:
+            coupang.start_concurrent(num_workers=num_workers, max_requests_per_sec=max_rps)
+        else:
+            coupang.start()
 
         print("\n" + "=" * 70)
         print("모든 상품 크롤링이 완료되었습니다!")
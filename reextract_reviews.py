@@ -0,0 +1,127 @@
+"""보관된 리뷰 페이지 HTML 오프라인 재추출
+
+크롤링 중 HtmlArchive(data/html_archive)에 압축 보관된 원본 리뷰 페이지를 네트워크 없이 다시 파싱하여
+리뷰 데이터셋을 새로 만든다. 추출 로직(파서 백엔드, 필드 정제 등)이 바뀌었을 때 재크롤링 대신 사용한다.
+상품 단위로 프로세스 풀에 나누어 파싱하고, 저장은 메인 프로세스에서 상품별 StreamingSaveData로 수행한다.
+
+사용 예:
+    python reextract_reviews.py --archive data/html_archive --output data/Coupang-reviews-reextracted
+    python reextract_reviews.py --format jsonl --workers 8 --parser lxml --overwrite
+"""
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from crawler_coupang_review import (
+    REVIEW_PARSERS, Coupang, CrawlCheckpoint, HtmlArchive, StreamingSaveData, get_review_parser,
+)
+
+# 워커 프로세스별 보관소/파서 (initializer에서 한 번만 생성)
+_archive = None
+_parser = None
+
+
+def init_worker(archive_dir: str, parser_name: str) -> None:
+    global _archive, _parser
+    _archive = HtmlArchive(archive_dir)
+    _parser = get_review_parser(parser_name)
+
+
+def extract_product(prod_code: str, pages: list) -> tuple:
+    """한 상품의 보관 페이지를 스트림(별점)/페이지 순서대로 파싱 -> (상품코드, 중복 제거된 리뷰 목록, 파싱 페이지 수, 오류 수)"""
+    reviews = []
+    seen_keys = set()
+    errors = 0
+
+    for rating, page, sha256, compression in pages:
+        try:
+            page_reviews = _parser.parse(_archive.load(sha256, compression))
+        except Exception as e:
+            label = f" (별점 {rating})" if rating else ""
+            print(f"[WARNING] {prod_code} {page}페이지{label} 재추출 실패: {e}")
+            errors += 1
+            continue
+
+        for review in page_reviews:
+            review_key = CrawlCheckpoint.make_review_key(prod_code, review)
+            if review_key in seen_keys:
+                continue
+            seen_keys.add(review_key)
+            reviews.append(review)
+
+    return prod_code, reviews, len(pages), errors
+
+
+def prepare_output(output_dir: str, overwrite: bool) -> bool:
+    """출력 디렉토리 확인 (기존 결과가 있으면 --overwrite일 때만 삭제 후 진행)"""
+    existing = [path for ext in ("csv", "jsonl", "xlsx") for path in glob.glob(os.path.join(output_dir, f"*.{ext}"))]
+    if not existing:
+        return True
+    if not overwrite:
+        print(f"[ERROR] 출력 디렉토리에 기존 결과 파일 {len(existing)}개가 있습니다: {output_dir} (--overwrite로 덮어쓰기)")
+        return False
+
+    for path in existing:
+        os.remove(path)
+    print(f"[INFO] 기존 결과 파일 {len(existing)}개 삭제: {output_dir}")
+    return True
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="보관된 리뷰 페이지 HTML 오프라인 재추출")
+    arg_parser.add_argument("--archive", default="data/html_archive", help="HtmlArchive 디렉토리")
+    arg_parser.add_argument("--output", default="data/Coupang-reviews-reextracted", help="재추출 결과 디렉토리")
+    arg_parser.add_argument("--format", default="csv", choices=StreamingSaveData.SUPPORTED_FORMATS, help="저장 형식")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="파싱 프로세스 수")
+    arg_parser.add_argument("--parser", default="auto", choices=("auto",) + tuple(REVIEW_PARSERS), help="리뷰 파서 백엔드")
+    arg_parser.add_argument("--xlsx", action="store_true", help="상품별 결과를 xlsx로도 변환")
+    arg_parser.add_argument("--overwrite", action="store_true", help="출력 디렉토리의 기존 결과 파일 삭제 후 재추출")
+    args = arg_parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.archive, "index.sqlite3")):
+        print(f"[ERROR] HTML 보관소를 찾을 수 없습니다: {args.archive}")
+        return
+    if not prepare_output(args.output, args.overwrite):
+        return
+
+    archive = HtmlArchive(args.archive)
+    products = archive.get_latest_pages()
+    archive.close()
+
+    page_total = sum(len(pages) for pages in products.values())
+    print(f"[INFO] 재추출 대상: 상품 {len(products)}개, 페이지 {page_total}개 (프로세스 {args.workers}개)")
+
+    start_time = time.time()
+    review_total = error_total = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=init_worker,
+                             initargs=(args.archive, args.parser)) as executor:
+        futures = [executor.submit(extract_product, prod_code, pages) for prod_code, pages in products.items()]
+
+        for future in futures:
+            prod_code, reviews, page_count, errors = future.result()
+            error_total += errors
+            if not reviews:
+                print(f"[INFO] {prod_code}: 리뷰 없음 ({page_count}페이지)")
+                continue
+
+            title = Coupang.resolve_page_title(reviews, prod_code)
+            sd = StreamingSaveData(sink_format=args.format, export_xlsx=args.xlsx, flush_interval=0,
+                                   batch_size=1000, dir_name=args.output)
+            for review in reviews:
+                sd.save(datas={"title": title, **review})
+            sd.close()
+
+            review_total += len(reviews)
+            print(f"[INFO] {prod_code}: {page_count}페이지, 리뷰 {len(reviews)}개 -> {sd.file_name}")
+
+    elapsed = time.time() - start_time
+    print("=" * 70)
+    print(f"[INFO] 재추출 완료: 상품 {len(products)}개, 페이지 {page_total}개, 리뷰 {review_total}개, "
+          f"실패 페이지 {error_total}개 ({elapsed:.1f}초)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
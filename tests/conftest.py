@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+# 저장소 루트의 스크립트 모듈(crawler_coupang_review 등)을 테스트에서 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    """대기 시간 없이 임시 디렉토리에서 실행하는 크롤러 (체크포인트/HTML 보관소/중복 제거 없음)"""
+    from crawler_coupang_review import AdaptivePacer, Coupang
+
+    monkeypatch.chdir(tmp_path)
+    crawler = Coupang(use_browser=False, use_checkpoint=False, use_html_archive=False, use_review_dedup=False)
+    for name in ("delay_min", "delay_max", "warm_up_delay_min", "warm_up_delay_max", "long_wait_min",
+                 "long_wait_max"):
+        setattr(crawler, name, 0)
+    crawler.pacer = AdaptivePacer(min_interval=0, initial_interval=0)
+    yield crawler
+    crawler.proxy_rotator.close_all_sessions()
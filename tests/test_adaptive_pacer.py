@@ -0,0 +1,58 @@
+import pytest
+
+from crawler_coupang_review import AdaptivePacer
+
+
+@pytest.fixture
+def pacer():
+    return AdaptivePacer(min_interval=0.1, max_interval=10.0, initial_interval=1.0, increase_step=0.5,
+                         decrease_factor=0.5, global_decrease_factor=0.75, slow_latency=5.0, slow_factor=0.9,
+                         jitter=0)
+
+
+def test_success_increases_rate_additively(pacer):
+    pacer.record_success("p1", 0.1)
+    pacer.record_success("p1", 0.1)
+    assert pacer.get_interval("p1") == pytest.approx(1 / 2.0)
+
+
+def test_failure_decreases_rate_multiplicatively(pacer):
+    pacer.record_failure("p1")
+    assert pacer.get_interval("p1") == pytest.approx(2.0)
+    assert pacer.get_interval() == pytest.approx(1 / 0.75)
+
+
+def test_slow_response_decreases_rate(pacer):
+    pacer.record_success("p1", 6.0)
+    assert pacer.get_interval("p1") == pytest.approx(1 / 0.9)
+
+
+def test_interval_stays_within_bounds(pacer):
+    for _ in range(100):
+        pacer.record_success("p1", 0.1)
+    assert pacer.get_interval("p1") == pytest.approx(0.1)
+    assert pacer.get_interval() == pytest.approx(0.1)
+
+    for _ in range(100):
+        pacer.record_failure("p1")
+    assert pacer.get_interval("p1") == pytest.approx(10.0)
+    assert pacer.get_interval() == pytest.approx(10.0)
+
+
+def test_global_floor_scales_with_connections(pacer):
+    # min_interval은 연결 하나의 하한이므로 연결이 늘면 전역 속도도 그만큼 빨라질 수 있음
+    for proxy in ("p1", "p2", "p3"):
+        pacer.reserve(proxy)
+    for _ in range(100):
+        pacer.record_success("p1", 0.1)
+    assert pacer.get_interval() == pytest.approx(0.1 / 3)
+    assert pacer.get_interval("p1") == pytest.approx(0.1)
+
+
+def test_reserve_keeps_global_and_per_connection_interval(pacer):
+    assert pacer.reserve("p1") == 0
+    # 두 번째 연결은 전역 간격(1초)을 지키고, 이후 전역 속도는 연결 2개 몫(초당 2회)으로 늘어남
+    assert pacer.reserve("p2") == pytest.approx(1.0, abs=0.05)
+    assert pacer.reserve("p1") == pytest.approx(1.5, abs=0.05)
+    # 같은 연결은 자기 간격(1초)도 지킴
+    assert pacer.reserve("p1") == pytest.approx(2.5, abs=0.05)
@@ -0,0 +1,177 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from benchmark_review_parser import build_sample_review_page
+from crawler_coupang_review import AdaptivePacer, BlockPageClassifier, ProxyRotator
+
+EMPTY_LIST_PAGE = ('<!DOCTYPE html><html lang="ko"><body>'
+                   '<div class="sdp-review__article__no-review">등록된 상품평이 없습니다.</div></body></html>')
+SOFT_BLOCK_PAGE = ('<!DOCTYPE html><html lang="ko"><head><title>보안 확인</title></head>'
+                   '<body><div>보안 확인 중입니다.</div></body></html>')
+
+
+@pytest.fixture
+def classifier():
+    return BlockPageClassifier()
+
+
+def test_review_page(classifier):
+    assert classifier.classify(build_sample_review_page(10, 1)) == "reviews"
+
+
+def test_empty_review_list(classifier):
+    assert classifier.classify(EMPTY_LIST_PAGE) == "empty"
+
+
+def test_container_without_articles_is_not_end_of_reviews(classifier):
+    # 리뷰 컨테이너 클래스의 접두사만 있는 응답은 빈 리뷰 목록(리뷰 끝)으로 보지 않음
+    html = '<html><body><div class="sdp-review__article"></div></body></html>'
+    assert classifier.classify(html) == "unknown"
+
+
+@pytest.mark.parametrize("status_code", BlockPageClassifier.BLOCK_STATUS_CODES)
+def test_block_status_codes(classifier, status_code):
+    assert classifier.classify(build_sample_review_page(10, 1), status_code) == "blocked"
+
+
+@pytest.mark.parametrize("html", [
+    SOFT_BLOCK_PAGE,
+    "<html><head><title>Access Denied</title></head><body></body></html>",
+    '<html><body><div class="g-recaptcha"></div></body></html>',
+])
+def test_block_markers(classifier, html):
+    assert classifier.classify(html) == "blocked"
+
+
+def test_common_words_are_not_block_markers(classifier):
+    html = "<html><head><title>상품 안내</title></head><body>security robot bot</body></html>"
+    assert classifier.classify(html) == "unknown"
+
+
+def test_long_page_without_review_list_is_unknown(classifier):
+    html = "<html><head><title>captcha</title></head><body>" + "x" * 30000 + "</body></html>"
+    assert classifier.classify(html) == "unknown"
+
+
+def test_get_title():
+    assert BlockPageClassifier.get_title(SOFT_BLOCK_PAGE) == "보안 확인"
+    assert BlockPageClassifier.get_title("<html><body></body></html>") == ""
+
+
+def test_cache_key_uses_bounded_prefix_and_suffix(classifier):
+    html = "<html><body>" + "가" * 5000 + "</body></html>"
+    classifier.classify(html)
+    key = next(iter(classifier.cache))
+    assert key == (200, len(html), hash(html[:classifier.CACHE_KEY_CHARS]), hash(html[-classifier.CACHE_KEY_CHARS:]))
+
+
+def test_cache_is_bounded():
+    classifier = BlockPageClassifier(cache_size=2)
+    for idx in range(5):
+        classifier.classify(f"<html><body>{idx}</body></html>")
+    assert len(classifier.cache) == 2
+
+
+def test_cached_verdict_per_status(classifier):
+    html = build_sample_review_page(3, 1)
+    assert classifier.classify(html) == "reviews"
+    assert classifier.classify(html) == "reviews"
+    assert classifier.classify(html, 403) == "blocked"
+
+
+class FixedPageServer:
+    """모든 리뷰 API 요청에 같은 응답을 돌려주는 로컬 서버 (리뷰 API 요청 수를 셈)"""
+
+    def __init__(self, html: str, status_code: int = 200):
+        self.html, self.status_code, self.review_requests = html, status_code, 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/vp/product/reviews"):
+                    server.review_requests += 1
+                    body, status_code = server.html.encode("utf-8"), server.status_code
+                else:
+                    body, status_code = b"<html><body>home</body></html>", 200
+                self.send_response(status_code)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def serve(crawler):
+    servers = []
+
+    def start(html: str, status_code: int = 200) -> FixedPageServer:
+        server = FixedPageServer(html, status_code)
+        servers.append(server)
+        crawler.base_url = server.url
+        crawler.base_review_url = f"{server.url}/vp/product/reviews"
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+def test_fetch_page_returns_none_for_empty_list(crawler, serve):
+    server = serve(EMPTY_LIST_PAGE)
+    assert crawler.fetch_page(crawler.build_review_payload("1", 3)) is None
+    assert server.review_requests == 1
+
+
+def test_fetch_page_retries_review_list_without_parsed_articles_once(crawler, serve):
+    # 리뷰 항목 마커는 있지만 파싱되는 리뷰가 없으면 리뷰 끝이 아니라 한 번 재시도 후 실패
+    server = serve('<html><body><div class="sdp-review__article__list"></div></body></html>')
+    assert crawler.fetch_page(crawler.build_review_payload("1", 1)) == []
+    assert server.review_requests == 2
+
+
+def test_fetch_page_returns_reviews(crawler, serve):
+    serve(build_sample_review_page(10, 1))
+    assert len(crawler.fetch_page(crawler.build_review_payload("1", 1))) == 10
+
+
+def test_fetch_page_does_not_retry_blocked_proxy(crawler, serve, monkeypatch):
+    serve("<html><body>denied</body></html>", status_code=403)
+    proxies = ["10.0.0.1:8000", "10.0.0.2:8000", "10.0.0.3:8000"]
+    crawler.proxy_rotator = ProxyRotator(proxies)
+    # 프록시 대신 로컬 서버로 직접 요청하고, 페이지 요청마다 고른 프록시를 기록
+    monkeypatch.setattr(crawler.proxy_rotator, "get_session", lambda proxy: requests.Session())
+    chosen = []
+    select = crawler.get_session_with_proxy
+
+    def record(exclude=()):
+        session, proxy = select(exclude)
+        chosen.append(proxy)
+        return session, proxy
+
+    monkeypatch.setattr(crawler, "get_session_with_proxy", record)
+    assert crawler.fetch_page(crawler.build_review_payload("1", 1)) == []
+
+    assert sorted(chosen[:3]) == proxies
+    assert all(crawler.proxy_rotator.proxy_stats[proxy]["state"] == "open" for proxy in proxies)
+
+
+def test_fetch_page_slows_pacer_on_soft_block_page(crawler, serve):
+    serve("<html><head><title>상품 안내</title></head><body>잠시 후 다시 시도해 주세요</body></html>")
+    crawler.pacer = AdaptivePacer(min_interval=0, initial_interval=0.001)
+    interval = crawler.pacer.get_interval()
+    assert crawler.fetch_page(crawler.build_review_payload("1", 1)) == []
+    assert crawler.pacer.get_interval() > interval
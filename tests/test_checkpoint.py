@@ -0,0 +1,143 @@
+import pytest
+
+from crawler_coupang_review import CrawlCheckpoint
+
+
+def make_review(**overrides):
+    review = {
+        "user_name": "구매자", "review_date": "2025.05.01", "rating": 5,
+        "headline": "", "review_content": "좋아요",
+    }
+    review.update(overrides)
+    return review
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.sqlite3"))
+    yield checkpoint
+    checkpoint.close()
+
+
+def test_review_key_is_stable():
+    assert CrawlCheckpoint.make_review_key("1", make_review()) == CrawlCheckpoint.make_review_key("1", make_review())
+
+
+@pytest.mark.parametrize("field, value", [
+    ("review_content", "별로예요"),
+    ("rating", 1),
+    ("headline", "제목"),
+    ("user_name", "다른 구매자"),
+    ("review_date", "2025.05.02"),
+])
+def test_review_key_distinguishes_reviews(field, value):
+    # 헤드라인 없는 짧은 리뷰는 같은 작성자/작성일자여도 별점이나 본문이 다르면 다른 리뷰
+    assert (CrawlCheckpoint.make_review_key("1", make_review())
+            != CrawlCheckpoint.make_review_key("1", make_review(**{field: value})))
+
+
+def test_review_key_depends_on_product():
+    assert CrawlCheckpoint.make_review_key("1", make_review()) != CrawlCheckpoint.make_review_key("2", make_review())
+
+
+def test_progress_defaults_to_start(checkpoint):
+    assert checkpoint.get_progress("1") == (0, 0)
+    assert not checkpoint.is_completed("1")
+
+
+def test_mark_page_records_progress_and_review_keys(checkpoint):
+    first, second = make_review(review_content="첫 리뷰"), make_review(review_content="둘째 리뷰")
+    checkpoint.mark_page("1", 3, 0, [first])
+
+    assert checkpoint.get_progress("1") == (3, 0)
+    assert checkpoint.filter_new_reviews("1", [first, second]) == [second]
+    # 리뷰 키는 상품별
+    assert checkpoint.filter_new_reviews("2", [first]) == [first]
+
+
+def test_mark_page_with_progress_key_keeps_review_keys_per_product(checkpoint):
+    review = make_review()
+    checkpoint.mark_page("1", 2, 1, [review], progress_key="1:5")
+
+    assert checkpoint.get_progress("1:5") == (2, 1)
+    assert checkpoint.get_progress("1") == (0, 0)
+    assert checkpoint.filter_new_reviews("1", [review]) == []
+
+
+def test_mark_completed_keeps_last_page(checkpoint):
+    checkpoint.mark_page("1", 7, 0)
+    checkpoint.mark_completed("1")
+
+    assert checkpoint.is_completed("1")
+    assert checkpoint.get_progress("1") == (7, 0)
+    # 페이지를 더 기록해도 완료 표시는 유지
+    checkpoint.mark_page("1", 8, 0)
+    assert checkpoint.is_completed("1")
+
+
+def test_clear_progress_keeps_review_keys_and_history(checkpoint):
+    review = make_review()
+    checkpoint.mark_page("1", 4, 0, [review])
+    checkpoint.mark_completed("1")
+    checkpoint.record_product_run("1", 1, 5)
+    checkpoint.clear_progress()
+
+    assert checkpoint.get_progress("1") == (0, 0)
+    assert not checkpoint.is_completed("1")
+    assert checkpoint.filter_new_reviews("1", [review]) == []
+    assert checkpoint.get_product_history()["1"]["total_reviews"] == 1
+
+
+def test_clear_progress_keeps_failed_products(checkpoint):
+    checkpoint.mark_page("1", 4, 0)
+    checkpoint.mark_completed("1")
+    checkpoint.mark_page("2", 9, 5)
+    checkpoint.clear_progress()
+
+    # 완료 표시는 지워 다음 실행(증분 크롤링 등)에서 다시 크롤링하고, 실패한 상품은 실패한 페이지부터 재개
+    assert not checkpoint.is_completed("1")
+    assert checkpoint.get_progress("1") == (0, 0)
+    assert checkpoint.get_progress("2") == (9, 5)
+
+
+def test_clear_progress_keeps_streams_of_unfinished_products(checkpoint):
+    for prod_code in ("1", "2"):
+        checkpoint.mark_page(prod_code, 3, 0, progress_key=f"{prod_code}:5")
+        checkpoint.mark_completed(f"{prod_code}:5")
+    checkpoint.mark_completed("1")
+    checkpoint.mark_page("2", 6, 5, progress_key="2:4")
+    checkpoint.clear_progress()
+
+    assert not checkpoint.is_completed("1:5")
+    # 일부 스트림만 끝난 상품은 끝난 스트림을 다음 실행에서 건너뜀
+    assert checkpoint.is_completed("2:5")
+    assert checkpoint.get_progress("2:4") == (6, 5)
+
+
+def test_progress_survives_reopen(tmp_path):
+    path = str(tmp_path / "checkpoint.sqlite3")
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.mark_page("1", 5, 2, [make_review()])
+    checkpoint.close()
+
+    reopened = CrawlCheckpoint(path)
+    try:
+        assert reopened.get_progress("1") == (5, 2)
+        assert reopened.filter_new_reviews("1", [make_review()]) == []
+    finally:
+        reopened.close()
+
+
+def test_record_product_run_accumulates_partial_runs(checkpoint):
+    checkpoint.record_product_run("1", 30, 4, finished=False)
+    checkpoint.record_product_run("1", 20, 3, finished=False)
+    assert checkpoint.get_product_history()["1"]["crawls"] == 0
+
+    checkpoint.record_product_run("1", 10, 2)
+    record = checkpoint.get_product_history()["1"]
+    assert record["crawls"] == 1
+    assert record["total_reviews"] == 60
+    # 중간에 멈춘 실행들의 수집량을 합쳐 마지막 크롤링 결과로 기록
+    assert record["last_new_reviews"] == 60
+    assert record["last_requests"] == 9
+    assert record["last_interval"] is None
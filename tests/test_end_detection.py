@@ -0,0 +1,276 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from crawler_coupang_review import (HTTPX_AVAILABLE, REVIEW_PAGE_SIZE, AsyncReviewFetcher, Coupang, CrawlCheckpoint,
+                                    CrawlWorkQueue)
+
+FAILED = "failed"
+
+
+class MemorySink:
+    """리뷰를 메모리에 모으는 SaveData 대용"""
+
+    def __init__(self):
+        self.rows = []
+
+    def save(self, datas):
+        self.rows.append(datas)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeReviewPages:
+    """페이지 번호별 리뷰 수(None이면 빈 리뷰 목록, FAILED면 차단/실패)를 돌려주는 fetch_page 대용
+
+    목록에 없는 페이지는 빈 리뷰 목록으로 응답한다. delays에 페이지별 응답 시간(초)을 줄 수 있다.
+    """
+
+    def __init__(self, pages: dict, delays: dict = None):
+        self.pages = pages
+        self.delays = delays or {}
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def __call__(self, payload):
+        page = payload["page"]
+        with self.lock:
+            self.requested.append(page)
+        time.sleep(self.delays.get(page, 0))
+        count = self.pages.get(page)
+        if count is None:
+            return None
+        if count == FAILED:
+            return []
+        return [
+            {"user_name": f"구매자 {page}-{idx}", "review_date": "2025.05.01", "rating": 5, "headline": "",
+             "review_content": f"리뷰 {page}-{idx}", "prod_name": "상품"}
+            for idx in range(count)
+        ]
+
+
+@pytest.fixture
+def pages(crawler, monkeypatch):
+    def install(page_counts: dict, delays: dict = None) -> FakeReviewPages:
+        fake = FakeReviewPages(page_counts, delays)
+        monkeypatch.setattr(crawler, "fetch_page", fake)
+        return fake
+
+    return install
+
+
+def crawl(crawler, **kwargs):
+    crawler.title = "상품"
+    crawler.page_title = None
+    sink = MemorySink()
+    return crawler.crawl_review_stream("1", sink, **kwargs), sink
+
+
+@pytest.mark.parametrize("window", [1, 3])
+def test_short_page_ends_stream(crawler, pages, window):
+    crawler.prefetch_window = window
+    fake = pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: 4})
+    result, sink = crawl(crawler)
+
+    assert result["end_kind"] == "exhausted"
+    assert result["empty_from_page"] == 4
+    assert result["success_count"] == 3
+    assert len(sink.rows) == 2 * REVIEW_PAGE_SIZE + 4
+    # 짧은 페이지 뒤로는 연속 빈 페이지를 확인하지 않음 (미리 요청한 페이지만 최대 window - 1개)
+    assert max(fake.requested) <= 3 + window - 1
+
+
+def test_empty_list_ends_stream_at_that_page(crawler, pages):
+    crawler.prefetch_window = 1
+    fake = pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE})
+    result, _ = crawl(crawler)
+
+    assert result["end_kind"] == "exhausted"
+    assert result["empty_from_page"] == 3
+    assert fake.requested == [1, 2, 3]
+
+
+def test_failed_pages_stop_after_max_empty_pages(crawler, pages):
+    crawler.prefetch_window = 3
+    crawler.proxy_rotator.current_proxy = None
+    fake = pages({page: FAILED for page in range(1, 20)})
+    result, _ = crawl(crawler)
+
+    assert result["end_kind"] == "empty_pages"
+    assert result["end_kind"] not in Coupang.COMPLETE_STREAM_ENDS
+    # 받지 못한 페이지는 리뷰 끝으로 보지 않음
+    assert result["empty_from_page"] is None
+    assert sorted(fake.requested) == list(range(1, Coupang.MAX_EMPTY_PAGES + 1))
+
+
+def test_failed_last_page_is_not_complete(crawler, pages):
+    crawler.prefetch_window = 1
+    pages({1: REVIEW_PAGE_SIZE, 2: FAILED})
+    result, _ = crawl(crawler, end_page=2, planned=True)
+
+    assert result["end_kind"] == "failed"
+
+
+def test_prefetch_stops_after_received_end_page(crawler, pages):
+    # 3페이지(짧은 페이지)를 앞 페이지보다 먼저 받으면 리뷰 수를 몰라도 그 뒤 페이지는 요청하지 않음
+    crawler.prefetch_window = 3
+    fake = pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: 4}, delays={1: 0.1, 2: 0.2})
+    result, _ = crawl(crawler)
+
+    assert result["end_kind"] == "exhausted"
+    assert sorted(fake.requested) == [1, 2, 3]
+
+
+def test_crawl_stats_are_counted_under_lock(crawler):
+    threads = [threading.Thread(target=lambda: [crawler.add_crawl_stat("requests") for _ in range(10000)])
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert crawler.crawl_stats["requests"] == 80000
+
+
+@pytest.mark.parametrize("window", [2, 4])
+def test_prefetch_stops_at_expected_pages(crawler, pages, window):
+    # 리뷰 25개 -> 3페이지(짧은 페이지)에서 리뷰 끝 확인, 계획은 여유 1페이지를 더해 4페이지
+    crawler.prefetch_window = window
+    fake = pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: 5})
+    result, _ = crawl(crawler, end_page=crawler.get_planned_pages(25), planned=True,
+                      expected_pages=crawler.get_expected_requests(25))
+
+    assert result["end_kind"] == "exhausted"
+    assert sorted(fake.requested) == [1, 2, 3]
+
+
+def test_prefetch_continues_past_expected_pages_when_reviews_grew(crawler, pages):
+    crawler.prefetch_window = 3
+    fake = pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: REVIEW_PAGE_SIZE, 4: 2})
+    result, _ = crawl(crawler, end_page=crawler.get_planned_pages(25), planned=True,
+                      expected_pages=crawler.get_expected_requests(25))
+
+    assert result["end_kind"] == "exhausted"
+    assert sorted(fake.requested) == [1, 2, 3, 4]
+
+
+@pytest.fixture
+def checkpointed(crawler, tmp_path, monkeypatch):
+    crawler.checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.sqlite3"))
+    monkeypatch.setattr(crawler, "create_save_data", lambda export_xlsx=True: MemorySink())
+    yield crawler
+    crawler.checkpoint.close()
+
+
+def test_failed_product_is_not_marked_complete(checkpointed, pages):
+    crawler = checkpointed
+    crawler.prefetch_window = 1
+    crawler.proxy_rotator.current_proxy = None
+    pages({1: REVIEW_PAGE_SIZE, **{page: FAILED for page in range(2, 20)}})
+    crawler.crawl_single_product("https://www.coupang.com/vp/products/1?itemId=1", "상품")
+
+    assert not crawler.checkpoint.is_completed("1")
+    assert crawler.checkpoint.get_product_history()["1"]["crawls"] == 0
+    # 다음 실행은 첫 실패 페이지부터 다시 시도
+    assert crawler.checkpoint.get_progress("1") == (1 + Coupang.MAX_EMPTY_PAGES, Coupang.MAX_EMPTY_PAGES)
+
+
+def test_exhausted_product_is_marked_complete(checkpointed, pages):
+    crawler = checkpointed
+    crawler.prefetch_window = 2
+    pages({1: REVIEW_PAGE_SIZE, 2: 3})
+    product = {"url": "https://www.coupang.com/vp/products/1?itemId=1#sdpReview", "name": "상품"}
+    crawler.crawl_single_product(product["url"], product["name"])
+
+    assert crawler.checkpoint.is_completed("1")
+    assert crawler.is_product_completed(product)
+    assert crawler.checkpoint.get_product_history()["1"]["crawls"] == 1
+
+
+@pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx가 설치되지 않음")
+def test_async_fetcher_writes_checkpoint_off_the_event_loop(checkpointed, monkeypatch):
+    crawler = checkpointed
+    crawler.prefetch_window = 2
+    fake = FakeReviewPages({1: REVIEW_PAGE_SIZE, 2: 3})
+    fetcher = AsyncReviewFetcher(crawler)
+
+    async def fetch_page(payload):
+        return fake(payload)
+
+    monkeypatch.setattr(fetcher, "fetch_page", fetch_page)
+
+    # 체크포인트(SQLite) 호출이 실행된 스레드를 기록
+    write_threads = set()
+
+    def on_thread(func):
+        def wrapper(*args, **kwargs):
+            write_threads.add(threading.current_thread())
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    for name in ("get_progress", "filter_new_reviews", "mark_page", "mark_completed", "record_product_run"):
+        monkeypatch.setattr(crawler.checkpoint, name, on_thread(getattr(crawler.checkpoint, name)))
+
+    assert asyncio.run(fetcher.crawl_product("https://www.coupang.com/vp/products/1?itemId=1", "상품"))
+    assert crawler.checkpoint.is_completed("1")
+    # 이벤트 루프가 도는 메인 스레드에서는 디스크를 쓰지 않음
+    assert write_threads and threading.main_thread() not in write_threads
+
+
+@pytest.fixture
+def queue_worker(crawler, tmp_path, monkeypatch):
+    product = {"url": "https://www.coupang.com/vp/products/1?itemId=1", "name": "상품"}
+    crawler.url_manager.products = [product]
+    crawler.prefetch_window = 1
+    crawler.proxy_rotator.current_proxy = None
+    monkeypatch.setattr(crawler, "create_save_data", lambda export_xlsx=True: MemorySink())
+    queue = CrawlWorkQueue(str(tmp_path / "crawl_queue.sqlite3"), max_attempts=1, owner="test")
+    queue.seed([product], max_pages=60, pages_per_task=30)
+    yield crawler, queue
+    queue.close()
+
+
+def test_blocked_range_is_not_treated_as_end_of_reviews(crawler, pages):
+    crawler.prefetch_window = 1
+    crawler.proxy_rotator.current_proxy = None
+    crawler.create_save_data = lambda export_xlsx=True: MemorySink()
+    pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: REVIEW_PAGE_SIZE, **{page: FAILED for page in range(4, 31)}})
+    crawler.crawl_single_product("https://www.coupang.com/vp/products/1?itemId=1", "상품", 1, 30)
+
+    assert not crawler.crawl_completed
+    assert crawler.empty_from_page is None
+
+
+def test_queue_worker_fails_blocked_ranges_without_skipping_later_ones(queue_worker, pages):
+    crawler, queue = queue_worker
+    pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: REVIEW_PAGE_SIZE, **{page: FAILED for page in range(4, 61)}})
+    summary = crawler.run_queue_worker(0, crawler, queue)
+
+    assert summary["success"] == 0
+    assert summary["failed"] == 2
+    assert queue.get_counts()["skipped"] == 0
+
+
+def test_queue_worker_skips_ranges_after_confirmed_end(queue_worker, pages):
+    crawler, queue = queue_worker
+    fake = pages({1: REVIEW_PAGE_SIZE, 2: REVIEW_PAGE_SIZE, 3: 4})
+    summary = crawler.run_queue_worker(0, crawler, queue)
+
+    assert summary["success"] == 1
+    assert queue.get_counts()["skipped"] == 1
+    assert max(fake.requested) == 3
+
+
+def test_queue_worker_fails_range_whose_last_page_failed(queue_worker, pages):
+    crawler, queue = queue_worker
+    pages({**{page: REVIEW_PAGE_SIZE for page in range(1, 30)}, 30: FAILED, 31: 2})
+    summary = crawler.run_queue_worker(0, crawler, queue)
+
+    assert summary["failed"] == 1
+    assert summary["success"] == 1
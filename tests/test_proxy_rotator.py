@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from crawler_coupang_review import ProxyRotator
+
+PROXIES = ["10.0.0.1:8000", "10.0.0.2:8000", "10.0.0.3:8000"]
+
+
+@pytest.fixture
+def rotator():
+    rotator = ProxyRotator(list(PROXIES))
+    yield rotator
+    rotator.close_all_sessions()
+
+
+def test_blocked_proxy_is_not_selected(rotator):
+    rotator.mark_proxy_blocked(PROXIES[0])
+
+    assert rotator.proxy_stats[PROXIES[0]]["state"] == "open"
+    assert rotator.get_available_proxy_count() == 2
+    assert PROXIES[0] not in {rotator.get_next_proxy() for _ in range(200)}
+
+
+def test_repeated_block_report_does_not_extend_open_cooldown(rotator):
+    rotator.mark_proxy_blocked(PROXIES[0])
+    cooldown_until = rotator.proxy_stats[PROXIES[0]]["cooldown_until"]
+    rotator.mark_proxy_blocked(PROXIES[0])
+
+    assert rotator.proxy_stats[PROXIES[0]]["cooldown_until"] == cooldown_until
+    assert rotator.proxy_stats[PROXIES[0]]["cooldowns"] == 1
+
+
+def expire_cooldown(rotator, proxy):
+    rotator.proxy_stats[proxy]["cooldown_until"] = 0.0
+
+
+def test_breaker_opens_after_consecutive_failures(rotator):
+    for _ in range(rotator.max_failures_per_proxy - 1):
+        rotator.mark_proxy_failed(PROXIES[0])
+    assert rotator.proxy_stats[PROXIES[0]]["state"] == "closed"
+
+    rotator.mark_proxy_failed(PROXIES[0])
+    assert rotator.proxy_stats[PROXIES[0]]["state"] == "open"
+    assert rotator.get_available_proxy_count() == 2
+
+
+def test_success_resets_consecutive_failures(rotator):
+    for _ in range(rotator.max_failures_per_proxy - 1):
+        rotator.mark_proxy_failed(PROXIES[0])
+    rotator.record_success(PROXIES[0], 0.1)
+    for _ in range(rotator.max_failures_per_proxy - 1):
+        rotator.mark_proxy_failed(PROXIES[0])
+
+    assert rotator.proxy_stats[PROXIES[0]]["state"] == "closed"
+
+
+def test_expired_cooldown_allows_a_single_probe(rotator):
+    rotator.mark_proxy_blocked(PROXIES[0])
+    expire_cooldown(rotator, PROXIES[0])
+
+    assert rotator.get_available_proxy_count() == 3
+    assert rotator.proxy_stats[PROXIES[0]]["state"] == "half_open"
+    assert rotator.get_next_proxy(exclude=set(PROXIES[1:])) == PROXIES[0]
+    # 시험 요청 결과가 나오기 전에는 다른 요청에 선택하지 않음
+    assert PROXIES[0] not in {rotator.get_next_proxy() for _ in range(200)}
+
+
+def test_successful_probe_closes_breaker(rotator):
+    rotator.mark_proxy_blocked(PROXIES[0])
+    expire_cooldown(rotator, PROXIES[0])
+    rotator.get_next_proxy(exclude=set(PROXIES[1:]))
+    rotator.record_success(PROXIES[0], 0.1)
+
+    stats = rotator.proxy_stats[PROXIES[0]]
+    assert stats["state"] == "closed"
+    assert stats["cooldowns"] == 0
+    assert PROXIES[0] in {rotator.get_next_proxy() for _ in range(200)}
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(rotator):
+    rotator.mark_proxy_blocked(PROXIES[0])
+    first_cooldown = rotator.proxy_stats[PROXIES[0]]["cooldown_until"] - time.time()
+    expire_cooldown(rotator, PROXIES[0])
+    rotator.get_next_proxy(exclude=set(PROXIES[1:]))
+    rotator.mark_proxy_failed(PROXIES[0])
+
+    stats = rotator.proxy_stats[PROXIES[0]]
+    assert stats["state"] == "open"
+    assert stats["cooldown_until"] - time.time() == pytest.approx(2 * first_cooldown, abs=1.0)
+
+
+def test_cooldown_is_capped(rotator):
+    rotator.max_cooldown = 100.0
+    for _ in range(10):
+        rotator.mark_proxy_blocked(PROXIES[0])
+        expire_cooldown(rotator, PROXIES[0])
+        rotator.get_available_proxy_count()
+
+    rotator.mark_proxy_blocked(PROXIES[0])
+    assert rotator.proxy_stats[PROXIES[0]]["cooldown_until"] - time.time() <= rotator.max_cooldown
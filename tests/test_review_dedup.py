@@ -0,0 +1,72 @@
+import pytest
+
+from crawler_coupang_review import CrawlCheckpoint, ReviewDeduplicator
+
+
+def make_review(**overrides):
+    review = {
+        "user_name": "구매자", "review_date": "2025.05.01", "rating": 5,
+        "headline": "", "review_content": "좋아요",
+    }
+    review.update(overrides)
+    return review
+
+
+def test_dedup_filter_survives_reopen(tmp_path):
+    path = str(tmp_path / "review_dedup.bloom")
+    dedup = ReviewDeduplicator(path, capacity=1000)
+    assert dedup.filter_new("1", [make_review(), make_review()]) == [make_review()]
+    dedup.save()
+
+    reopened = ReviewDeduplicator(path, capacity=1000)
+    assert reopened.filter_new("1", [make_review(), make_review(rating=1)]) == [make_review(rating=1)]
+
+
+def test_dedup_filter_rebuilds_old_format(tmp_path):
+    # 다른 키로 기록한 이전 형식 필터는 새 키와 섞지 않고 새로 만듦
+    path = tmp_path / "review_dedup.bloom"
+    dedup = ReviewDeduplicator(str(path), capacity=1000)
+    dedup.add("1", make_review())
+    dedup.save()
+    path.write_bytes(b"CPRVBF02" + path.read_bytes()[len(ReviewDeduplicator.MAGIC):])
+
+    reopened = ReviewDeduplicator(str(path), capacity=1000)
+    assert reopened.count == 0
+    assert reopened.add("1", make_review())
+
+
+def test_digest_follows_checkpoint_review_key(monkeypatch):
+    assert ReviewDeduplicator.make_digest("1", make_review()) != ReviewDeduplicator.make_digest("1", make_review(rating=1))
+    # 체크포인트가 같은 리뷰로 보는 리뷰는 필터도 같은 리뷰로 봄
+    monkeypatch.setattr(CrawlCheckpoint, "make_review_key", staticmethod(lambda prod_code, review: "same"))
+    assert ReviewDeduplicator.make_digest("1", make_review()) == ReviewDeduplicator.make_digest("2", make_review(rating=1))
+
+
+@pytest.mark.parametrize("field, value", [
+    ("review_content", "별로예요"),
+    ("rating", 1),
+    ("headline", "제목"),
+    ("user_name", "다른 구매자"),
+    ("review_date", "2025.05.02"),
+])
+def test_filter_keeps_distinct_reviews(tmp_path, field, value):
+    dedup = ReviewDeduplicator(str(tmp_path / "review_dedup.bloom"), capacity=1000)
+    reviews = [make_review(), make_review(**{field: value})]
+    assert dedup.filter_new("1", reviews) == reviews
+    assert dedup.filter_new("1", reviews) == []
+    # 리뷰 키는 상품별
+    assert dedup.filter_new("2", reviews) == reviews
+
+
+def test_filter_without_file_path_does_not_save(tmp_path):
+    dedup = ReviewDeduplicator(None, capacity=1000)
+    dedup.add("1", make_review())
+    dedup.save()
+    assert dedup.dirty
+
+
+def test_sizes_bit_array_for_capacity_and_error_rate(tmp_path):
+    dedup = ReviewDeduplicator(str(tmp_path / "review_dedup.bloom"), capacity=10_000, error_rate=1e-6)
+    # m = -n ln p / (ln 2)^2, k = m / n ln 2
+    assert dedup.num_bits == pytest.approx(287_552, rel=0.001)
+    assert dedup.num_hashes == 20
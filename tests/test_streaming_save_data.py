@@ -0,0 +1,107 @@
+import json
+import time
+
+import pytest
+from openpyxl import load_workbook
+
+from crawler_coupang_review import SaveData, StreamingSaveData
+
+
+def make_row(idx, title="상품"):
+    return {
+        "title": title, "prod_name": "상품 옵션", "review_date": "2025.05.01", "user_name": f"구매자 {idx}",
+        "rating": 5, "headline": "", "review_content": f"리뷰 {idx}", "helpful_count": 0, "image_count": idx,
+    }
+
+
+@pytest.fixture
+def make_sink(tmp_path):
+    sinks = []
+
+    def create(**kwargs):
+        kwargs.setdefault("flush_interval", 0)
+        kwargs.setdefault("export_xlsx", False)
+        sink = StreamingSaveData(dir_name=str(tmp_path), **kwargs)
+        sinks.append(sink)
+        return sink
+
+    yield create
+    for sink in sinks:
+        sink.close()
+
+
+def read_rows(tmp_path, extension="csv"):
+    return list(StreamingSaveData.read_stream_file(str(tmp_path / f"상품.{extension}")))
+
+
+def test_rows_are_written_per_batch(make_sink, tmp_path):
+    sink = make_sink(batch_size=3)
+    for idx in range(2):
+        sink.save(make_row(idx))
+    assert not (tmp_path / "상품.csv").exists()
+
+    sink.save(make_row(2))
+    assert [row[3] for row in read_rows(tmp_path)] == ["구매자 0", "구매자 1", "구매자 2"]
+    assert sink.row_count == 3
+
+
+def test_crash_loses_at_most_the_unflushed_batch(make_sink, tmp_path):
+    sink = make_sink(batch_size=3)
+    for idx in range(5):
+        sink.save(make_row(idx))
+
+    # close() 전에 프로세스가 죽어도 이미 기록한 배치는 디스크에 남아 있음
+    assert len(read_rows(tmp_path)) == 3
+
+
+def test_flush_interval_writes_partial_batch(make_sink, tmp_path):
+    sink = make_sink(batch_size=100, flush_interval=0.05)
+    sink.save(make_row(0))
+
+    deadline = time.time() + 2
+    while not read_rows(tmp_path) and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(read_rows(tmp_path)) == 1
+
+
+def test_csv_header_is_written_once_when_appending(make_sink, tmp_path):
+    for idx in range(2):
+        sink = make_sink(batch_size=1)
+        sink.save(make_row(idx))
+        sink.close()
+
+    with open(tmp_path / "상품.csv", encoding="utf-8-sig") as f:
+        lines = f.read().splitlines()
+    assert lines[0] == ",".join(SaveData.HEADERS)
+    assert len(lines) == 3
+    # 숫자 컬럼은 읽을 때 복원
+    assert [row[8] for row in read_rows(tmp_path)] == [0, 1]
+
+
+def test_jsonl_skips_truncated_last_line(make_sink, tmp_path):
+    sink = make_sink(sink_format="jsonl", batch_size=1)
+    sink.save(make_row(0))
+    sink.close()
+    with open(tmp_path / "상품.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(make_row(1), ensure_ascii=False)[:20])
+
+    rows = read_rows(tmp_path, "jsonl")
+    assert rows == [[make_row(0)[field] for field in SaveData.FIELDS]]
+
+
+def test_export_stream_file_to_xlsx(make_sink, tmp_path):
+    sink = make_sink(batch_size=10)
+    for idx in range(3):
+        sink.save(make_row(idx))
+    sink.close()
+
+    xlsx_name = StreamingSaveData.export_stream_file(sink.file_name)
+    ws = load_workbook(xlsx_name).active
+    rows = list(ws.iter_rows(values_only=True))
+    assert list(rows[0]) == SaveData.HEADERS
+    assert [row[3] for row in rows[1:]] == ["구매자 0", "구매자 1", "구매자 2"]
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        StreamingSaveData(sink_format="xlsx", dir_name=str(tmp_path))
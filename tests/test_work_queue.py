@@ -0,0 +1,144 @@
+import pytest
+
+from crawler_coupang_review import CrawlWorkQueue
+
+PRODUCTS = [
+    {"url": "https://www.coupang.com/vp/products/111?itemId=1#sdpReview", "name": "상품 1"},
+    {"url": "https://www.coupang.com/vp/products/222?itemId=2", "name": "상품 2"},
+]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = CrawlWorkQueue(str(tmp_path / "crawl_queue.sqlite3"), owner="test")
+    yield queue
+    queue.close()
+
+
+def drain(queue):
+    tasks = []
+    while (task := queue.acquire()) is not None:
+        tasks.append(task)
+    return tasks
+
+
+def test_seed_splits_products_into_page_ranges(queue):
+    assert queue.seed(PRODUCTS, max_pages=25, pages_per_task=10) == 6
+    tasks = drain(queue)
+
+    assert [(task["product_code"], task["start_page"], task["end_page"]) for task in tasks] == [
+        ("111", 1, 10), ("222", 1, 10), ("111", 11, 20), ("222", 11, 20), ("111", 21, 25), ("222", 21, 25),
+    ]
+    assert tasks[0]["url"] == "https://www.coupang.com/vp/products/111?itemId=1"
+    assert tasks[0]["name"] == "상품 1"
+    assert tasks[0]["attempt"] == 1
+    assert queue.get_counts()["leased"] == 6
+
+
+def test_seed_is_idempotent(queue):
+    queue.seed(PRODUCTS, max_pages=25, pages_per_task=10)
+    assert queue.seed(PRODUCTS, max_pages=25, pages_per_task=10) == 0
+    assert queue.get_counts()["pending"] == 6
+
+
+def test_seed_uses_plan_pages(queue):
+    queue.seed(PRODUCTS, max_pages=100, pages_per_task=10,
+               plan_pages=lambda product: 5 if product["name"] == "상품 1" else None)
+    assert [(task["product_code"], task["end_page"]) for task in drain(queue)][:3] == [
+        ("111", 5), ("222", 10), ("222", 20),
+    ]
+
+
+def test_acquire_returns_none_without_tasks(queue):
+    assert queue.acquire() is None
+
+
+def test_acquire_adds_worker_name_to_owner(queue):
+    queue.seed(PRODUCTS[:1], max_pages=10)
+    assert queue.acquire("worker-1")["owner"] == "test:worker-1"
+
+
+def test_expired_lease_is_acquired_again(tmp_path):
+    queue = CrawlWorkQueue(str(tmp_path / "crawl_queue.sqlite3"), lease_seconds=-1, max_attempts=2, owner="test")
+    try:
+        queue.seed(PRODUCTS[:1], max_pages=10)
+        assert queue.acquire()["attempt"] == 1
+        assert queue.acquire()["attempt"] == 2
+        # 시도 횟수를 다 쓴 뒤 임대가 만료되면 실패 처리
+        assert queue.acquire() is None
+        assert queue.get_counts()["failed"] == 1
+    finally:
+        queue.close()
+
+
+def test_fail_requeues_until_max_attempts(tmp_path):
+    queue = CrawlWorkQueue(str(tmp_path / "crawl_queue.sqlite3"), max_attempts=2, owner="test")
+    try:
+        queue.seed(PRODUCTS[:1], max_pages=10)
+        queue.fail(queue.acquire())
+        assert queue.get_counts()["pending"] == 1
+        queue.fail(queue.acquire())
+        assert queue.get_counts()["failed"] == 1
+        assert queue.acquire() is None
+    finally:
+        queue.close()
+
+
+def test_release_does_not_use_an_attempt(queue):
+    queue.seed(PRODUCTS[:1], max_pages=10)
+    queue.release(queue.acquire())
+    assert queue.acquire()["attempt"] == 1
+
+
+def test_complete_skips_ranges_after_end_of_reviews(queue):
+    queue.seed(PRODUCTS[:1], max_pages=40, pages_per_task=10)
+    first, second = queue.acquire(), queue.acquire()
+    queue.complete(first, empty_from_page=8)
+
+    assert queue.get_counts()["skipped"] == 3
+    assert queue.acquire() is None
+    # 이미 건너뛴 구간을 늦게 완료해도 done으로 바꾸지 않음
+    queue.complete(second)
+    assert queue.get_counts() == {"pending": 0, "leased": 0, "done": 1, "skipped": 3, "failed": 0}
+
+
+def test_acquire_skips_ranges_after_end_of_reviews_found_by_another_queue(tmp_path):
+    path = str(tmp_path / "crawl_queue.sqlite3")
+    first_queue, second_queue = CrawlWorkQueue(path, owner="a"), CrawlWorkQueue(path, owner="b")
+    try:
+        first_queue.seed(PRODUCTS[:1], max_pages=30, pages_per_task=10)
+        task = first_queue.acquire()
+        assert second_queue.acquire()["start_page"] == 11
+        first_queue.complete(task, empty_from_page=5)
+        assert second_queue.acquire() is None
+    finally:
+        first_queue.close()
+        second_queue.close()
+
+
+def test_complete_returns_output_files_once_after_last_range(queue):
+    queue.seed(PRODUCTS[:1], max_pages=20, pages_per_task=10)
+    first, second = queue.acquire(), queue.acquire()
+
+    assert queue.complete(first, output_file="b.csv") == []
+    assert queue.complete(second, output_file="a.csv") == ["a.csv", "b.csv"]
+    assert queue.complete(second, output_file="a.csv") == []
+
+
+def test_failed_last_range_still_finishes_product(tmp_path):
+    queue = CrawlWorkQueue(str(tmp_path / "crawl_queue.sqlite3"), max_attempts=1, owner="test")
+    try:
+        queue.seed(PRODUCTS[:1], max_pages=20, pages_per_task=10)
+        first, second = queue.acquire(), queue.acquire()
+        assert queue.complete(first, output_file="a.csv") == []
+        assert queue.fail(second) == ["a.csv"]
+    finally:
+        queue.close()
+
+
+def test_reseeding_finished_product_allows_new_export(queue):
+    queue.seed(PRODUCTS[:1], max_pages=10, pages_per_task=10)
+    assert queue.complete(queue.acquire(), output_file="a.csv") == ["a.csv"]
+
+    queue.seed(PRODUCTS[:1], max_pages=20, pages_per_task=10)
+    assert queue.complete(queue.acquire(), output_file="a.csv") == ["a.csv"]